@@ -0,0 +1,141 @@
+"""
+Mesure des temps d'exécution des méthodes d'AnalyseurJeu sur des jeux
+aléatoires (core.utils.generer_jeu_aleatoire) pour une grille de nombres de
+joueurs et de stratégies.
+
+    python benchmarks/bench_analyse.py --sortie resultats.json
+    python benchmarks/bench_analyse.py --baseline benchmarks/reference.json --seuil 0.2
+
+Avec --baseline, chaque mesure est comparée à la référence : le script se
+termine avec le code 1 si une mesure est plus lente de plus de `seuil`
+(fraction) que la référence. benchmarks/reference.json contient les mesures de
+la grille par défaut (machine et versions dans "plateforme") ; à régénérer
+avec --sortie sur la machine de comparaison.
+
+Chaque répétition utilise un nouvel AnalyseurJeu (construit hors chronomètre),
+pour ne pas mesurer les tables et résultats mis en cache par la précédente.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.algorithems import AnalyseurJeu
+from core.modeles import Jeu
+from core.utils import generer_jeu_aleatoire, TYPES_JEUX_ALEATOIRES
+
+# En dessous de ce temps (secondes), les écarts relatifs ne sont que du bruit
+_TEMPS_MINIMAL = 1e-3
+
+
+def _methodes(jeu: Jeu) -> Dict[str, Callable[[AnalyseurJeu], object]]:
+    ids = [j.id for j in jeu.joueurs]
+    autres = tuple(0 for _ in ids[1:])
+    return {
+        "equilibre_nash": lambda a: a.equilibre_nash(),
+        "optimum_pareto": lambda a: a.optimum_pareto(),
+        "strategies_dominantes": lambda a: [a.strategies_dominantes(i) for i in ids],
+        "elimination_strategies_dominantes": lambda a: a.elimination_strategies_dominantes(),
+        "equilibre_iteratif_dominance_stricte": lambda a: a.equilibre_iteratif_dominance_stricte(),
+        "niveau_securite": lambda a: [a.niveau_securite(i) for i in ids],
+        # Construction de la table des meilleures réponses comprise
+        "meilleure_reponse": lambda a: a.meilleure_reponse(ids[0], autres),
+    }
+
+
+def chronometrer(fonction: Callable[[AnalyseurJeu], object], jeu: Jeu, repetitions: int) -> float:
+    """Meilleur temps (secondes) sur `repetitions` appels, chacun sur un nouvel analyseur"""
+    meilleur = float("inf")
+    for _ in range(repetitions):
+        analyseur = AnalyseurJeu(jeu)
+        debut = time.perf_counter()
+        fonction(analyseur)
+        meilleur = min(meilleur, time.perf_counter() - debut)
+    return meilleur
+
+
+def executer(joueurs: List[int], strategies: List[int], types: List[str],
+             repetitions: int, graine: int) -> List[Dict]:
+    resultats = []
+    for n in joueurs:
+        for s in strategies:
+            for type_jeu in types:
+                jeu = generer_jeu_aleatoire([s] * n, type_jeu, graine=graine, correlation=0.5)
+                for nom, fonction in _methodes(jeu).items():
+                    temps = chronometrer(fonction, jeu, repetitions)
+                    resultats.append({
+                        "methode": nom, "type": type_jeu, "joueurs": n,
+                        "strategies": s, "temps": temps,
+                    })
+                    print(f"{nom:<38} {type_jeu:<13} n={n} s={s:<4} {temps * 1e3:10.3f} ms", file=sys.stderr)
+    return resultats
+
+
+def _cle(resultat: Dict) -> tuple:
+    return (resultat["methode"], resultat["type"], resultat["joueurs"], resultat["strategies"])
+
+
+def comparer(resultats: List[Dict], reference: List[Dict], seuil: float) -> List[Dict]:
+    """Mesures plus lentes que la référence de plus de `seuil` (en fraction)"""
+    temps_reference = {_cle(r): r["temps"] for r in reference}
+    regressions = []
+    for r in resultats:
+        ancien = temps_reference.get(_cle(r))
+        if ancien is None:
+            continue
+        r["reference"] = ancien
+        r["rapport"] = r["temps"] / ancien if ancien > 0 else float("inf")
+        if max(r["temps"], ancien) >= _TEMPS_MINIMAL and r["rapport"] > 1 + seuil:
+            regressions.append(r)
+    return regressions
+
+
+def main(arguments: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--joueurs", type=int, nargs="+", default=[2, 3, 4])
+    parser.add_argument("--strategies", type=int, nargs="+", default=[2, 5, 10])
+    parser.add_argument("--types", nargs="+", default=list(TYPES_JEUX_ALEATOIRES), choices=TYPES_JEUX_ALEATOIRES)
+    parser.add_argument("--repetitions", type=int, default=5)
+    parser.add_argument("--graine", type=int, default=0)
+    parser.add_argument("--sortie", help="fichier JSON des résultats (sortie standard par défaut)")
+    parser.add_argument("--baseline", help="fichier JSON de référence à comparer")
+    parser.add_argument("--seuil", type=float, default=0.25,
+                        help="ralentissement relatif toléré avant de signaler une régression")
+    args = parser.parse_args(arguments)
+
+    rapport = {
+        "plateforme": {"python": platform.python_version(), "numpy": np.__version__, "machine": platform.machine()},
+        "parametres": {"repetitions": args.repetitions, "graine": args.graine},
+        "resultats": executer(args.joueurs, args.strategies, args.types, args.repetitions, args.graine),
+    }
+
+    code = 0
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            reference = json.load(f)["resultats"]
+        regressions = comparer(rapport["resultats"], reference, args.seuil)
+        rapport["regressions"] = regressions
+        for r in regressions:
+            print(f"RÉGRESSION {r['methode']} {r['type']} n={r['joueurs']} s={r['strategies']}: "
+                  f"{r['reference'] * 1e3:.3f} ms -> {r['temps'] * 1e3:.3f} ms (x{r['rapport']:.2f})",
+                  file=sys.stderr)
+        code = 1 if regressions else 0
+
+    texte = json.dumps(rapport, indent=2, ensure_ascii=False)
+    if args.sortie:
+        with open(args.sortie, "w", encoding="utf-8") as f:
+            f.write(texte)
+    else:
+        print(texte)
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
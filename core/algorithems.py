@@ -1,252 +1,445 @@
 import numpy as np
-from typing import List, Dict, Tuple, Optional, Set
-from .modeles import Jeu
-from itertools import product
+from typing import Callable, List, Dict, Iterator, Tuple, Optional, Set
+from .modeles import Jeu, Joueur
+from .pareto import frontiere_pareto, iter_frontiere_pareto
+from .dominance import MoteurDominanceMixte, MoteurIESDS, _programmes_dominance, _tranches
+from .mixte import enumeration_supports, lemke_howson
+from .parallele import equilibre_nash_parallele, optimum_pareto_parallele
+from .instrumentation import Instrumentation, instrumente
+from .reponses import TableMeilleuresReponses
+from .apprentissage import MoteurApprentissage
+from .correle import equilibre_correle
+from .potentiel import chemins_amelioration, detecter_potentiel, maxima_potentiel
+from .securite import minima_par_strategie, niveaux_securite_mixtes
+from itertools import islice, product
+from math import comb
+
+# Au-delà de ce nombre de paires de supports, on passe à Lemke-Howson
+_MAX_SUPPORTS = 20000
+# Cellules d'un joueur lues à la fois lors d'un parcours par blocs
+_CELLULES_PAR_BLOC = 1 << 22
+
+def _masque_nash(gains: List[np.ndarray], epsilon: float = 0.0, decalage: int = 0) -> np.ndarray:
+    """
+    Masque booléen des profils où chaque joueur joue une meilleure réponse.
+    gains[i] est le tenseur du joueur i, dont l'axe i + decalage porte ses
+    stratégies (decalage = 1 pour un lot de jeux empilés sur le premier axe).
+    """
+    masque = np.ones(gains[0].shape, dtype=bool)
+    tampon = np.empty(gains[0].shape, dtype=bool)
+    for axe, g in enumerate(gains):
+        # Une seule réduction par joueur : le max le long de son propre axe
+        meilleur = np.max(g, axis=axe + decalage, keepdims=True)
+        if epsilon:
+            meilleur = meilleur - epsilon
+        np.greater_equal(g, meilleur, out=tampon)
+        masque &= tampon
+    return masque
+
+
+def _iter_masque_nash(tenseur: np.ndarray, epsilon: float, lignes: int) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Masque de Nash par blocs de `lignes` stratégies du premier joueur, pour
+    les tenseurs (n_joueurs, *forme) trop grands pour être réduits d'un coup
+    (np.memmap). Un premier passage accumule le max du premier joueur le long
+    de son axe ; chaque bloc contient ensuite des axes complets pour tous les
+    autres joueurs. Produit des couples (première ligne du bloc, masque du bloc).
+    """
+    n_lignes = tenseur.shape[1]
+    meilleur_0 = None
+    for debut in range(0, n_lignes, lignes):
+        bloc_max = np.max(tenseur[0, debut:debut + lignes], axis=0, keepdims=True)
+        meilleur_0 = bloc_max if meilleur_0 is None else np.maximum(meilleur_0, bloc_max)
+    if epsilon:
+        meilleur_0 = meilleur_0 - epsilon
+
+    for debut in range(0, n_lignes, lignes):
+        masque = tenseur[0, debut:debut + lignes] >= meilleur_0
+        for axe in range(1, len(tenseur)):
+            g = np.asarray(tenseur[axe, debut:debut + lignes])
+            meilleur = np.max(g, axis=axe, keepdims=True)
+            if epsilon:
+                meilleur = meilleur - epsilon
+            masque &= g >= meilleur
+        yield debut, masque
+
+
+def _lignes_par_bloc(tenseur: np.ndarray) -> int:
+    """Nombre de stratégies du premier joueur par bloc pour ~_CELLULES_PAR_BLOC cellules"""
+    cellules_par_ligne = max(1, tenseur[0, 0].size)
+    return max(1, _CELLULES_PAR_BLOC // cellules_par_ligne)
+
 
 class AnalyseurJeu:
-    def __init__(self, jeu: Jeu):
+    def __init__(self, jeu: Jeu, instrumentation: Optional[Instrumentation] = None):
         self.jeu = jeu
+        self.instrumentation = instrumentation
+        # Table des meilleures réponses et empreinte du jeu à sa construction
+        self._table_reponses: Optional[TableMeilleuresReponses] = None
+        self._empreinte_table: Optional[tuple] = None
+        # (empreinte du jeu, tolérance, résultat de detecter_potentiel) du dernier test
+        self._potentiel: Optional[Tuple[tuple, float, Optional[Dict[str, object]]]] = None
+
+    def _compter(self, profils: int = 0, lectures: int = 0, comparaisons: int = 0):
+        """Compteurs de la mesure en cours, si l'instrumentation est active"""
+        if self.instrumentation is not None:
+            self.instrumentation.ajouter(profils, lectures, comparaisons)
+
+    def _n_profils(self) -> int:
+        return int(np.prod(self.jeu.forme, dtype=np.int64))
         
-    def strategies_dominantes(self, id_joueur: int) -> Dict[str, List[int]]:
+    @instrumente
+    def strategies_dominantes(self, id_joueur: int,
+                              progression: Optional[Callable[[float], None]] = None) -> Dict[str, List[int]]:
         """
-        Retourne les stratégies strictement et faiblement dominantes.
+        Retourne les stratégies strictement et faiblement dominantes
+        (`progression` est appelé entre les deux types).
         """
         strict = self._strategies_dominantes_type(id_joueur, faiblement=False)
+        if progression is not None:
+            progression(0.5)
         weak = self._strategies_dominantes_type(id_joueur, faiblement=True)
+        # Pour chaque type : un maximum le long de l'axe du joueur puis une comparaison par profil
+        self._compter(self._n_profils(), 4 * self._n_profils(), 4 * self._n_profils())
         return {
             "strict": strict,
             "weak": weak
         }
 
     def _strategies_dominantes_type(self, id_joueur: int, faiblement: bool) -> List[int]:
-        player_idx = id_joueur - 1
+        """
+        Stratégies au moins aussi bonnes (faiblement) ou strictement meilleures
+        que chacune des autres, sur tous les profils adverses : une stratégie
+        faiblement dominante atteint le maximum de son axe partout, une
+        stratégie strictement dominante est en plus seule à l'atteindre.
+        """
+        axe = self._axe_joueur(id_joueur)
         gains = self.jeu.gains[id_joueur]
-        n_strategies = len(self.jeu.joueurs[player_idx].strategies)
-        dominantes = []
-    
-        for strat in range(n_strategies):
-            dominates_all_others = True
-            
-            for other in range(n_strategies):
-                if strat == other:
-                    continue
-                    
-                # Vérifie si 'strat' domine 'other'
-                dominates_current = True
-                others = [list(range(len(j.strategies))) for j in self.jeu.joueurs if j.id != id_joueur]
-                
-                for combi in product(*others):
-                    if id_joueur == 1:
-                        strat_payoff = gains[(strat,) + combi]
-                        other_payoff = gains[(other,) + combi]
-                    else:
-                        strat_payoff = gains[combi + (strat,)]
-                        other_payoff = gains[combi + (other,)]
-    
-                    # Condition de domination
-                    if not faiblement:
-                        # Domination stricte: strat doit être strictement meilleure partout
-                        if strat_payoff <= other_payoff:
-                            dominates_current = False
-                            break
-                    else:
-                        # Domination faible: strat doit être au moins égale partout et strictement meilleure quelque part
-                        if strat_payoff < other_payoff:
-                            dominates_current = False
-                            break
-                
-                if not dominates_current:
-                    dominates_all_others = False
-                    break
-                    
-            if dominates_all_others:
-                dominantes.append(strat)
-    
-        return dominantes
+        autres = tuple(a for a in range(gains.ndim) if a != axe)
+        au_max = gains == gains.max(axis=axe, keepdims=True)
+        if not faiblement:
+            au_max &= au_max.sum(axis=axe, keepdims=True) == 1
+        return np.flatnonzero(au_max.all(axis=autres) if autres else au_max).tolist()
 
+    def _axe_joueur(self, id_joueur: int) -> int:
+        """Axe du joueur dans les tenseurs de gains"""
+        for axe, j in enumerate(self.jeu.joueurs):
+            if j.id == id_joueur:
+                return axe
+        raise ValueError("Joueur non trouvé")
 
-    
-    def est_strictement_dominee(self, id_joueur: int, strat: int, strategies_actives: Dict[int, List[int]]) -> bool:
+    @instrumente
+    def est_strictement_dominee(self, id_joueur: int, strat: int, strategies_actives: Dict[int, List[int]],
+                                par_melange: bool = False) -> bool:
         """
-        Vérifie si une stratégie est strictement dominée.
+        Vérifie si une stratégie est strictement dominée par une autre
+        stratégie active, pure ou, si `par_melange`, mixte (programme
+        linéaire ; nécessite scipy).
         """
-        gains = self.jeu.gains[id_joueur]
-        player_idx = id_joueur - 1
-        n_strategies = len(self.jeu.joueurs[player_idx].strategies)
-        
-        for other in strategies_actives[id_joueur]:
-            if other == strat:
-                continue
-                
-            is_dominated = True
-            others = [strategies_actives[j.id] for j in self.jeu.joueurs if j.id != id_joueur]
-            
-            for combi in product(*others):
-                if id_joueur == 1:
-                    strat_payoff = gains[(strat,) + combi]
-                    other_payoff = gains[(other,) + combi]
-                else:
-                    strat_payoff = gains[combi + (strat,)]
-                    other_payoff = gains[combi + (other,)]
-                
-                if strat_payoff >= other_payoff:
-                    is_dominated = False
-                    break
-                    
-            if is_dominated:
-                return True
-                
-        return False
+        axe = self._axe_joueur(id_joueur)
+        autres = [s for s in sorted(strategies_actives[id_joueur]) if s != strat]
+        if not autres:
+            return False
+
+        actives = [np.array(sorted(strategies_actives[j.id])) for j in self.jeu.joueurs]
+        plat = _tranches(self.jeu.gains[id_joueur], axe, np.array([strat] + autres), actives)
+        self._compter(plat.shape[1], plat.size, plat.size - plat.shape[1])
+        if np.any(np.all(plat[1:] > plat[0], axis=1)):
+            return True
+        if not par_melange:
+            return False
+        return bool(_programmes_dominance(np.asarray(plat, dtype=np.float64), np.zeros(1, dtype=np.intp),
+                                          False, 1e-9)[0])
     
+    @instrumente
     def elimination_strategies_dominantes(self, strict: bool = True) -> List[Tuple[int, ...]]:
         """
         Élimination itérée des stratégies dominées.
         """
-        # Initialize active strategies (convert to 1-based IDs)
-        strategies_actives = {
-            joueur.id: list(range(len(joueur.strategies)))
-            for joueur in self.jeu.joueurs
-        }
-        
-        changed = True
-        while changed:
-            changed = False
-            
-            for joueur in self.jeu.joueurs:
-                to_remove = []
-                for strat in strategies_actives[joueur.id]:
-                    if self.est_strictement_dominee(joueur.id, strat, strategies_actives):
-                        to_remove.append(strat)
-                        changed = True
-                
-                if to_remove:
-                    strategies_actives[joueur.id] = [
-                        s for s in strategies_actives[joueur.id] 
-                        if s not in to_remove
-                    ]
-        
-        # Generate remaining strategy profiles
-        return list(product(*[
-            strategies_actives[joueur.id] 
-            for joueur in sorted(self.jeu.joueurs, key=lambda x: x.id)
-        ]))
+        return list(self.iter_elimination_strategies_dominantes())
     
-    def equilibre_iteratif_dominance_stricte(self) -> Tuple[List[Tuple[int]], List[str]]:
+    @instrumente
+    def iter_elimination_strategies_dominantes(self, limite: Optional[int] = None) -> Iterator[Tuple[int, ...]]:
+        """
+        Profils restants après élimination itérée, produits un à un
+        (au plus `limite`) sans construire leur liste.
+        """
+        moteur = MoteurIESDS(list(self.jeu.tenseur))
+        moteur.executer()
+        self._compter(self._n_profils(), moteur.lectures, moteur.comparaisons)
+        return islice(product(*[act.tolist() for act in moteur.actives]), limite)
+    
+    @instrumente
+    def equilibre_iteratif_dominance_stricte(
+            self, progression: Optional[Callable[[float], None]] = None) -> Tuple[List[Tuple[int]], List[str]]:
         """
         Retourne les profils restants et le chemin d'élimination (sous forme de texte lisible).
+        `progression` est appelé avant chaque élimination.
         """
         joueurs = self.jeu.joueurs
-        gains = self.jeu.gains
-        strategies_actives = {j.id: set(range(len(j.strategies))) for j in joueurs}
+        moteur = MoteurIESDS(list(self.jeu.tenseur))
         
-        chemin_elimination = []
-        modification = True
-        
-        while modification:
-            modification = False
-            for joueur in joueurs:
-                id_j = joueur.id
-                actives = list(strategies_actives[id_j])
-                for strat in actives:
-                    if self.est_strictement_dominee(id_j, strat, strategies_actives):
-                        strategies_actives[id_j].remove(strat)
-                        chemin_elimination.append(f"Joueur {id_j} : stratégie éliminée -> {joueur.strategies[strat]}")
-                        modification = True
-                        break  # recommencer l'itération si on a supprimé une stratégie
-                if modification:
-                    break
+        chemin_elimination = [
+            f"Joueur {joueurs[i].id} : stratégie éliminée -> {joueurs[i].strategies[strat]}"
+            for i, strat in moteur.executer(progression)
+        ]
+        self._compter(self._n_profils(), moteur.lectures, moteur.comparaisons)
 
         # Générer tous les profils restants
-        restants = list(product(*[list(strategies_actives[j.id]) for j in joueurs]))
+        restants = list(product(*[act.tolist() for act in moteur.actives]))
         return restants, chemin_elimination
 
-    
-    def equilibre_nash(self) -> List[Tuple[int, ...]]:
-        """N-player Nash equilibrium"""
-        shapes = [len(j.strategies) for j in self.jeu.joueurs]
-        equilibres = []
+    @instrumente
+    def elimination_dominance_mixte(self, faiblement: bool = False, ordre: str = "simultane", tolerance: float = 1e-9,
+                                    progression: Optional[Callable[[float], None]] = None) -> Dict[str, object]:
+        """
+        Élimination itérée des stratégies dominées par des stratégies pures ou
+        mixtes, strictement ou faiblement (voir core.dominance.MoteurDominanceMixte ;
+        nécessite scipy). Retourne un dictionnaire :
+            "actives": stratégies restantes de chaque joueur (par id)
+            "eliminations": couples (id du joueur, stratégie) dans l'ordre d'élimination
+            "chemin": les mêmes éliminations sous forme de texte lisible
+            "jeu_reduit": le jeu restreint aux stratégies restantes
+            "programmes": nombre de programmes linéaires résolus
+        """
+        joueurs = self.jeu.joueurs
+        moteur = MoteurDominanceMixte(list(self.jeu.tenseur), faiblement, tolerance)
+        eliminations = moteur.executer(ordre, progression)
+        self._compter(self._n_profils(), moteur.lectures, moteur.lectures)
+
+        reduits = [Joueur(j.id, [j.strategies[s] for s in act]) for j, act in zip(joueurs, moteur.actives)]
+        tenseur = self.jeu.tenseur[np.ix_(np.arange(len(joueurs)), *moteur.actives)]
+        return {
+            "actives": {j.id: act.tolist() for j, act in zip(joueurs, moteur.actives)},
+            "eliminations": [(joueurs[i].id, strat) for i, strat in eliminations],
+            "chemin": [f"Joueur {joueurs[i].id} : stratégie éliminée -> {joueurs[i].strategies[strat]}"
+                       for i, strat in eliminations],
+            "jeu_reduit": Jeu.depuis_tenseur(reduits, tenseur),
+            "programmes": moteur.programmes,
+        }
+
+    @instrumente
+    def equilibre_nash(self, epsilon: float = 0.0, taille_bloc: Optional[int] = None,
+                       n_processus: Optional[int] = None,
+                       progression: Optional[Callable[[float], None]] = None) -> List[Tuple[int, ...]]:
+        """
+        Équilibres de Nash en stratégies pures (N joueurs).
+        Un profil est retenu si aucune déviation unilatérale n'améliore
+        le gain de plus de `epsilon`. Avec `taille_bloc` (nombre de stratégies
+        du premier joueur par bloc), le tenseur est parcouru par blocs ; c'est
+        le mode par défaut pour un jeu chargé en np.memmap ou suivi par
+        `progression` (appelé après chaque bloc avec la fraction parcourue).
+        Avec `n_processus`, la recherche est répartie sur un pool de processus.
+        """
+        tenseur = self.jeu.tenseur
+        # Chaque cellule de chaque joueur est lue et comparée au max de sa fibre
+        self._compter(self._n_profils(), tenseur.size, tenseur.size)
+        if n_processus is not None and n_processus > 1:
+            return equilibre_nash_parallele(tenseur, epsilon, n_processus)
+        if taille_bloc is None and (isinstance(tenseur, np.memmap) or progression is not None):
+            taille_bloc = _lignes_par_bloc(tenseur)
+        if taille_bloc is None:
+            masque = _masque_nash(list(tenseur), epsilon)
+            return [tuple(int(i) for i in profil) for profil in np.argwhere(masque)]
         
-        for profil in product(*[range(s) for s in shapes]):
-            is_equilibrium = True
-            for i, joueur in enumerate(self.jeu.joueurs):
-                current_payoff = self.jeu.gains[joueur.id][profil]
-                for dev in range(shapes[i]):
-                    if dev == profil[i]:
-                        continue
-                    new_profil = list(profil)
-                    new_profil[i] = dev
-                    if self.jeu.gains[joueur.id][tuple(new_profil)] > current_payoff:
-                        is_equilibrium = False
-                        break
-                if not is_equilibrium:
-                    break
-            if is_equilibrium:
-                equilibres.append(profil)
+        equilibres = []
+        for debut, masque in _iter_masque_nash(tenseur, epsilon, taille_bloc):
+            for profil in np.argwhere(masque):
+                profil[0] += debut
+                equilibres.append(tuple(int(i) for i in profil))
+            if progression is not None:
+                progression((debut + len(masque)) / tenseur.shape[1])
         return equilibres
     
-    def optimum_pareto(self) -> List[Tuple[int, ...]]:
-        """Optimum de Pareto"""
-        shapes = [len(j.strategies) for j in self.jeu.joueurs]
-        pareto_optima = []
-        tous_profils = list(product(*[range(s) for s in shapes]))
-        
-        for profil in tous_profils:
-            est_pareto = True
-            gains_profil = [self.jeu.gains[j.id][profil] for j in self.jeu.joueurs]
-            
-            for autre in tous_profils:
-                if autre == profil:
-                    continue
-                    
-                gains_autre = [self.jeu.gains[j.id][autre] for j in self.jeu.joueurs]
-                
-                if all(g >= p for g, p in zip(gains_autre, gains_profil)) and \
-                   any(g > p for g, p in zip(gains_autre, gains_profil)):
-                    est_pareto = False
-                    break
-            
-            if est_pareto:
-                pareto_optima.append(profil)
-        
-        return pareto_optima
+    def iter_equilibres_nash(self, epsilon: float = 0.0, limite: Optional[int] = None,
+                             taille_bloc: Optional[int] = None) -> Iterator[Tuple[int, ...]]:
+        """
+        Équilibres de Nash purs produits au fil du parcours par blocs, dans
+        l'ordre de equilibre_nash ; le parcours s'arrête après `limite` profils.
+        """
+        if limite is not None and limite <= 0:
+            return
+        tenseur = self.jeu.tenseur
+        lignes = taille_bloc or _lignes_par_bloc(tenseur)
+        trouves = 0
+        for debut, masque in _iter_masque_nash(tenseur, epsilon, lignes):
+            for profil in np.argwhere(masque):
+                profil[0] += debut
+                yield tuple(int(i) for i in profil)
+                trouves += 1
+                if trouves == limite:
+                    return
     
-    def niveau_securite(self, id_joueur: int) -> Tuple[float, int]:
-        """Niveau de sécurité pour un joueur"""
-        gains = self.jeu.gains[id_joueur]
-        player_idx = id_joueur - 1
-        n_strategies = len(self.jeu.joueurs[player_idx].strategies)
+    @instrumente
+    def existe_equilibre_nash(self, epsilon: float = 0.0) -> bool:
+        """Vrai dès qu'un équilibre de Nash pur est trouvé"""
+        return next(self.iter_equilibres_nash(epsilon, limite=1), None) is not None
+    
+    @instrumente
+    def nombre_equilibres_nash(self, epsilon: float = 0.0) -> int:
+        """Nombre d'équilibres de Nash purs, sans construire les profils"""
+        lignes = _lignes_par_bloc(self.jeu.tenseur)
+        self._compter(self._n_profils(), self.jeu.tenseur.size, self.jeu.tenseur.size)
+        return sum(int(np.count_nonzero(masque)) for _, masque in _iter_masque_nash(self.jeu.tenseur, epsilon, lignes))
+    
+    @instrumente
+    def equilibres_mixtes(self, methode: str = "auto", etiquette_initiale: Optional[int] = None,
+                          progression: Optional[Callable[[float], None]] = None) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Équilibres de Nash en stratégies mixtes d'un jeu à 2 joueurs.
+        methode: "supports" (tous les équilibres, petits jeux), "lemke_howson"
+        (un équilibre, grands jeux) ou "auto". `progression` est appelé au fil
+        de la recherche (point d'annulation pour une tâche en arrière-plan).
+        """
+        if len(self.jeu.joueurs) != 2:
+            raise ValueError("Les équilibres mixtes ne sont calculés que pour 2 joueurs")
+        A = self.jeu.gains[self.jeu.joueurs[0].id]
+        B = self.jeu.gains[self.jeu.joueurs[1].id]
+        self._compter(A.size, A.size + B.size)
         
-        if id_joueur == 1:
-            min_gains = np.min(gains, axis=1)  # Minimum par ligne
+        if methode == "auto":
+            methode = "supports" if comb(sum(A.shape), A.shape[0]) <= _MAX_SUPPORTS else "lemke_howson"
+        if methode == "supports":
+            return enumeration_supports(A, B, progression=progression)
+        if methode == "lemke_howson":
+            return [lemke_howson(A, B, etiquette_initiale, progression=progression)]
+        raise ValueError(f"Méthode inconnue: {methode}")
+    
+    @instrumente
+    def equilibre_approche(self, methode: str = "jeu_fictif", departs=None, epsilon: float = 1e-3,
+                           max_iterations: int = 10000, graine: Optional[int] = None, **options) -> Dict[str, object]:
+        """
+        Équilibres mixtes approchés (écart de Nash <= epsilon) d'un jeu à N
+        joueurs, par "jeu_fictif" ou "replicateur" (voir core.apprentissage).
+        """
+        moteur = MoteurApprentissage(self.jeu)
+        if methode == "jeu_fictif":
+            resultat = moteur.jeu_fictif(departs, epsilon, max_iterations, graine)
+        elif methode == "replicateur":
+            resultat = moteur.replicateur(departs, epsilon, max_iterations, graine=graine, **options)
         else:
-            min_gains = np.min(gains, axis=0)  # Minimum par colonne
-        
-        max_min = np.max(min_gains)
-        meilleure_strat = np.argmax(min_gains)
-        
-        return (max_min, meilleure_strat)
+            raise ValueError(f"Méthode inconnue: {methode}")
+        # Chaque itération lit le tenseur de chaque joueur une fois par parcours actif
+        passages = int(resultat["trace"]["actifs"].sum())
+        self._compter(lectures=passages * self.jeu.tenseur.size)
+        return resultat
     
-    def meilleure_reponse(self, id_joueur: int, strategies_autres: Tuple[int, ...]) -> List[int]:
-        """Meilleure réponse pour un joueur"""
+    @instrumente
+    def equilibre_correle(self, grossier: bool = False, objectif: str = "bien_etre") -> Dict[str, object]:
+        """
+        Équilibre corrélé (grossièrement corrélé si `grossier`) par programmation
+        linéaire creuse, maximisant le bien-être ou simplement réalisable
+        (voir core.correle ; nécessite scipy).
+        """
+        resultat = equilibre_correle(self.jeu, grossier, objectif)
+        self._compter(self._n_profils(), self.jeu.tenseur.size, resultat["non_nuls"])
+        return resultat
+    
+    def _detecter_potentiel(self, tolerance: float) -> Optional[Dict[str, object]]:
+        empreinte = self.jeu.empreinte_courante()
+        if self._potentiel is None or self._potentiel[:2] != (empreinte, tolerance):
+            self._potentiel = (empreinte, tolerance, detecter_potentiel(self.jeu, tolerance))
+            n = self.jeu.n_joueurs
+            # Deux différences croisées par paire de joueurs, chacune lisant deux tenseurs
+            self._compter(self._n_profils(), 2 * n * (n - 1) * self._n_profils())
+        return self._potentiel[2]
+
+    @instrumente
+    def potentiel(self, tolerance: float = 1e-9) -> Optional[Dict[str, object]]:
+        """
+        Potentiel exact ou pondéré du jeu (voir core.potentiel), None si le
+        jeu n'est pas un jeu de potentiel.
+        """
+        return self._detecter_potentiel(tolerance)
+
+    @instrumente
+    def equilibres_potentiel(self, tolerance: float = 1e-9) -> List[Tuple[int, ...]]:
+        """
+        Équilibres de Nash purs maximisant le potentiel, sans énumérer les
+        déviations de chaque profil (une partie des équilibres seulement).
+        """
+        resultat = self._detecter_potentiel(tolerance)
+        if resultat is None:
+            raise ValueError("Le jeu n'admet pas de potentiel")
+        return maxima_potentiel(resultat["potentiel"], tolerance)
+
+    @instrumente
+    def chemins_amelioration(self, departs=None, max_iterations: int = 10000, graine: Optional[int] = None,
+                             tolerance: float = 1e-9) -> Dict[str, object]:
+        """
+        Chemins de meilleures réponses guidés par le potentiel jusqu'à des
+        équilibres de Nash purs (voir core.potentiel.chemins_amelioration).
+        """
+        resultat = self._detecter_potentiel(tolerance)
+        if resultat is None:
+            raise ValueError("Le jeu n'admet pas de potentiel")
+        chemins = chemins_amelioration(resultat["potentiel"], departs, max_iterations, graine, tolerance)
+        self._compter(lectures=int(chemins["longueurs"].sum() + len(chemins["longueurs"])) * sum(self.jeu.forme))
+        return chemins
+
+    @instrumente
+    def optimum_pareto(self, taille_bloc: int = 4096, n_processus: Optional[int] = None,
+                       progression: Optional[Callable[[float], None]] = None) -> List[Tuple[int, ...]]:
+        """
+        Optimum de Pareto (réparti sur `n_processus` processus si demandé ;
+        sinon `progression` est appelé après chaque bloc de profils)
+        """
+        tenseur = self.jeu.tenseur
+        if n_processus is not None and n_processus > 1:
+            indices = optimum_pareto_parallele(tenseur, n_processus, taille_bloc)
+        else:
+            # Un profil par ligne, un joueur par colonne (vue transposée, sans copie)
+            points = tenseur.reshape(len(tenseur), -1).T
+            compteurs = {} if self.instrumentation is not None else None
+            indices = frontiere_pareto(points, taille_bloc, compteurs, progression)
+            if compteurs is not None:
+                self._compter(comparaisons=compteurs.get("comparaisons", 0))
+        self._compter(self._n_profils(), tenseur.size)
+        return list(zip(*(coord.tolist() for coord in np.unravel_index(indices, tenseur.shape[1:]))))
+    
+    def iter_optima_pareto(self, limite: Optional[int] = None, taille_bloc: int = 4096) -> Iterator[Tuple[int, ...]]:
+        """
+        Optima de Pareto produits dès qu'ils sont confirmés (ordre de
+        découverte, par somme des gains décroissante) ; arrêt après `limite`.
+        """
+        tenseur = self.jeu.tenseur
+        points = tenseur.reshape(len(tenseur), -1).T
+        profils = (
+            tuple(int(i) for i in profil)
+            for indices in iter_frontiere_pareto(points, taille_bloc)
+            for profil in zip(*np.unravel_index(indices, tenseur.shape[1:]))
+        )
+        return islice(profils, limite)
+    
+    @instrumente
+    def niveau_securite(self, id_joueur: int) -> Tuple[float, int]:
+        """Niveau de sécurité (maxmin en stratégies pures) d'un joueur"""
         gains = self.jeu.gains[id_joueur]
-        player_idx = id_joueur - 1
-        n_strategies = len(self.jeu.joueurs[player_idx].strategies)
-        
-        # Rebuild complete index
-        index = list(strategies_autres)
-        index.insert(player_idx, 0)  # Temporary value
-        
-        meilleures = []
-        max_gain = -np.inf
-        
-        for strat in range(n_strategies):
-            index[player_idx] = strat
-            gain = gains[tuple(index)]
-            
-            if gain > max_gain:
-                max_gain = gain
-                meilleures = [strat]
-            elif gain == max_gain:
-                meilleures.append(strat)
-        
-        return meilleures
+        minima = minima_par_strategie(gains, self._axe_joueur(id_joueur))
+        self._compter(gains.size, gains.size, gains.size)
+        meilleure_strat = int(np.argmax(minima))
+        return (minima[meilleure_strat], meilleure_strat)
+
+    @instrumente
+    def niveaux_securite_mixtes(self, progression: Optional[Callable[[float], None]] = None) -> Dict[str, object]:
+        """
+        Niveaux de sécurité en stratégies mixtes de tous les joueurs, par un
+        seul programme linéaire (voir core.securite ; nécessite scipy).
+        """
+        resultat = niveaux_securite_mixtes(self.jeu, progression)
+        self._compter(self._n_profils(), self.jeu.tenseur.size, resultat["contraintes"])
+        return resultat
+
+    @instrumente
+    def meilleure_reponse(self, id_joueur: int, strategies_autres: Tuple[int, ...]) -> List[int]:
+        """
+        Meilleures réponses d'un joueur (table construite au premier appel et
+        reconstruite si les gains ont changé, voir Jeu.signaler_modification)
+        """
+        empreinte = self.jeu.empreinte_courante()
+        if self._table_reponses is None or self._empreinte_table != empreinte:
+            self._table_reponses = TableMeilleuresReponses(self.jeu)
+            self._empreinte_table = empreinte
+            self._compter(lectures=self.jeu.tenseur.size, comparaisons=self.jeu.tenseur.size)
+        self._compter(1, 1)
+        return self._table_reponses.meilleures(id_joueur, strategies_autres)
@@ -0,0 +1,173 @@
+"""
+Équilibres mixtes approchés par apprentissage : jeu fictif et dynamique du
+réplicateur (discrète), pour des jeux à N joueurs trop grands pour un calcul
+exact.
+
+Les gains espérés de chaque joueur sont obtenus par contractions du tenseur
+de gains avec les stratégies mixtes des autres joueurs (produits matriciels
+par lot), sans énumérer les profils. Plusieurs parcours, depuis des mélanges
+initiaux différents, avancent ensemble.
+"""
+import time
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Union
+from .modeles import Jeu
+
+METHODES_APPRENTISSAGE = ("jeu_fictif", "replicateur")
+# Cellules de résultat intermédiaire d'une contraction (par paquet de parcours)
+_CELLULES_PAR_PAQUET = 1 << 24
+
+Melanges = List[np.ndarray]
+
+
+class MoteurApprentissage:
+    def __init__(self, jeu: Jeu):
+        self.jeu = jeu
+        self.forme = jeu.forme
+        # Par joueur : gains en flottant, ses propres stratégies sur le dernier axe
+        # (copie contiguë, pour des contractions par produits matriciels)
+        self._tables: List[np.ndarray] = []
+        self._etendues: List[float] = []
+        for k, joueur in enumerate(jeu.joueurs):
+            g = np.asarray(jeu.gains[joueur.id], dtype=np.float64)
+            self._tables.append(np.ascontiguousarray(np.moveaxis(g, k, -1)))
+            etendue = float(g.max() - g.min())
+            self._etendues.append(etendue if etendue > 0 else 1.0)
+
+    def departs(self, departs: Union[None, int, Sequence[np.ndarray]] = None,
+                graine: Optional[int] = None) -> Melanges:
+        """
+        Mélanges initiaux (un tableau (B, s_k) par joueur) :
+        None -> un seul parcours uniforme ; un entier B -> B mélanges tirés
+        uniformément sur le simplexe ; sinon les mélanges donnés (normalisés).
+        """
+        if departs is None:
+            return [np.full((1, s), 1.0 / s) for s in self.forme]
+        if isinstance(departs, (int, np.integer)):
+            if departs < 1:
+                raise ValueError("Il faut au moins un départ")
+            rng = np.random.default_rng(graine)
+            return [rng.dirichlet(np.ones(s), size=int(departs)) for s in self.forme]
+
+        if len(departs) != len(self.forme):
+            raise ValueError("Il faut un mélange initial par joueur")
+        melanges = [np.atleast_2d(np.asarray(x, dtype=np.float64)) for x in departs]
+        for x, s in zip(melanges, self.forme):
+            if x.shape[1] != s or x.shape[0] != melanges[0].shape[0]:
+                raise ValueError(f"Dimensions incorrectes pour un mélange initial: {x.shape}")
+            if np.any(x < 0) or np.any(x.sum(axis=1) <= 0):
+                raise ValueError("Un mélange initial doit être positif et non nul")
+        return [x / x.sum(axis=1, keepdims=True) for x in melanges]
+
+    def gains_esperes(self, melanges: Melanges) -> Melanges:
+        """
+        Gains espérés de chaque stratégie pure de chaque joueur (B, s_k) contre
+        les mélanges des autres joueurs.
+        """
+        B = melanges[0].shape[0]
+        gains = [np.empty((B, s)) for s in self.forme]
+        for k, table in enumerate(self._tables):
+            autres = [x for a, x in enumerate(melanges) if a != k]
+            if not autres:
+                gains[k][:] = table
+                continue
+            # Le premier produit (B, s_a) @ (s_a, reste) produit le plus gros intermédiaire
+            paquet = max(1, _CELLULES_PAR_PAQUET // (table.size // autres[0].shape[1]))
+            for debut in range(0, B, paquet):
+                fin = min(B, debut + paquet)
+                r = autres[0][debut:fin] @ table.reshape(autres[0].shape[1], -1)
+                for x in autres[1:]:
+                    # Contraction de l'axe suivant, parcours par parcours
+                    r = np.matmul(x[debut:fin, None, :], r.reshape(fin - debut, x.shape[1], -1))[:, 0]
+                gains[k][debut:fin] = r
+        return gains
+
+    def ecart_nash(self, melanges: Melanges, gains: Optional[Melanges] = None) -> np.ndarray:
+        """
+        Écart à l'équilibre de Nash de chaque parcours : le plus grand gain
+        qu'un joueur obtiendrait en déviant seul (0 pour un équilibre exact).
+        """
+        if gains is None:
+            gains = self.gains_esperes(melanges)
+        return np.max([u.max(axis=1) - np.einsum("bi,bi->b", x, u) for x, u in zip(melanges, gains)], axis=0)
+
+    def jeu_fictif(self, departs: Union[None, int, Sequence[np.ndarray]] = None, epsilon: float = 1e-3,
+                   max_iterations: int = 10000, graine: Optional[int] = None) -> Dict[str, object]:
+        """
+        Jeu fictif simultané : à chaque itération, chaque joueur joue une
+        meilleure réponse pure (la plus petite) aux fréquences empiriques des
+        autres ; le mélange initial compte pour une observation.
+        """
+        def mise_a_jour(melanges, gains, t):
+            for x, u in zip(melanges, gains):
+                x *= t / (t + 1)
+                x[np.arange(len(x)), u.argmax(axis=1)] += 1 / (t + 1)
+
+        return self._parcourir(departs, epsilon, max_iterations, graine, mise_a_jour)
+
+    def replicateur(self, departs: Union[None, int, Sequence[np.ndarray]] = None, epsilon: float = 1e-3,
+                    max_iterations: int = 10000, pas: float = 0.1,
+                    graine: Optional[int] = None) -> Dict[str, object]:
+        """
+        Dynamique du réplicateur discrète :
+            x_i <- x_i * (1 + pas * (u_i - x.u) / étendue des gains du joueur)
+        (0 < pas < 1 garde les mélanges dans le simplexe). Une stratégie
+        absente du mélange initial n'apparaît jamais.
+        """
+        if not 0 < pas < 1:
+            raise ValueError("Le pas doit être compris strictement entre 0 et 1")
+
+        def mise_a_jour(melanges, gains, t):
+            for x, u, etendue in zip(melanges, gains, self._etendues):
+                moyenne = np.einsum("bi,bi->b", x, u)[:, None]
+                x *= 1 + pas * (u - moyenne) / etendue
+                x /= x.sum(axis=1, keepdims=True)
+
+        return self._parcourir(departs, epsilon, max_iterations, graine, mise_a_jour)
+
+    def _parcourir(self, departs, epsilon: float, max_iterations: int, graine: Optional[int],
+                   mise_a_jour) -> Dict[str, object]:
+        """
+        Boucle commune : les parcours s'arrêtent dès que leur écart de Nash
+        est <= epsilon. Retourne un dictionnaire :
+            "melanges": mélanges finaux, un tableau (B, s_k) par joueur
+            "ecart": écart de Nash final par parcours
+            "iterations": itérations effectuées par parcours
+            "converge": écart <= epsilon
+            "trace": par itération, écarts min et max et nombre de parcours
+                     encore actifs, et durée de l'itération (secondes)
+            "temps_par_iteration": durée moyenne d'une itération
+        """
+        melanges = self.departs(departs, graine)
+        B = melanges[0].shape[0]
+        ecart = np.empty(B)
+        iterations = np.zeros(B, dtype=np.int64)
+        trace: Dict[str, list] = {"ecart_min": [], "ecart_max": [], "actifs": [], "temps": []}
+
+        actifs = np.arange(B)
+        for t in range(max_iterations + 1):
+            debut = time.perf_counter()
+            courants = [x[actifs] for x in melanges]
+            gains = self.gains_esperes(courants)
+            e = self.ecart_nash(courants, gains)
+            ecart[actifs] = e
+            iterations[actifs] = t
+            fini = e <= epsilon
+            if t < max_iterations:
+                suivants = [x[~fini] for x in courants]
+                mise_a_jour(suivants, [u[~fini] for u in gains], t + 1)
+                for x, s in zip(melanges, suivants):
+                    x[actifs[~fini]] = s
+            trace["ecart_min"].append(float(e.min()))
+            trace["ecart_max"].append(float(e.max()))
+            trace["actifs"].append(len(actifs))
+            trace["temps"].append(time.perf_counter() - debut)
+
+            actifs = actifs[~fini]
+            if len(actifs) == 0:
+                break
+
+        trace = {cle: np.array(valeurs) for cle, valeurs in trace.items()}
+        return {"melanges": melanges, "ecart": ecart, "iterations": iterations,
+                "converge": ecart <= epsilon, "trace": trace,
+                "temps_par_iteration": float(trace["temps"].mean())}
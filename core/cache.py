@@ -0,0 +1,201 @@
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+import numpy as np
+from .modeles import Jeu
+from .algorithems import AnalyseurJeu
+
+
+def empreinte_jeu(jeu: Jeu) -> str:
+    """
+    Empreinte du contenu d'un jeu : identifiants, stratégies et tenseurs de
+    gains (forme, type et octets). Les noms de stratégies en font partie car
+    ils apparaissent dans certains résultats (chemin d'élimination IESDS).
+    """
+    h = hashlib.blake2b(digest_size=20)
+    for joueur in jeu.joueurs:
+        gains = jeu.gains[joueur.id]
+        entete = {
+            "id": joueur.id,
+            "strategies": list(joueur.strategies),
+            "dtype": gains.dtype.str,
+            "shape": gains.shape,
+        }
+        h.update(json.dumps(entete, ensure_ascii=False).encode("utf-8"))
+        h.update(memoryview(gains.ravel(order="C")).cast("B"))
+    return h.hexdigest()
+
+
+class CacheResultats:
+    """
+    Cache de résultats d'analyse : LRU en mémoire borné à `taille_max`
+    entrées, avec un second niveau optionnel sur disque (un fichier pickle
+    par entrée dans `repertoire`) partageable entre processus.
+    """
+
+    def __init__(self, taille_max: int = 128, repertoire: Optional[str] = None):
+        if taille_max < 1:
+            raise ValueError("La taille du cache doit être au moins 1")
+        self.taille_max = taille_max
+        self.repertoire = repertoire
+        if repertoire:
+            os.makedirs(repertoire, exist_ok=True)
+        self._memoire: "OrderedDict[str, Any]" = OrderedDict()
+        self._verrou = threading.Lock()
+        self.hits = 0
+        self.hits_disque = 0
+        self.misses = 0
+
+    def obtenir(self, cle: str) -> Tuple[bool, Any]:
+        """Retourne (trouvé, valeur) et met à jour les compteurs."""
+        with self._verrou:
+            if cle in self._memoire:
+                self._memoire.move_to_end(cle)
+                self.hits += 1
+                return True, self._memoire[cle]
+
+        if self.repertoire:
+            try:
+                with open(self._chemin(cle), "rb") as f:
+                    valeur = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                pass
+            else:
+                with self._verrou:
+                    self.hits_disque += 1
+                    self._ranger(cle, valeur)
+                return True, valeur
+
+        with self._verrou:
+            self.misses += 1
+        return False, None
+
+    def enregistrer(self, cle: str, valeur: Any):
+        with self._verrou:
+            self._ranger(cle, valeur)
+        if self.repertoire:
+            # Écriture atomique : un autre processus ne lit jamais un fichier partiel
+            fd, temporaire = tempfile.mkstemp(dir=self.repertoire, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(valeur, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temporaire, self._chemin(cle))
+            except BaseException:
+                os.unlink(temporaire)
+                raise
+
+    def vider(self):
+        """Vide le niveau mémoire (le niveau disque est conservé)."""
+        with self._verrou:
+            self._memoire.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._verrou:
+            return {
+                "hits": self.hits,
+                "hits_disque": self.hits_disque,
+                "misses": self.misses,
+                "entrees": len(self._memoire),
+                "taille_max": self.taille_max,
+            }
+
+    def _ranger(self, cle: str, valeur: Any):
+        self._memoire[cle] = valeur
+        self._memoire.move_to_end(cle)
+        while len(self._memoire) > self.taille_max:
+            self._memoire.popitem(last=False)
+
+    def _chemin(self, cle: str) -> str:
+        return os.path.join(self.repertoire, f"{cle}.pkl")
+
+
+# Méthodes d'AnalyseurJeu dont le résultat (une valeur complète, pas un
+# itérateur) est mémorisé ; les autres sont appelées directement
+METHODES_EN_CACHE = frozenset({
+    "strategies_dominantes", "est_strictement_dominee", "elimination_strategies_dominantes",
+    "equilibre_iteratif_dominance_stricte", "elimination_dominance_mixte",
+    "equilibre_nash", "existe_equilibre_nash", "nombre_equilibres_nash", "equilibres_mixtes",
+    "equilibre_approche", "equilibre_correle", "optimum_pareto", "niveau_securite",
+    "niveaux_securite_mixtes", "meilleure_reponse", "potentiel", "equilibres_potentiel",
+    "chemins_amelioration",
+})
+# Méthodes aléatoires : mémorisées seulement avec une graine explicite
+_METHODES_ALEATOIRES = frozenset({"equilibre_approche", "chemins_amelioration"})
+
+
+def _empreinte_argument(h, valeur: Any):
+    """Ajoute un argument à l'empreinte ; les tableaux par type, forme et octets (pas par repr, tronqué)"""
+    if isinstance(valeur, np.ndarray):
+        h.update(f"ndarray:{valeur.dtype.str}:{valeur.shape}:".encode("utf-8"))
+        h.update(memoryview(np.ascontiguousarray(valeur).ravel()).cast("B"))
+    elif isinstance(valeur, (list, tuple)):
+        h.update(f"{type(valeur).__name__}:{len(valeur)}[".encode("utf-8"))
+        for element in valeur:
+            _empreinte_argument(h, element)
+        h.update(b"]")
+    elif isinstance(valeur, dict):
+        h.update(f"dict:{len(valeur)}{{".encode("utf-8"))
+        for cle in sorted(valeur, key=repr):
+            _empreinte_argument(h, cle)
+            _empreinte_argument(h, valeur[cle])
+        h.update(b"}")
+    else:
+        h.update(f"{type(valeur).__name__}:{valeur!r};".encode("utf-8"))
+
+
+class AnalyseurCache:
+    """
+    Enveloppe un AnalyseurJeu et mémorise le résultat des méthodes de
+    METHODES_EN_CACHE, par (empreinte du jeu, méthode, arguments liés à la
+    signature, défauts compris). Les itérateurs (iter_*) ne sont jamais
+    mémorisés, ni les méthodes aléatoires appelées sans graine. Le rappel
+    `progression` ne change pas le résultat : il ne fait pas partie de la clé.
+    Les résultats sont partagés : ne pas les modifier en place. L'empreinte
+    du contenu est recalculée quand le jeu signale une modification.
+    """
+
+    def __init__(self, analyseur: AnalyseurJeu, cache: CacheResultats):
+        self.analyseur = analyseur
+        self.cache = cache
+        self._etat = analyseur.jeu.empreinte_courante()
+        self._empreinte = empreinte_jeu(analyseur.jeu)
+
+    @property
+    def empreinte(self) -> str:
+        etat = self.jeu.empreinte_courante()
+        if etat != self._etat:
+            self._etat, self._empreinte = etat, empreinte_jeu(self.jeu)
+        return self._empreinte
+
+    @property
+    def jeu(self) -> Jeu:
+        return self.analyseur.jeu
+
+    def __getattr__(self, nom: str):
+        attribut = getattr(self.analyseur, nom)
+        if nom not in METHODES_EN_CACHE:
+            return attribut
+        signature = inspect.signature(attribut)
+
+        def methode_en_cache(*args, **kwargs):
+            arguments = signature.bind(*args, **kwargs)
+            arguments.apply_defaults()
+            valeurs = {k: v for k, v in arguments.arguments.items() if k != "progression"}
+            if nom in _METHODES_ALEATOIRES and valeurs.get("graine") is None:
+                return attribut(*args, **kwargs)
+            h = hashlib.blake2b(f"{self.empreinte}:{nom}:".encode("utf-8"), digest_size=20)
+            _empreinte_argument(h, valeurs)
+            cle = h.hexdigest()
+            trouve, valeur = self.cache.obtenir(cle)
+            if not trouve:
+                valeur = attribut(*args, **kwargs)
+                self.cache.enregistrer(cle, valeur)
+            return valeur
+
+        return methode_en_cache
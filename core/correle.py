@@ -0,0 +1,112 @@
+"""
+Équilibres corrélés (CE) et grossièrement corrélés (CCE) par programmation
+linéaire creuse.
+
+Une distribution mu sur les profils est un équilibre corrélé si aucun joueur
+ne gagne, en espérance, à remplacer une recommandation s par une autre
+stratégie s' :
+    pour tout k, s != s' : somme_{p_k = s} mu(p) (u_k(s', p_-k) - u_k(p)) <= 0
+Pour un équilibre grossièrement corrélé, la déviation est choisie avant la
+recommandation :
+    pour tout k, s' : somme_p mu(p) (u_k(s', p_-k) - u_k(p)) <= 0
+
+Les contraintes sont assemblées directement au format creux (scipy.sparse),
+joueur par joueur, sans matrice dense contraintes x profils. La résolution
+utilise HiGHS (scipy.optimize.linprog), scipy étant une dépendance optionnelle.
+"""
+import time
+import numpy as np
+from typing import Dict
+from .modeles import Jeu
+from .utils import importer_scipy
+
+OBJECTIFS_CORRELES = ("bien_etre", "faisabilite")
+
+
+def contraintes_incitation(jeu: Jeu, grossier: bool = False):
+    """
+    Matrice creuse (CSR) des contraintes d'incitation A (A @ mu <= 0), une
+    colonne par profil (ordre C du tenseur de gains), une ligne par couple
+    (joueur, recommandation, déviation) pour un CE, par couple (joueur,
+    déviation) pour un CCE. Les coefficients nuls ne sont pas stockés ; les
+    lignes sont écrites directement au format CSR, dans l'ordre.
+    """
+    _, sparse = importer_scipy("Les équilibres corrélés")
+    forme = jeu.forme
+    n_profils = int(np.prod(forme, dtype=np.int64))
+    type_index = np.int32 if n_profils < np.iinfo(np.int32).max else np.int64
+    profils = np.arange(n_profils, dtype=type_index).reshape(forme)
+
+    # Blocs de lignes : (nombre de coefficients par ligne, colonnes, valeurs)
+    tailles, colonnes, valeurs = [], [], []
+    for k, joueur in enumerate(jeu.joueurs):
+        s_k = forme[k]
+        # Gains du joueur, une ligne par profil adverse et une colonne par stratégie propre
+        G = np.moveaxis(np.asarray(jeu.gains[joueur.id], dtype=np.float64), k, -1).reshape(-1, s_k)
+        index = np.moveaxis(profils, k, -1).reshape(-1, s_k)
+        if grossier:
+            # Une ligne par déviation s', sur tous les profils
+            for s_dev in range(s_k):
+                ecarts = G[:, s_dev, None] - G
+                garde = ecarts != 0
+                tailles.append([np.count_nonzero(garde)])
+                colonnes.append(index[garde])
+                valeurs.append(ecarts[garde])
+            continue
+        # Une ligne par recommandation s et déviation s' != s, sur les profils où le joueur joue s
+        for s in range(s_k):
+            deviations = [d for d in range(s_k) if d != s]
+            ecarts = G[:, deviations].T - G[:, s]
+            garde = ecarts != 0
+            tailles.append(np.count_nonzero(garde, axis=1))
+            colonnes.append(np.broadcast_to(index[:, s], ecarts.shape)[garde])
+            valeurs.append(ecarts[garde])
+
+    tailles = np.concatenate(tailles)
+    indptr = np.zeros(len(tailles) + 1, dtype=np.int64)
+    np.cumsum(tailles, out=indptr[1:])
+    if indptr[-1] < np.iinfo(np.int32).max:
+        indptr = indptr.astype(np.int32)
+    return sparse.csr_array((np.concatenate(valeurs), np.concatenate(colonnes), indptr),
+                            shape=(len(tailles), n_profils))
+
+
+def equilibre_correle(jeu: Jeu, grossier: bool = False, objectif: str = "bien_etre") -> Dict[str, object]:
+    """
+    Équilibre corrélé (ou grossièrement corrélé si `grossier`) maximisant la
+    somme des gains espérés ("bien_etre"), ou quelconque ("faisabilite").
+    Retourne un dictionnaire :
+        "distribution": probabilités des profils (tableau de la forme du jeu)
+        "gains": gain espéré de chaque joueur
+        "bien_etre": somme des gains espérés
+        "contraintes", "non_nuls": taille de la matrice des contraintes
+        "temps_construction", "temps_resolution": durées (secondes)
+    """
+    if objectif not in OBJECTIFS_CORRELES:
+        raise ValueError(f"Objectif inconnu: {objectif}")
+    optimize, sparse = importer_scipy("Les équilibres corrélés")
+
+    debut = time.perf_counter()
+    # linprog empile A_ub et A_eq au format CSC : le fournir ainsi évite une copie de plus
+    A = contraintes_incitation(jeu, grossier).tocsc()
+    n_profils = A.shape[1]
+    if objectif == "bien_etre":
+        c = -np.asarray(jeu.tenseur.sum(axis=0, dtype=np.float64)).reshape(-1)
+    else:
+        c = np.zeros(n_profils)
+    somme = sparse.csc_array(np.ones((1, n_profils)))
+    temps_construction = time.perf_counter() - debut
+
+    debut = time.perf_counter()
+    resultat = optimize.linprog(c, A_ub=A, b_ub=np.zeros(A.shape[0]), A_eq=somme, b_eq=[1.0],
+                                bounds=(0, None), method="highs")
+    temps_resolution = time.perf_counter() - debut
+    if resultat.status != 0:
+        raise RuntimeError(f"Le programme linéaire n'a pas été résolu: {resultat.message}")
+
+    mu = np.clip(resultat.x, 0, None)
+    mu /= mu.sum()
+    gains = np.array([float(np.asarray(jeu.gains[j.id], dtype=np.float64).reshape(-1) @ mu) for j in jeu.joueurs])
+    return {"distribution": mu.reshape(jeu.forme), "gains": gains, "bien_etre": float(gains.sum()),
+            "contraintes": A.shape[0], "non_nuls": A.nnz,
+            "temps_construction": temps_construction, "temps_resolution": temps_resolution}
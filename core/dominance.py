@@ -0,0 +1,357 @@
+import numpy as np
+from typing import Callable, List, Optional, Tuple
+from .utils import importer_scipy
+
+_CELLULES_PAR_PAQUET = 1 << 22
+
+
+def _tranches(gains: np.ndarray, axe: int, lignes: np.ndarray, actives: List[np.ndarray]) -> np.ndarray:
+    """
+    Gains d'un joueur restreints aux stratégies actives, à plat :
+    une ligne par stratégie de `lignes`, une colonne par profil adverse actif.
+    """
+    index = list(actives)
+    index[axe] = lignes
+    sous = gains[np.ix_(*index)]
+    return np.moveaxis(sous, axe, 0).reshape(len(lignes), -1)
+
+
+class MoteurIESDS:
+    """
+    Élimination itérée des stratégies strictement dominées (par une
+    stratégie pure), incrémentale.
+
+    Pour chaque joueur, `domine[i][a, b]` indique si b domine strictement a
+    sur les profils adverses encore actifs. Une relation de domination reste
+    vraie quand des stratégies adverses disparaissent ; une paire non
+    dominante garde un témoin (un profil adverse où b ne fait pas mieux que a)
+    et n'est revérifiée que lorsque ce témoin est éliminé.
+    """
+
+    def __init__(self, gains: List[np.ndarray]):
+        self.gains = gains
+        self.n_joueurs = len(gains)
+        forme = gains[0].shape
+        self.actives = [np.arange(s) for s in forme]
+        self.domine = [np.zeros((s, s), dtype=bool) for s in forme]
+        # temoin[i][a, b] : coordonnées (dans le jeu complet) du profil témoin, -1 sinon
+        self.temoin = [np.full((s, s, self.n_joueurs), -1, dtype=np.intp) for s in forme]
+        # Cellules de gains lues et comparaisons de cellules effectuées (instrumentation)
+        self.lectures = 0
+        self.comparaisons = 0
+        for i in range(self.n_joueurs):
+            paires = np.argwhere(~np.eye(forme[i], dtype=bool))
+            self._verifier(i, paires[:, 0], paires[:, 1])
+
+    def _verifier(self, i: int, a: np.ndarray, b: np.ndarray):
+        """(Re)calcule la domination de a par b pour les paires données du joueur i."""
+        if len(a) == 0:
+            return
+        lignes, inverse = np.unique(np.r_[a, b], return_inverse=True)
+        plat = _tranches(self.gains[i], i, lignes, self.actives)
+        ia, ib = inverse[:len(a)], inverse[len(a):]
+        self.lectures += plat.size
+        autres = [j for j in range(self.n_joueurs) if j != i]
+        forme_active = [len(self.actives[j]) for j in autres]
+
+        # Comparaisons par paquets de paires pour borner la mémoire
+        pas = max(1, _CELLULES_PAR_PAQUET // max(plat.shape[1], 1))
+        for debut in range(0, len(a), pas):
+            sl = slice(debut, debut + pas)
+            meilleur = plat[ib[sl]] > plat[ia[sl]]
+            self.comparaisons += meilleur.size
+            domine = meilleur.all(axis=1)
+            pa, pb = a[sl], b[sl]
+            self.domine[i][pa, pb] = domine
+            self.temoin[i][pa[domine], pb[domine]] = -1
+
+            # Premier profil adverse où b ne fait pas strictement mieux que a
+            non = ~domine
+            colonne = np.argmin(meilleur[non], axis=1)
+            coords = np.unravel_index(colonne, forme_active)
+            temoin = np.full((int(non.sum()), self.n_joueurs), -1, dtype=np.intp)
+            for k, j in enumerate(autres):
+                temoin[:, j] = self.actives[j][coords[k]]
+            self.temoin[i][pa[non], pb[non]] = temoin
+
+    def strategies_dominees(self, i: int) -> np.ndarray:
+        """Stratégies actives du joueur i strictement dominées par une autre stratégie active."""
+        act = self.actives[i]
+        return act[self.domine[i][np.ix_(act, act)].any(axis=1)]
+
+    def eliminer(self, i: int, strat: int):
+        """Retire une stratégie du joueur i et revérifie les seules paires dont elle était le témoin."""
+        self.actives[i] = self.actives[i][self.actives[i] != strat]
+        for j in range(self.n_joueurs):
+            if j == i:
+                continue
+            act = self.actives[j]
+            sous_temoin = self.temoin[j][np.ix_(act, act)][:, :, i]
+            a, b = np.nonzero(sous_temoin == strat)
+            self._verifier(j, act[a], act[b])
+
+    def executer(self, progression: Optional[Callable[[float], None]] = None) -> List[Tuple[int, int]]:
+        """
+        Élimine une stratégie à la fois (la plus petite dominée du premier joueur
+        qui en a une) jusqu'à stabilité, et retourne les couples (joueur, stratégie)
+        dans l'ordre d'élimination. `progression` est appelé avant chaque
+        élimination (fraction des stratégies éliminables déjà retirées).
+        """
+        eliminations = []
+        eliminables = max(1, sum(len(act) - 1 for act in self.actives))
+        while True:
+            if progression is not None:
+                progression(len(eliminations) / eliminables)
+            for i in range(self.n_joueurs):
+                dominees = self.strategies_dominees(i)
+                if len(dominees):
+                    strat = int(dominees[0])
+                    self.eliminer(i, strat)
+                    eliminations.append((i, strat))
+                    break
+            else:
+                return eliminations
+
+
+ORDRES_ELIMINATION = ("simultane", "par_joueur", "une_a_une")
+# Précision relative des programmes linéaires, au-dessus de la tolérance de
+# faisabilité de HiGHS (1e-7 par défaut, appliquée au problème mis à l'échelle)
+_TOLERANCE_SOLVEUR = 1e-6
+
+
+def _meilleur_des_autres(plat: np.ndarray) -> np.ndarray:
+    """Meilleur gain des autres lignes sur chaque profil : le maximum, ou le second pour la ligne qui l'atteint"""
+    ordre = np.argsort(plat, axis=0)
+    premier = np.take_along_axis(plat, ordre[-1:], axis=0)[0]
+    second = np.take_along_axis(plat, ordre[-2:-1], axis=0)[0]
+    return np.where(np.arange(plat.shape[0])[:, None] == ordre[-1], second, premier)
+
+
+def _seuil(plat: np.ndarray, tolerance: float) -> float:
+    """Tolérance absolue des tests de dominance : jamais sous la précision du solveur"""
+    return max(tolerance, _TOLERANCE_SOLVEUR) * max(1.0, float(np.abs(plat).max()))
+
+
+def _programmes_dominance(plat: np.ndarray, candidats: np.ndarray, faiblement: bool, tolerance: float) -> np.ndarray:
+    """
+    Pour chaque ligne candidate a de `plat` (stratégies x profils adverses),
+    existe-t-il un mélange sigma des autres lignes (sigma_a = 0) qui la
+    domine ? On maximise d'abord la marge e de
+        sigma @ plat[:, r] - e >= plat[a, r] pour tout r
+    (toujours réalisable) : a est strictement dominée si e > seuil. Pour la
+    dominance faible, une marge sous -seuil rend a non dominée ; les autres
+    lignes passent par un second programme,
+        max somme_r sigma @ plat[:, r]  s.c.  sigma @ plat[:, r] >= plat[a, r] - d
+    relâché du seul déficit d = max(0, -e) (plus la précision du solveur) qui
+    le garde réalisable. Le gain dû au relâchement est au plus d fois la somme
+    des variables duales : a est dominée si le gain sur la somme de a, ce
+    terme retiré, dépasse le seuil.
+    """
+    seuil = _seuil(plat, tolerance)
+    marges, _ = _resoudre_blocs(plat, candidats, False, np.zeros(len(candidats)))
+    dominee = marges > seuil
+    if faiblement:
+        limites = ~dominee & (marges >= -seuil)
+        if limites.any():
+            relachements = np.maximum(0.0, -marges[limites]) + _TOLERANCE_SOLVEUR * max(1.0, float(np.abs(plat).max()))
+            gains, duaux = _resoudre_blocs(plat, candidats[limites], True, relachements)
+            dominee[limites] = gains - relachements * duaux > seuil
+    return dominee
+
+
+def _resoudre_blocs(plat: np.ndarray, candidats: np.ndarray, faiblement: bool,
+                    relachements: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Un programme linéaire par candidat, assemblés en un programme
+    bloc-diagonal (HiGHS) ; retourne la marge e de chaque candidat, ou
+    (faiblement) le gain total du mélange sur le sien, et la somme des
+    valeurs absolues des variables duales de ses contraintes.
+
+    Seules s + 1 contraintes au plus sont actives à l'optimum : chaque
+    programme part des profils adverses où le candidat fait le mieux face
+    aux autres lignes, puis on ajoute à chaque tour les contraintes les plus
+    violées (vérifiées sur tous les profils d'un coup, au-delà de la
+    précision du solveur). Un candidat sort quand aucune contrainte n'est
+    violée ou qu'aucune nouvelle ne peut être ajoutée ; chaque tour en
+    ajoute donc au moins une, d'où au plus R tours. Une marge relâchée déjà
+    négative est définitive.
+    """
+    optimize, sparse = importer_scipy("Les dominances par stratégies mixtes")
+    s, R = plat.shape
+    largeur = s + (0 if faiblement else 1)
+    totaux = plat.sum(axis=1)
+    precision = _TOLERANCE_SOLVEUR * max(1.0, float(np.abs(plat).max()))
+    ajout = min(R, 2 * largeur)
+
+    # Contraintes initiales : profils où l'avance du candidat sur les autres lignes est la plus grande
+    avance = plat[candidats] - _meilleur_des_autres(plat)[candidats]
+    lignes = [np.argsort(-av, kind="stable")[:ajout] for av in avance]
+    resultat = np.empty(len(candidats))
+    duaux = np.zeros(len(candidats))
+    en_cours = np.arange(len(candidats))
+
+    for _ in range(R + 1):
+        if not len(en_cours):
+            return resultat, duaux
+        blocs, b_ub = [], []
+        for k in en_cours:
+            rangees = plat[:, lignes[k]].T
+            blocs.append(sparse.csr_array(-rangees if faiblement else np.c_[-rangees, np.ones(len(rangees))]))
+            b_ub.append(relachements[k] - plat[candidats[k], lignes[k]])
+        m = len(en_cours)
+        simplexe = sparse.csr_array(np.r_[np.ones(s), np.zeros(largeur - s)][None, :])
+        A_ub = sparse.block_diag(blocs, format="csc")
+        A_eq = sparse.block_diag([simplexe] * m, format="csc")
+        bornes = np.zeros((m * largeur, 2))
+        bornes[:, 1] = np.inf
+        decalages = np.arange(m) * largeur
+        bornes[decalages + candidats[en_cours]] = (0, 0)
+        if faiblement:
+            c = -np.tile(totaux, m)
+        else:
+            bornes[decalages + s] = (-np.inf, np.inf)
+            c = np.zeros(m * largeur)
+            c[decalages + s] = -1.0
+        sol = optimize.linprog(c, A_ub=A_ub, b_ub=np.concatenate(b_ub), A_eq=A_eq, b_eq=np.ones(m),
+                               bounds=bornes, method="highs")
+        if sol.status != 0:
+            raise RuntimeError(f"Le programme linéaire n'a pas été résolu: {sol.message}")
+
+        x = sol.x.reshape(m, largeur)
+        sigma = x[:, :s]
+        debuts = np.r_[0, np.cumsum([len(lignes[k]) for k in en_cours])[:-1]]
+        duaux[en_cours] = np.add.reduceat(np.abs(sol.ineqlin.marginals), debuts)
+        if faiblement:
+            resultat[en_cours] = sigma @ totaux - totaux[candidats[en_cours]]
+            violation = plat[candidats[en_cours]] - relachements[en_cours, None] - sigma @ plat
+        else:
+            resultat[en_cours] = x[:, s]
+            violation = plat[candidats[en_cours]] + x[:, s:] - sigma @ plat
+        violee = violation.max(axis=1) > precision
+        if not faiblement:
+            violee &= x[:, s] > -precision
+        restants = []
+        for k, v, ligne in zip(en_cours, violee, violation):
+            if v:
+                nouvelles = np.setdiff1d(np.flatnonzero(ligne > precision), lignes[k])
+                if len(nouvelles):
+                    nouvelles = nouvelles[np.argsort(-ligne[nouvelles], kind="stable")[:ajout]]
+                    lignes[k] = np.union1d(lignes[k], nouvelles)
+                    restants.append(k)
+        en_cours = np.array(restants, dtype=np.intp)
+    raise RuntimeError("La génération de contraintes n'a pas convergé")
+
+
+def strategies_dominees_melange(plat: np.ndarray, faiblement: bool = False, tolerance: float = 1e-9) -> Tuple[np.ndarray, int]:
+    """
+    Lignes de `plat` (stratégies x profils adverses) dominées, strictement
+    ou faiblement, par une stratégie pure ou mixte. Filtre préalable sans
+    programme linéaire, à la même tolérance que les programmes : une ligne
+    dominée par une autre ligne pure l'est ; une ligne meilleure réponse
+    (stricte pour la dominance faible) à un profil adverse ne l'est pas.
+    La tolérance est relative au plus grand gain en valeur absolue et ne
+    descend pas sous la précision du solveur (_TOLERANCE_SOLVEUR).
+    Retourne le masque et le nombre de programmes résolus.
+    """
+    s = plat.shape[0]
+    dominee = np.zeros(s, dtype=bool)
+    if s < 2 or plat.shape[1] == 0:
+        return dominee, 0
+    plat = np.asarray(plat, dtype=np.float64)
+    seuil = _seuil(plat, tolerance)
+    for b in range(s):
+        ecarts = plat[b] - plat
+        if faiblement:
+            par_b = np.all(ecarts >= -seuil, axis=1) & (ecarts.sum(axis=1) > seuil)
+        else:
+            par_b = np.all(ecarts > seuil, axis=1)
+        dominee |= par_b
+
+    autres = _meilleur_des_autres(plat)
+    meilleure_reponse = np.any(plat > autres + seuil if faiblement else plat >= autres - seuil, axis=1)
+
+    candidats = np.flatnonzero(~dominee & ~meilleure_reponse)
+    if len(candidats):
+        dominee[candidats] = _programmes_dominance(plat, candidats, faiblement, tolerance)
+    return dominee, len(candidats)
+
+
+class MoteurDominanceMixte:
+    """
+    Élimination itérée des stratégies dominées par des stratégies pures ou
+    mixtes (strictement, ou faiblement si `faiblement`). Pour chaque joueur,
+    les stratégies actives sont testées d'un bloc (strategies_dominees_melange)
+    et le test n'est refait que lorsque des stratégies ont disparu depuis.
+
+    L'ordre d'élimination ne change pas le résultat de la dominance stricte,
+    mais change celui de la dominance faible :
+        "simultane": à chaque tour, toutes les stratégies dominées de tous les joueurs
+        "par_joueur": toutes celles du premier joueur qui en a, puis on recommence
+        "une_a_une": la plus petite dominée du premier joueur qui en a
+    """
+
+    def __init__(self, gains: List[np.ndarray], faiblement: bool = False, tolerance: float = 1e-9):
+        self.gains = gains
+        self.faiblement = faiblement
+        self.tolerance = tolerance
+        self.n_joueurs = len(gains)
+        self.actives = [np.arange(s) for s in gains[0].shape]
+        self._dominees: List[Optional[np.ndarray]] = [None] * self.n_joueurs
+        # Programmes linéaires résolus et cellules de gains lues (instrumentation)
+        self.programmes = 0
+        self.lectures = 0
+
+    def strategies_dominees(self, i: int) -> np.ndarray:
+        """Stratégies actives du joueur i dominées par un mélange de ses stratégies actives"""
+        if self._dominees[i] is None:
+            plat = _tranches(self.gains[i], i, self.actives[i], self.actives)
+            self.lectures += plat.size
+            masque, programmes = strategies_dominees_melange(plat, self.faiblement, self.tolerance)
+            self.programmes += programmes
+            self._dominees[i] = self.actives[i][masque]
+        return self._dominees[i]
+
+    def eliminer(self, i: int, strategies: np.ndarray):
+        self.actives[i] = self.actives[i][~np.isin(self.actives[i], strategies)]
+        for j in range(self.n_joueurs):
+            if j != i:
+                self._dominees[j] = None
+        if self.faiblement:
+            # Un mélange faiblement dominant peut reposer sur une stratégie éliminée
+            self._dominees[i] = None
+        elif self._dominees[i] is not None:
+            self._dominees[i] = self._dominees[i][~np.isin(self._dominees[i], strategies)]
+
+    def executer(self, ordre: str = "simultane",
+                 progression: Optional[Callable[[float], None]] = None) -> List[Tuple[int, int]]:
+        """
+        Élimine jusqu'à stabilité ; retourne les couples (joueur, stratégie) dans
+        l'ordre d'élimination. `progression` est appelé avant le test de chaque
+        joueur (fraction des stratégies éliminables déjà retirées).
+        """
+        if ordre not in ORDRES_ELIMINATION:
+            raise ValueError(f"Ordre d'élimination inconnu: {ordre}")
+        eliminations: List[Tuple[int, int]] = []
+        eliminables = max(1, sum(len(act) - 1 for act in self.actives))
+
+        def dominees_de(i: int) -> np.ndarray:
+            if progression is not None:
+                progression(len(eliminations) / eliminables)
+            return self.strategies_dominees(i)
+
+        while True:
+            if ordre == "simultane":
+                tour = [(i, dominees_de(i)) for i in range(self.n_joueurs)]
+                tour = [(i, d) for i, d in tour if len(d)]
+            else:
+                tour = []
+                for i in range(self.n_joueurs):
+                    dominees = dominees_de(i)
+                    if len(dominees):
+                        tour = [(i, dominees if ordre == "par_joueur" else dominees[:1])]
+                        break
+            if not tour:
+                return eliminations
+            for i, dominees in tour:
+                self.eliminer(i, dominees)
+                eliminations.extend((i, int(strat)) for strat in dominees)
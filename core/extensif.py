@@ -0,0 +1,313 @@
+"""
+Jeux sous forme extensive stockés dans des tableaux plats, sans objet Python
+par nœud :
+
+    parent[v]          nœud parent (-1 pour la racine, qui est le nœud 0)
+    joueur[v]          axe du joueur qui décide en v, TERMINAL ou HASARD
+    gains[v]           gains (n_joueurs,) des nœuds terminaux
+    probabilites[v]    probabilité de l'arête parent -> v si le parent est un
+                       nœud de hasard (1 sinon)
+    ensemble_info[v]   ensemble d'information des nœuds de décision (-1 sinon)
+
+Les enfants sont rangés au format CSR (debut_enfants, enfants) : l'action a
+d'un nœud v mène à enfants[debut_enfants[v] + a], dans l'ordre des indices
+des enfants. Les algorithmes procèdent niveau par niveau, par opérations
+vectorisées (réductions par segments), sans récursion.
+"""
+import numpy as np
+from itertools import product
+from typing import Dict, List, Optional, Tuple
+from .modeles import Jeu, Joueur
+
+TERMINAL = -1
+HASARD = -2
+
+# Taille maximale (en cellules) d'un tenseur dense produit par vers_jeu()
+_MAX_CELLULES_DENSE = 1 << 24
+# Axes utilisables par np.einsum (un pour les feuilles, un par joueur)
+_MAX_AXES_EINSUM = 52
+
+
+class JeuExtensif:
+    __slots__ = ("joueurs", "parent", "joueur", "gains", "probabilites", "ensemble_info",
+                 "debut_enfants", "enfants", "_niveaux", "_n_ensembles")
+
+    def __init__(self, joueurs: List[Joueur], parent: np.ndarray, joueur: np.ndarray, gains: np.ndarray,
+                 probabilites: Optional[np.ndarray] = None, ensemble_info: Optional[np.ndarray] = None):
+        """
+        Les stratégies des `joueurs` ne servent qu'aux noms ; les actions sont
+        les enfants de chaque nœud. Sans `ensemble_info`, l'information est
+        parfaite (un ensemble par nœud de décision).
+        """
+        self.joueurs = joueurs
+        self.parent = np.asarray(parent, dtype=np.int64)
+        n = len(self.parent)
+        self.joueur = np.asarray(joueur, dtype=np.int8 if len(joueurs) < 127 else np.int32)
+        self.gains = np.asarray(gains, dtype=np.float64)
+        self.probabilites = np.ones(n) if probabilites is None else np.asarray(probabilites, dtype=np.float64)
+        if ensemble_info is None:
+            ensemble_info = np.where(self.joueur >= 0, np.arange(n), -1)
+        self.ensemble_info = np.asarray(ensemble_info, dtype=np.int64)
+
+        if n == 0 or self.parent[0] != -1:
+            raise ValueError("Le nœud 0 doit être la racine (parent -1)")
+        if self.joueur.shape != (n,) or self.probabilites.shape != (n,) or self.ensemble_info.shape != (n,):
+            raise ValueError("parent, joueur, probabilites et ensemble_info doivent avoir un élément par nœud")
+        if self.gains.shape != (n, len(joueurs)):
+            raise ValueError(f"Dimensions incorrectes pour les gains: {self.gains.shape}")
+        if np.any(self.parent[1:] < 0) or np.any(self.parent >= n):
+            raise ValueError("Parent hors limites (un seul nœud racine, le nœud 0)")
+        if np.any(self.joueur < HASARD) or np.any(self.joueur >= len(joueurs)):
+            raise ValueError("Joueur hors limites")
+
+        # Enfants au format CSR : tri stable des nœuds par parent
+        ordre = np.argsort(self.parent[1:], kind="stable") + 1
+        self.enfants = ordre
+        self.debut_enfants = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.parent[1:], minlength=n), out=self.debut_enfants[1:])
+        self._niveaux: Optional[List[np.ndarray]] = None
+        self._valider()
+
+    @property
+    def n_noeuds(self) -> int:
+        return len(self.parent)
+
+    @property
+    def n_joueurs(self) -> int:
+        return len(self.joueurs)
+
+    def n_actions(self) -> np.ndarray:
+        return np.diff(self.debut_enfants)
+
+    def enfants_de(self, noeud: int) -> np.ndarray:
+        return self.enfants[self.debut_enfants[noeud]:self.debut_enfants[noeud + 1]]
+
+    def actions_entrantes(self) -> np.ndarray:
+        """Action du parent qui mène à chaque nœud (-1 pour la racine)"""
+        action = np.full(self.n_noeuds, -1, dtype=np.int64)
+        action[self.enfants] = np.arange(self.n_noeuds - 1) - self.debut_enfants[self.parent[self.enfants]]
+        return action
+
+    def niveaux(self) -> List[np.ndarray]:
+        """Nœuds par profondeur (parcours en largeur vectorisé), calculés une fois"""
+        if self._niveaux is None:
+            niveaux = []
+            courant = np.zeros(1, dtype=np.int64)
+            vus = 0
+            while len(courant):
+                niveaux.append(courant)
+                vus += len(courant)
+                if vus > self.n_noeuds:
+                    raise ValueError("Le graphe des parents contient un cycle")
+                courant = self.enfants[_positions_enfants(self.debut_enfants, courant)[0]]
+            if vus != self.n_noeuds:
+                raise ValueError("Certains nœuds ne descendent pas de la racine")
+            self._niveaux = niveaux
+        return self._niveaux
+
+    @property
+    def information_parfaite(self) -> bool:
+        return self._n_ensembles == int(np.count_nonzero(self.joueur >= 0))
+
+    def _valider(self):
+        n_actions = self.n_actions()
+        if np.any((n_actions == 0) != (self.joueur == TERMINAL)):
+            raise ValueError("Un nœud est terminal si et seulement s'il n'a pas d'enfant")
+        hasard = np.flatnonzero(self.joueur == HASARD)
+        if len(hasard):
+            positions, segments = _positions_enfants(self.debut_enfants, hasard)
+            sommes = np.add.reduceat(self.probabilites[self.enfants[positions]], segments)
+            if not np.allclose(sommes, 1.0) or np.any(self.probabilites[self.enfants[positions]] < 0):
+                raise ValueError("Les probabilités des enfants d'un nœud de hasard doivent sommer à 1")
+        decisions = np.flatnonzero(self.joueur >= 0)
+        if np.any(self.ensemble_info[decisions] < 0):
+            raise ValueError("Chaque nœud de décision doit appartenir à un ensemble d'information")
+        # Un ensemble d'information : un seul joueur, le même nombre d'actions
+        ordre = decisions[np.argsort(self.ensemble_info[decisions], kind="stable")]
+        cles = self.ensemble_info[ordre]
+        debuts = np.flatnonzero(np.r_[True, cles[1:] != cles[:-1]]) if len(ordre) else np.empty(0, dtype=np.int64)
+        for valeurs in (self.joueur[ordre].astype(np.int64), n_actions[ordre]):
+            if len(debuts) and np.any(np.minimum.reduceat(valeurs, debuts) != np.maximum.reduceat(valeurs, debuts)):
+                raise ValueError("Les nœuds d'un ensemble d'information doivent avoir le même joueur et les mêmes actions")
+        self._n_ensembles = len(debuts)
+        self.niveaux()
+
+    def vers_jeu(self) -> Jeu:
+        """
+        Forme normale (petits arbres uniquement) : une stratégie pure d'un
+        joueur choisit une action dans chacun de ses ensembles d'information
+        (nommée par ces actions, dans l'ordre des ensembles) ; les gains sont
+        espérés sur les nœuds de hasard.
+        """
+        n_actions = self.n_actions()
+        decisions = np.flatnonzero(self.joueur >= 0)
+        ensembles_joueurs: List[np.ndarray] = []
+        tailles_actions: List[List[int]] = []
+        for k in range(self.n_joueurs):
+            noeuds = decisions[self.joueur[decisions] == k]
+            ensembles, premiers = np.unique(self.ensemble_info[noeuds], return_index=True)
+            ensembles_joueurs.append(ensembles)
+            tailles_actions.append(n_actions[noeuds[premiers]].tolist())
+        if self.n_joueurs >= _MAX_AXES_EINSUM:
+            raise ValueError(f"Forme normale limitée à {_MAX_AXES_EINSUM - 1} joueurs")
+        forme = tuple(int(np.prod(t, dtype=np.float64)) for t in tailles_actions)
+        if np.prod(forme, dtype=np.float64) * self.n_joueurs > _MAX_CELLULES_DENSE:
+            raise ValueError("Arbre trop grand pour une représentation dense")
+
+        # Pour chaque feuille : probabilité des coups de hasard et actions exigées sur son chemin
+        feuilles = np.flatnonzero(self.joueur == TERMINAL)
+        proba, exigences = self._chemins(feuilles)
+        # compatible[k][f, s] : la stratégie s du joueur k joue toutes les actions exigées de la feuille f
+        tenseur = np.empty((self.n_joueurs,) + forme)
+        facteurs = []
+        for k in range(self.n_joueurs):
+            strategies = np.array(list(product(*[range(t) for t in tailles_actions[k]])), dtype=np.int64)
+            strategies = strategies.reshape(forme[k], len(tailles_actions[k]))
+            colonne = {int(e): c for c, e in enumerate(ensembles_joueurs[k])}
+            compatible = np.ones((len(feuilles), forme[k]), dtype=bool)
+            for f, actions in enumerate(exigences):
+                for ensemble, action in actions.get(k, ()):
+                    compatible[f] &= strategies[:, colonne[ensemble]] == action
+            facteurs.append(compatible.astype(np.float64))
+        # Contraction par joueur, sans intermédiaire (feuilles, *forme) : axe 0 pour les
+        # feuilles, axe k + 1 pour les stratégies du joueur k
+        operandes = []
+        for k, facteur in enumerate(facteurs):
+            operandes += [facteur, [0, k + 1]]
+        sortie = list(range(1, self.n_joueurs + 1))
+        taille_max = max(int(np.prod(forme, dtype=np.int64)), len(feuilles))
+        for k in range(self.n_joueurs):
+            tenseur[k] = np.einsum(proba * self.gains[feuilles, k], [0], *operandes, sortie,
+                                   optimize=("greedy", taille_max))
+
+        joueurs = [Joueur(j.id, [".".join(map(str, s)) if s else "-"
+                                 for s in product(*[range(t) for t in tailles_actions[k]])])
+                   for k, j in enumerate(self.joueurs)]
+        return Jeu.depuis_tenseur(joueurs, tenseur)
+
+    def _chemins(self, feuilles: np.ndarray) -> Tuple[np.ndarray, List[Dict[int, List[Tuple[int, int]]]]]:
+        """Probabilité de hasard et (ensemble, action) exigés par joueur sur le chemin de chaque feuille"""
+        action = self.actions_entrantes()
+        proba = np.ones(len(feuilles))
+        exigences: List[Dict[int, List[Tuple[int, int]]]] = []
+        for f, feuille in enumerate(feuilles):
+            actions: Dict[int, List[Tuple[int, int]]] = {}
+            v = feuille
+            while v != 0:
+                p = self.parent[v]
+                if self.joueur[p] == HASARD:
+                    proba[f] *= self.probabilites[v]
+                else:
+                    actions.setdefault(int(self.joueur[p]), []).append((int(self.ensemble_info[p]), int(action[v])))
+                v = p
+            exigences.append(actions)
+        return proba, exigences
+
+
+def _positions_enfants(debut_enfants: np.ndarray, noeuds: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Positions (dans `enfants`) des enfants de `noeuds`, concaténées, et début
+    de chaque segment (nœuds sans enfant exclus des segments vides : à
+    n'utiliser avec reduceat que pour des nœuds qui ont des enfants).
+    """
+    debuts = debut_enfants[noeuds]
+    comptes = debut_enfants[noeuds + 1] - debuts
+    segments = np.zeros(len(noeuds), dtype=np.int64)
+    np.cumsum(comptes[:-1], out=segments[1:])
+    positions = np.arange(int(comptes.sum()), dtype=np.int64) + np.repeat(debuts - segments, comptes)
+    return positions, segments
+
+
+class AnalyseurExtensif:
+    def __init__(self, jeu: JeuExtensif):
+        self.jeu = jeu
+
+    def induction_arriere(self) -> Dict[str, np.ndarray]:
+        """
+        Équilibre parfait en sous-jeux (information parfaite) par induction
+        à rebours, des feuilles vers la racine, un niveau à la fois. À égalité,
+        un joueur choisit sa plus petite action. Retourne un dictionnaire :
+            "valeurs": gains (n_noeuds, n_joueurs) du sous-jeu de chaque nœud
+            "choix": action choisie en chaque nœud de décision (-1 ailleurs)
+            "gains": gains de l'équilibre (valeurs de la racine)
+            "atteints": nœuds atteints avec une probabilité non nulle
+        """
+        jeu = self.jeu
+        if not jeu.information_parfaite:
+            raise ValueError("L'induction à rebours requiert un jeu à information parfaite")
+        valeurs = np.where((jeu.joueur == TERMINAL)[:, None], jeu.gains, 0.0)
+        choix = np.full(jeu.n_noeuds, -1, dtype=np.int64)
+
+        for niveau in reversed(jeu.niveaux()):
+            joueurs = jeu.joueur[niveau]
+            hasard = niveau[joueurs == HASARD]
+            if len(hasard):
+                positions, segments = _positions_enfants(jeu.debut_enfants, hasard)
+                enfants = jeu.enfants[positions]
+                ponderees = valeurs[enfants] * jeu.probabilites[enfants][:, None]
+                valeurs[hasard] = np.add.reduceat(ponderees, segments, axis=0)
+
+            decision = joueurs >= 0
+            if decision.any():
+                noeuds = niveau[decision]
+                positions, segments = _positions_enfants(jeu.debut_enfants, noeuds)
+                # Gain de chaque enfant pour le joueur qui décide au parent
+                comptes = np.diff(np.r_[segments, len(positions)])
+                propre = valeurs[jeu.enfants[positions], np.repeat(joueurs[decision].astype(np.int64), comptes)]
+                meilleur = np.maximum.reduceat(propre, segments)
+                rang = np.arange(len(positions)) - np.repeat(segments, comptes)
+                candidats = np.where(propre == np.repeat(meilleur, comptes), rang, len(positions))
+                action = np.minimum.reduceat(candidats, segments)
+                choix[noeuds] = action
+                valeurs[noeuds] = valeurs[jeu.enfants[jeu.debut_enfants[noeuds] + action]]
+
+        return {"valeurs": valeurs, "choix": choix, "gains": valeurs[0].copy(),
+                "atteints": self._atteints(choix)}
+
+    def _atteints(self, choix: np.ndarray) -> np.ndarray:
+        """Nœuds atteints en suivant `choix` (et toute branche de hasard de probabilité non nulle)"""
+        jeu = self.jeu
+        action = jeu.actions_entrantes()
+        atteint = np.zeros(jeu.n_noeuds, dtype=bool)
+        atteint[0] = True
+        for niveau in jeu.niveaux()[1:]:
+            parents = jeu.parent[niveau]
+            suivi = np.where(jeu.joueur[parents] == HASARD, jeu.probabilites[niveau] > 0,
+                             choix[parents] == action[niveau])
+            atteint[niveau] = atteint[parents] & suivi
+        return atteint
+
+
+def generer_arbre_aleatoire(branchement: int, profondeur: int, n_joueurs: int = 2, graine: Optional[int] = None,
+                            bas: int = 0, haut: int = 10, proba_hasard: float = 0.0) -> JeuExtensif:
+    """
+    Arbre complet reproductible : `branchement` actions par nœud interne,
+    feuilles à `profondeur`. Les joueurs décident à tour de rôle selon la
+    profondeur ; chaque nœud interne est un nœud de hasard avec la
+    probabilité `proba_hasard`. Gains entiers uniformes dans [bas, haut].
+    """
+    if branchement < 1 or profondeur < 0 or n_joueurs < 1:
+        raise ValueError("Paramètres d'arbre invalides")
+    rng = np.random.default_rng(graine)
+    n_internes = sum(branchement ** d for d in range(profondeur))
+    n = n_internes + branchement ** profondeur
+    parent = np.empty(n, dtype=np.int64)
+    parent[0] = -1
+    parent[1:] = np.arange(n - 1) // branchement
+    joueur = np.full(n, TERMINAL, dtype=np.int8 if n_joueurs < 127 else np.int32)
+    debut = 0
+    for d in range(profondeur):
+        taille = branchement ** d
+        joueur[debut:debut + taille] = d % n_joueurs
+        debut += taille
+    hasard = np.flatnonzero(rng.random(n_internes) < proba_hasard)
+    joueur[hasard] = HASARD
+    probabilites = np.ones(n)
+    if len(hasard):
+        tirages = rng.random((len(hasard), branchement)) + 1e-3
+        enfants = 1 + hasard[:, None] * branchement + np.arange(branchement)
+        probabilites[enfants] = tirages / tirages.sum(axis=1, keepdims=True)
+    gains = np.zeros((n, n_joueurs))
+    gains[n_internes:] = rng.integers(bas, haut, size=(n - n_internes, n_joueurs), endpoint=True)
+    joueurs = [Joueur(k + 1, []) for k in range(n_joueurs)]
+    return JeuExtensif(joueurs, parent, joueur, gains, probabilites)
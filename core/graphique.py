@@ -0,0 +1,260 @@
+"""
+Jeux graphiques et polymatriciels : chaque joueur n'interagit qu'avec ses
+voisins, et ses gains sont stockés dans des tables locales au lieu d'un
+tenseur sur tous les profils.
+
+- JeuGraphique : table locale par joueur, de forme (s_i, s_v1, ..., s_vk)
+  pour ses voisins v1..vk.
+- JeuPolymatriciel : une matrice (s_i, s_j) par arête orientée (i, j) ; le
+  gain de i est la somme de ses gains contre chacun de ses voisins.
+"""
+from abc import ABC, abstractmethod
+import numpy as np
+from typing import Dict, Iterator, List, Optional, Tuple
+from .modeles import Jeu, Joueur
+
+# Taille maximale (en cellules) d'un tenseur dense produit par vers_jeu()
+_MAX_CELLULES_DENSE = 1 << 24
+
+
+class _JeuLocal(ABC):
+    """Partie commune : joueurs, voisinages et conversion vers un Jeu dense."""
+
+    __slots__ = ("joueurs", "voisins", "_position")
+
+    def __init__(self, joueurs: List[Joueur], voisins: Dict[int, List[int]]):
+        self.joueurs = joueurs
+        self._position = {j.id: k for k, j in enumerate(joueurs)}
+        self.voisins = {}
+        for j in joueurs:
+            liste = list(voisins.get(j.id, []))
+            if j.id in liste or len(set(liste)) != len(liste):
+                raise ValueError(f"Voisinage invalide pour le joueur {j.id}")
+            for v in liste:
+                if v not in self._position:
+                    raise ValueError(f"Voisin inconnu {v} pour le joueur {j.id}")
+            self.voisins[j.id] = liste
+
+    @property
+    def forme(self) -> Tuple[int, ...]:
+        return tuple(len(j.strategies) for j in self.joueurs)
+
+    def position(self, id_joueur: int) -> int:
+        """Rang du joueur dans les profils (tuples dans l'ordre de `joueurs`)"""
+        return self._position[id_joueur]
+
+    @abstractmethod
+    def vecteur_gains(self, id_joueur: int, profil: Tuple[int, ...]) -> np.ndarray:
+        """Gains du joueur pour chacune de ses stratégies, les autres jouant `profil`"""
+
+    @abstractmethod
+    def minima_par_strategie(self, id_joueur: int) -> np.ndarray:
+        """Pire gain de chaque stratégie du joueur sur toutes les stratégies de ses voisins"""
+
+    def gain(self, id_joueur: int, profil: Tuple[int, ...]) -> float:
+        return self.vecteur_gains(id_joueur, profil)[profil[self.position(id_joueur)]]
+
+    def vers_jeu(self) -> Jeu:
+        """Jeu dense équivalent (petits jeux uniquement)"""
+        forme = self.forme
+        if np.prod(forme, dtype=np.float64) * len(forme) > _MAX_CELLULES_DENSE:
+            raise ValueError("Jeu trop grand pour une représentation dense")
+        gains = {j.id: self._tenseur_dense(j.id) for j in self.joueurs}
+        return Jeu(self.joueurs, gains)
+
+    @abstractmethod
+    def _tenseur_dense(self, id_joueur: int) -> np.ndarray:
+        """Tenseur dense (forme du jeu) des gains du joueur"""
+
+    def _axes(self, id_joueur: int) -> List[int]:
+        """Axes du tenseur dense pour le joueur puis ses voisins"""
+        return [self.position(id_joueur)] + [self.position(v) for v in self.voisins[id_joueur]]
+
+
+class JeuGraphique(_JeuLocal):
+    __slots__ = ("gains",)
+
+    def __init__(self, joueurs: List[Joueur], voisins: Dict[int, List[int]], gains: Dict[int, np.ndarray]):
+        super().__init__(joueurs, voisins)
+        self.gains = {}
+        for j in joueurs:
+            attendu = (len(j.strategies),) + tuple(len(joueurs[self.position(v)].strategies) for v in self.voisins[j.id])
+            table = np.asarray(gains[j.id])
+            if table.shape != attendu:
+                raise ValueError(f"Dimensions incorrectes pour le joueur {j.id}")
+            self.gains[j.id] = table
+
+    def vecteur_gains(self, id_joueur: int, profil: Tuple[int, ...]) -> np.ndarray:
+        index = tuple(profil[self.position(v)] for v in self.voisins[id_joueur])
+        return self.gains[id_joueur][(slice(None),) + index]
+
+    def minima_par_strategie(self, id_joueur: int) -> np.ndarray:
+        table = self.gains[id_joueur]
+        return table.reshape(table.shape[0], -1).min(axis=1)
+
+    def _tenseur_dense(self, id_joueur: int) -> np.ndarray:
+        table = self.gains[id_joueur]
+        axes = self._axes(id_joueur)
+        # Axes locaux rangés dans l'ordre des joueurs, les autres axes de taille 1
+        ordre = np.argsort(axes)
+        forme = [1] * len(self.joueurs)
+        for a in axes:
+            forme[a] = self.forme[a]
+        return np.broadcast_to(np.transpose(table, ordre).reshape(forme), self.forme)
+
+
+class JeuPolymatriciel(_JeuLocal):
+    __slots__ = ("matrices",)
+
+    def __init__(self, joueurs: List[Joueur], matrices: Dict[Tuple[int, int], np.ndarray]):
+        voisins: Dict[int, List[int]] = {j.id: [] for j in joueurs}
+        for i, j in sorted(matrices):
+            if i not in voisins:
+                raise ValueError(f"Joueur inconnu {i}")
+            voisins[i].append(j)
+        super().__init__(joueurs, voisins)
+        self.matrices = {}
+        for (i, j), matrice in matrices.items():
+            matrice = np.asarray(matrice)
+            attendu = (len(joueurs[self.position(i)].strategies), len(joueurs[self.position(j)].strategies))
+            if matrice.shape != attendu:
+                raise ValueError(f"Dimensions incorrectes pour l'arête ({i}, {j})")
+            self.matrices[(i, j)] = matrice
+
+    def vecteur_gains(self, id_joueur: int, profil: Tuple[int, ...]) -> np.ndarray:
+        total = np.zeros(len(self.joueurs[self.position(id_joueur)].strategies))
+        for v in self.voisins[id_joueur]:
+            total += self.matrices[(id_joueur, v)][:, profil[self.position(v)]]
+        return total
+
+    def minima_par_strategie(self, id_joueur: int) -> np.ndarray:
+        # Gain additif et voisins indépendants : le pire cas se prend arête par arête
+        total = np.zeros(len(self.joueurs[self.position(id_joueur)].strategies))
+        for v in self.voisins[id_joueur]:
+            total += self.matrices[(id_joueur, v)].min(axis=1)
+        return total
+
+    def _tenseur_dense(self, id_joueur: int) -> np.ndarray:
+        i = self.position(id_joueur)
+        dense = np.zeros(self.forme)
+        for v in self.voisins[id_joueur]:
+            j = self.position(v)
+            forme = [1] * len(self.joueurs)
+            forme[i], forme[j] = self.forme[i], self.forme[j]
+            matrice = self.matrices[(id_joueur, v)]
+            dense += (matrice if i < j else matrice.T).reshape(forme)
+        return dense
+
+
+class AnalyseurGraphique:
+    """
+    Analyses sur les tables locales : meilleures réponses, niveaux de
+    sécurité et équilibres de Nash purs par recherche avec retour arrière,
+    la condition d'un joueur étant vérifiée dès que lui et ses voisins sont fixés.
+    """
+
+    def __init__(self, jeu: _JeuLocal):
+        self.jeu = jeu
+
+    def meilleure_reponse(self, id_joueur: int, profil: Tuple[int, ...], epsilon: float = 0.0) -> List[int]:
+        gains = self.jeu.vecteur_gains(id_joueur, profil)
+        return np.flatnonzero(gains >= gains.max() - epsilon).tolist()
+
+    def est_equilibre(self, profil: Tuple[int, ...], epsilon: float = 0.0) -> bool:
+        for j in self.jeu.joueurs:
+            gains = self.jeu.vecteur_gains(j.id, profil)
+            if gains[profil[self.jeu.position(j.id)]] < gains.max() - epsilon:
+                return False
+        return True
+
+    def niveau_securite(self, id_joueur: int) -> Tuple[float, int]:
+        """Niveau de sécurité pour un joueur"""
+        minima = self.jeu.minima_par_strategie(id_joueur)
+        meilleure_strat = int(np.argmax(minima))
+        return (minima[meilleure_strat], meilleure_strat)
+
+    def equilibre_nash(self, epsilon: float = 0.0, limite: Optional[int] = None) -> List[Tuple[int, ...]]:
+        return list(self.iter_equilibres_nash(epsilon, limite))
+
+    def iter_equilibres_nash(self, epsilon: float = 0.0, limite: Optional[int] = None) -> Iterator[Tuple[int, ...]]:
+        """Équilibres de Nash purs, produits au fil de la recherche"""
+        if limite is not None and limite <= 0:
+            return
+        joueurs = self.jeu.joueurs
+        n = len(joueurs)
+        ordre = self._ordre_affectation()
+        rang = np.empty(n, dtype=int)
+        rang[ordre] = np.arange(n)
+
+        # Joueurs dont la condition devient vérifiable quand la position p est fixée
+        a_verifier: List[List[int]] = [[] for _ in range(n)]
+        for j in joueurs:
+            portee = [self.jeu.position(j.id)] + [self.jeu.position(v) for v in self.jeu.voisins[j.id]]
+            a_verifier[max(rang[p] for p in portee)].append(j.id)
+
+        domaines = [self._domaine(joueurs[p].id, epsilon) for p in ordre]
+        profil = [0] * n
+        choix = [0] * n  # indice du prochain essai dans le domaine, par profondeur
+        profondeur, trouves = 0, 0
+        while profondeur >= 0:
+            if choix[profondeur] == len(domaines[profondeur]):
+                choix[profondeur] = 0
+                profondeur -= 1
+                continue
+            position = ordre[profondeur]
+            profil[position] = domaines[profondeur][choix[profondeur]]
+            choix[profondeur] += 1
+
+            courant = tuple(profil)
+            if not all(self._satisfait(id_j, courant, epsilon) for id_j in a_verifier[profondeur]):
+                continue
+            if profondeur == n - 1:
+                yield courant
+                trouves += 1
+                if trouves == limite:
+                    return
+            else:
+                profondeur += 1
+
+    def _satisfait(self, id_joueur: int, profil: Tuple[int, ...], epsilon: float) -> bool:
+        gains = self.jeu.vecteur_gains(id_joueur, profil)
+        return gains[profil[self.jeu.position(id_joueur)]] >= gains.max() - epsilon
+
+    def _domaine(self, id_joueur: int, epsilon: float) -> List[int]:
+        """Stratégies qui sont une meilleure réponse pour au moins une configuration des voisins"""
+        if isinstance(self.jeu, JeuGraphique):
+            table = self.jeu.gains[id_joueur]
+            meilleure = table >= table.max(axis=0, keepdims=True) - epsilon
+            return np.flatnonzero(meilleure.reshape(table.shape[0], -1).any(axis=1)).tolist()
+        return list(range(len(self.jeu.joueurs[self.jeu.position(id_joueur)].strategies)))
+
+    def _ordre_affectation(self) -> List[int]:
+        """
+        Parcours en largeur du graphe d'interaction (depuis le joueur de plus
+        faible degré de chaque composante) : les voisins sont fixés tôt, et
+        les conditions se vérifient le plus vite possible.
+        """
+        n = len(self.jeu.joueurs)
+        adjacence: List[set] = [set() for _ in range(n)]
+        for j in self.jeu.joueurs:
+            p = self.jeu.position(j.id)
+            for v in self.jeu.voisins[j.id]:
+                q = self.jeu.position(v)
+                adjacence[p].add(q)
+                adjacence[q].add(p)
+
+        vu = [False] * n
+        ordre: List[int] = []
+        for depart in sorted(range(n), key=lambda p: len(adjacence[p])):
+            if vu[depart]:
+                continue
+            vu[depart] = True
+            file = [depart]
+            while file:
+                p = file.pop(0)
+                ordre.append(p)
+                for q in sorted(adjacence[p], key=lambda q: len(adjacence[q])):
+                    if not vu[q]:
+                        vu[q] = True
+                        file.append(q)
+        return ordre
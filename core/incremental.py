@@ -0,0 +1,270 @@
+"""
+Réanalyse incrémentale d'un jeu dont on modifie quelques gains (analyses
+« et si »). L'analyseur garde l'état intermédiaire des analyses et, après
+une modification, ne recalcule que ce qu'elle touche :
+
+- Nash : max de chaque fibre (axe propre d'un joueur) et drapeaux de
+  meilleure réponse ; seules les fibres modifiées sont recalculées.
+- Pareto : frontière courante ; seuls la frontière, les profils modifiés et
+  les profils que dominait un ancien point de frontière modifié sont
+  réexaminés (baisser un gain d'un point de la frontière coûte donc de
+  l'ordre du nombre de profils qu'il dominait).
+- Dominance : pour chaque paire de stratégies (a, b) d'un joueur, nombre de
+  profils adverses où a fait strictement mieux / au moins aussi bien que b ;
+  seuls les profils adverses modifiés sont recomptés.
+
+Le jeu est modifié en place.
+"""
+import numpy as np
+from itertools import product
+from typing import Dict, List, Optional, Tuple, Union
+from .modeles import Jeu, _verifier_plage
+from .pareto import frontiere_pareto, _comparer
+from .dominance import MoteurIESDS
+
+Index = Tuple[Union[int, slice], ...]
+
+_CELLULES_PAR_PAQUET = 1 << 22
+_TRANCHE_FRONT = 64
+_TAILLE_ECHANTILLON = 256
+# Au-delà de cette fraction de profils modifiés, la frontière est recalculée entièrement
+_FRACTION_RECALCUL_PARETO = 0.125
+
+
+def _compter_paires(plat: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pour un tableau (s, M) (une ligne par stratégie), nombres de colonnes
+    où la ligne a est > (resp. >=) la ligne b, de forme (s, s).
+    """
+    s, m = plat.shape
+    superieur = np.zeros((s, s), dtype=np.int64)
+    sup_egal = np.zeros((s, s), dtype=np.int64)
+    pas = max(1, _CELLULES_PAR_PAQUET // max(s * s, 1))
+    for debut in range(0, m, pas):
+        bloc = plat[:, debut:debut + pas]
+        for a in range(s):
+            superieur[a] += np.count_nonzero(bloc[a] > bloc, axis=1)
+            sup_egal[a] += np.count_nonzero(bloc[a] >= bloc, axis=1)
+    return superieur, sup_egal
+
+
+def _domines(cibles: np.ndarray, front: np.ndarray) -> np.ndarray:
+    """Masque des lignes de `cibles` strictement dominées par une ligne de `front`"""
+    domine = np.zeros(len(cibles), dtype=bool)
+    if len(cibles) == 0 or len(front) == 0:
+        return domine
+    # Les points du front qui dominent le plus de cibles d'un échantillon sont
+    # comparés d'abord, par petites tranches, en ne gardant que les cibles vivantes
+    echantillon = cibles[np.linspace(0, len(cibles) - 1, min(len(cibles), _TAILLE_ECHANTILLON)).astype(int)]
+    ge = np.ones((len(front), len(echantillon)), dtype=bool)
+    for k in range(cibles.shape[1]):
+        ge &= front[:, None, k] >= echantillon[None, :, k]
+    front = front[np.argsort(-ge.sum(axis=1), kind="stable")]
+    vivants = np.arange(len(cibles))
+    debut = 0
+    while debut < len(front) and len(vivants):
+        pas = max(1, min(_TRANCHE_FRONT, _CELLULES_PAR_PAQUET // len(vivants)))
+        d = _comparer(cibles, front[debut:debut + pas])[0]
+        domine[vivants[d]] = True
+        vivants, cibles = vivants[~d], cibles[~d]
+        debut += pas
+    return domine
+
+
+class AnalyseurIncremental:
+    def __init__(self, jeu: Jeu, epsilon: float = 0.0, taille_bloc: int = 4096):
+        self.jeu = jeu
+        self.epsilon = epsilon
+        self.taille_bloc = taille_bloc
+        tenseur = jeu.tenseur
+        n = len(tenseur)
+
+        self._meilleur = [np.max(tenseur[i], axis=i, keepdims=True) for i in range(n)]
+        self._reponse = [tenseur[i] >= self._meilleur[i] - epsilon for i in range(n)]
+        self._nash = np.logical_and.reduce(self._reponse)
+
+        self._frontiere = frontiere_pareto(self._points(), taille_bloc)
+
+        # _superieur[i][a, b] : profils adverses où a fait strictement mieux que b
+        self._superieur, self._sup_egal = [], []
+        for i in range(n):
+            sup, sup_eg = _compter_paires(self._plat(i, tuple(slice(None) for _ in range(n))))
+            self._superieur.append(sup)
+            self._sup_egal.append(sup_eg)
+
+        self._iesds: Optional[Tuple[List[np.ndarray], List[Tuple[int, int]]]] = None
+
+    def _points(self) -> np.ndarray:
+        tenseur = self.jeu.tenseur
+        return tenseur.reshape(len(tenseur), -1).T
+
+    def _plat(self, i: int, region: Index) -> np.ndarray:
+        """Gains du joueur i sur une région complète le long de son axe : (s_i, profils adverses)"""
+        sous = self.jeu.tenseur[i][region]
+        return np.moveaxis(sous, i, 0).reshape(sous.shape[i], -1)
+
+    def _normaliser(self, i: int, index: Index) -> Tuple[Index, Index]:
+        """
+        Index d'une modification en tranches (un entier k devient k:k+1) :
+        retourne (cellules modifiées, mêmes cellules avec l'axe du joueur i complet).
+        """
+        forme = self.jeu.forme
+        if len(index) > len(forme):
+            raise ValueError(f"Index de dimension {len(index)} pour un jeu à {len(forme)} joueurs")
+        cellules = []
+        for axe, taille in enumerate(forme):
+            element = index[axe] if axe < len(index) else slice(None)
+            if isinstance(element, slice):
+                debut, fin, pas = element.indices(taille)
+                if pas != 1:
+                    raise ValueError("Seules les tranches contiguës sont supportées")
+                cellules.append(slice(debut, max(debut, fin)))
+            else:
+                k = int(element)
+                if not -taille <= k < taille:
+                    raise ValueError(f"Stratégie {k} hors limites pour l'axe {axe}")
+                k %= taille
+                cellules.append(slice(k, k + 1))
+        fibres = list(cellules)
+        fibres[i] = slice(None)
+        return tuple(cellules), tuple(fibres)
+
+    def modifier_gain(self, id_joueur: int, profil: Tuple[int, ...], valeur: float):
+        """Change le gain d'un joueur pour un profil"""
+        if len(profil) != self.jeu.n_joueurs:
+            raise ValueError("Le profil doit donner une stratégie par joueur")
+        self.modifier_tranche(id_joueur, tuple(profil), valeur)
+
+    def modifier_tranche(self, id_joueur: int, index: Index, valeurs):
+        """
+        Change les gains d'un joueur sur une tranche de son tenseur
+        (`index` : entiers ou tranches contiguës, un élément par joueur).
+        """
+        i = next((k for k, j in enumerate(self.jeu.joueurs) if j.id == id_joueur), None)
+        if i is None:
+            raise ValueError("Joueur non trouvé")
+        cellules, fibres = self._normaliser(i, index)
+        gains = self.jeu.tenseur[i]
+        _verifier_plage([np.asarray(valeurs)], gains.dtype)
+
+        # Valeurs données pour la tranche `index` telle quelle (les entiers retirent un axe)
+        valeurs = np.broadcast_to(valeurs, gains[tuple(index)].shape).reshape(gains[cellules].shape)
+
+        avant = self._plat(i, fibres).copy()
+        anciens = np.array(gains[cellules], copy=True)
+        gains[cellules] = valeurs
+        modifies = gains[cellules] != anciens
+        if not modifies.any():
+            return
+
+        self._iesds = None
+        self.jeu.signaler_modification()
+        self._maj_nash(i, fibres)
+        self._maj_dominance(i, fibres, avant)
+        self._maj_pareto(i, cellules, anciens, modifies)
+
+    def _maj_nash(self, i: int, fibres: Index):
+        tenseur = self.jeu.tenseur
+        sous = tenseur[i][fibres]
+        meilleur = np.max(sous, axis=i, keepdims=True)
+        reduit = list(fibres)
+        reduit[i] = slice(None)
+        self._meilleur[i][tuple(reduit)] = meilleur
+        self._reponse[i][fibres] = sous >= meilleur - self.epsilon
+        self._nash[fibres] = np.logical_and.reduce([r[fibres] for r in self._reponse])
+
+    def _maj_dominance(self, i: int, fibres: Index, avant: np.ndarray):
+        """Retire les comptes des profils adverses modifiés avant modification, ajoute les nouveaux"""
+        sup_avant, sup_eg_avant = _compter_paires(avant)
+        sup_apres, sup_eg_apres = _compter_paires(self._plat(i, fibres))
+        self._superieur[i] += sup_apres - sup_avant
+        self._sup_egal[i] += sup_eg_apres - sup_eg_avant
+
+    def _maj_pareto(self, i: int, cellules: Index, anciens: np.ndarray, modifies: np.ndarray):
+        forme = self.jeu.forme
+        points = self._points()
+        grilles = np.meshgrid(*[np.arange(forme[a])[cellules[a]] for a in range(len(forme))], indexing="ij")
+        changes = np.ravel_multi_index([g[modifies] for g in grilles], forme)
+
+        if len(changes) > _FRACTION_RECALCUL_PARETO * len(points):
+            self._frontiere = frontiere_pareto(points, self.taille_bloc)
+            return
+
+        # Un profil dominé l'est par un point de la frontière. Il ne peut devenir
+        # non dominé que si ce point a changé : dominé par son ancien vecteur,
+        # il ne l'est plus par le nouveau, qui ne diffère que par une coordonnée
+        # i plus basse. On garde un surensemble : mêmes bornes hors de i, et la
+        # coordonnée i entre la nouvelle et l'ancienne valeur.
+        candidats = [changes]
+        sur_frontiere = np.isin(changes, self._frontiere)
+        for k, ancien in zip(changes[sur_frontiere], anciens[modifies][sur_frontiere]):
+            nouveau = points[k]
+            if nouveau[i] >= ancien:
+                continue
+            colonne = points[:, i]
+            selection = np.flatnonzero((colonne >= nouveau[i]) & (colonne <= ancien))
+            for j in range(points.shape[1]):
+                if j != i:
+                    selection = selection[points[selection, j] <= nouveau[j]]
+            candidats.append(selection)
+
+        garde = self._frontiere[~np.isin(self._frontiere, changes)]
+        selection = np.zeros(len(points), dtype=bool)
+        for c in candidats:
+            selection[c] = True
+        selection[garde] = False
+        candidats = np.flatnonzero(selection)
+        candidats = candidats[~_domines(points[candidats], points[garde])]
+        if len(candidats):
+            candidats = candidats[frontiere_pareto(points[candidats], self.taille_bloc)]
+            garde = garde[~_domines(points[garde], points[candidats])]
+        self._frontiere = np.sort(np.concatenate([garde, candidats]))
+
+    def equilibre_nash(self) -> List[Tuple[int, ...]]:
+        """Équilibres de Nash en stratégies pures (mêmes résultats qu'AnalyseurJeu.equilibre_nash)"""
+        return [tuple(int(i) for i in profil) for profil in np.argwhere(self._nash)]
+
+    def optimum_pareto(self) -> List[Tuple[int, ...]]:
+        """Optima de Pareto (mêmes résultats qu'AnalyseurJeu.optimum_pareto)"""
+        coords = np.unravel_index(self._frontiere, self.jeu.forme)
+        return list(zip(*(c.tolist() for c in coords)))
+
+    def strategies_dominantes(self, id_joueur: int) -> Dict[str, List[int]]:
+        """
+        Stratégies strictement dominantes (meilleures que chaque autre sur tous
+        les profils adverses) et faiblement dominantes (au moins aussi bonnes).
+        """
+        i = next(k for k, j in enumerate(self.jeu.joueurs) if j.id == id_joueur)
+        adverses = self.jeu.tenseur[i].size // self.jeu.forme[i]
+        autres = ~np.eye(self.jeu.forme[i], dtype=bool)
+        return {
+            "strict": np.flatnonzero(np.all((self._superieur[i] == adverses) | ~autres, axis=1)).tolist(),
+            "weak": np.flatnonzero(np.all((self._sup_egal[i] == adverses) | ~autres, axis=1)).tolist(),
+        }
+
+    def strategies_dominees(self, id_joueur: int) -> List[int]:
+        """Stratégies strictement dominées par une autre stratégie pure (sur le jeu complet)"""
+        i = next(k for k, j in enumerate(self.jeu.joueurs) if j.id == id_joueur)
+        adverses = self.jeu.tenseur[i].size // self.jeu.forme[i]
+        return np.flatnonzero(np.any(self._superieur[i].T == adverses, axis=1)).tolist()
+
+    def _elimination(self) -> Tuple[List[np.ndarray], List[Tuple[int, int]]]:
+        """IESDS, recalculée à la demande seulement après une modification"""
+        if self._iesds is None:
+            moteur = MoteurIESDS(list(self.jeu.tenseur))
+            eliminations = moteur.executer()
+            self._iesds = (moteur.actives, eliminations)
+        return self._iesds
+
+    def elimination_strategies_dominantes(self) -> List[Tuple[int, ...]]:
+        actives, _ = self._elimination()
+        return list(product(*[act.tolist() for act in actives]))
+
+    def equilibre_iteratif_dominance_stricte(self) -> Tuple[List[Tuple[int]], List[str]]:
+        actives, eliminations = self._elimination()
+        joueurs = self.jeu.joueurs
+        chemin = [
+            f"Joueur {joueurs[i].id} : stratégie éliminée -> {joueurs[i].strategies[strat]}"
+            for i, strat in eliminations
+        ]
+        return list(product(*[act.tolist() for act in actives])), chemin
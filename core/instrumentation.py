@@ -0,0 +1,154 @@
+"""
+Instrumentation optionnelle du moteur d'analyse : temps d'exécution,
+profils parcourus, cellules de gains lues et comparaisons effectuées, par
+appel de méthode d'AnalyseurJeu. Les mesures sont transmises à des puits
+(résumé en mémoire, journal JSON lines, capture cProfile).
+
+Les compteurs sont calculés d'après les formes des tableaux traités par les
+versions vectorisées (ou relevés par les moteurs incrémentaux), pas cellule
+par cellule : sans instrumentation, une méthode ne paie qu'un test.
+"""
+import cProfile
+import functools
+import json
+import pstats
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+COMPTEURS = ("profils", "lectures", "comparaisons")
+
+
+class Puits:
+    """Destination des mesures ; `debut` et `fin` encadrent chaque appel mesuré."""
+
+    def debut(self, methode: str):
+        pass
+
+    def fin(self, mesure: Dict[str, Any]):
+        pass
+
+
+class PuitsMemoire(Puits):
+    """Garde les dernières mesures et en donne un résumé par méthode."""
+
+    def __init__(self, taille_max: int = 1000):
+        self.mesures: deque = deque(maxlen=taille_max)
+
+    def fin(self, mesure: Dict[str, Any]):
+        self.mesures.append(mesure)
+
+    def resume(self) -> Dict[str, Dict[str, float]]:
+        """{méthode: {appels, duree_totale, duree_max, profils, lectures, comparaisons}}"""
+        resume: Dict[str, Dict[str, float]] = {}
+        for m in self.mesures:
+            r = resume.setdefault(m["methode"], dict(appels=0, duree_totale=0.0, duree_max=0.0,
+                                                     **{c: 0 for c in COMPTEURS}))
+            r["appels"] += 1
+            r["duree_totale"] += m["duree"]
+            r["duree_max"] = max(r["duree_max"], m["duree"])
+            for c in COMPTEURS:
+                r[c] += m[c]
+        return resume
+
+    def vider(self):
+        self.mesures.clear()
+
+
+class PuitsJsonl(Puits):
+    """Ajoute une ligne JSON par mesure au fichier `chemin`."""
+
+    def __init__(self, chemin: str):
+        self.chemin = chemin
+
+    def fin(self, mesure: Dict[str, Any]):
+        with open(self.chemin, "a", encoding="utf-8") as f:
+            f.write(json.dumps(mesure, ensure_ascii=False) + "\n")
+
+
+class PuitsCProfile(Puits):
+    """Profil cProfile cumulé sur tous les appels mesurés."""
+
+    def __init__(self):
+        self.profil = cProfile.Profile()
+
+    def debut(self, methode: str):
+        self.profil.enable()
+
+    def fin(self, mesure: Dict[str, Any]):
+        self.profil.disable()
+
+    def statistiques(self, tri: str = "cumulative") -> pstats.Stats:
+        return pstats.Stats(self.profil).sort_stats(tri)
+
+    def sauvegarder(self, chemin: str):
+        """Écrit le profil au format de pstats (lisible par snakeviz, gprof2dot...)."""
+        self.profil.dump_stats(chemin)
+
+
+class Instrumentation:
+    """
+    Mesure les appels et les transmet aux puits. Seul l'appel le plus
+    externe est mesuré : une méthode qui en appelle une autre ne produit
+    qu'une mesure, qui reçoit les compteurs des deux. La mesure en cours est
+    propre à chaque fil d'exécution (analyses lancées en parallèle).
+    """
+
+    def __init__(self, puits: Optional[List[Puits]] = None):
+        self.puits = list(puits) if puits is not None else [PuitsMemoire()]
+        self._fil = threading.local()
+
+    @property
+    def _en_cours(self) -> Optional[Dict[str, Any]]:
+        return getattr(self._fil, "mesure", None)
+
+    @_en_cours.setter
+    def _en_cours(self, mesure: Optional[Dict[str, Any]]):
+        self._fil.mesure = mesure
+
+    @contextmanager
+    def mesurer(self, methode: str, forme: tuple = ()) -> Iterator[Dict[str, Any]]:
+        if self._en_cours is not None:
+            yield self._en_cours
+            return
+
+        mesure = {"methode": methode, "forme": list(forme), "horodatage": time.time(),
+                  "duree": 0.0, **{c: 0 for c in COMPTEURS}}
+        self._en_cours = mesure
+        for p in self.puits:
+            p.debut(methode)
+        debut = time.perf_counter()
+        try:
+            yield mesure
+        finally:
+            mesure["duree"] = time.perf_counter() - debut
+            self._en_cours = None
+            for p in reversed(self.puits):
+                p.fin(mesure)
+
+    def ajouter(self, profils: int = 0, lectures: int = 0, comparaisons: int = 0):
+        """Ajoute des compteurs à la mesure en cours (sans effet hors mesure)."""
+        mesure = self._en_cours
+        if mesure is not None:
+            mesure["profils"] += int(profils)
+            mesure["lectures"] += int(lectures)
+            mesure["comparaisons"] += int(comparaisons)
+
+    def memoire(self) -> Optional[PuitsMemoire]:
+        """Premier puits en mémoire, s'il y en a un."""
+        return next((p for p in self.puits if isinstance(p, PuitsMemoire)), None)
+
+
+def instrumente(methode: Callable) -> Callable:
+    """Mesure une méthode d'analyseur si son attribut `instrumentation` est défini."""
+
+    @functools.wraps(methode)
+    def enveloppe(self, *args, **kwargs):
+        if self.instrumentation is None:
+            return methode(self, *args, **kwargs)
+        with self.instrumentation.mesurer(methode.__name__, self.jeu.forme):
+            return methode(self, *args, **kwargs)
+
+    return enveloppe
@@ -0,0 +1,146 @@
+import numpy as np
+from typing import Dict, Iterator, List, Tuple
+from .modeles import Jeu
+from .algorithems import _masque_nash
+from .pareto import frontiere_pareto
+
+ANALYSES = ("nash", "pareto", "securite", "dominantes")
+
+# Nombre maximal de comparaisons (profil, profil) matérialisées à la fois pour Pareto
+_PAIRES_PAR_PAQUET = 1 << 24
+
+
+class AnalyseurLot:
+    """
+    Analyse vectorisée d'un lot de jeux de même forme.
+    gains : tenseur (B, n_joueurs, *forme), le joueur i portant ses stratégies
+    sur l'axe i de chaque tenseur de gains. Les jeux sont traités par blocs de
+    `taille_bloc` pour borner la mémoire.
+    """
+
+    def __init__(self, gains: np.ndarray, taille_bloc: int = 1024):
+        gains = np.asarray(gains)
+        if gains.ndim < 3 or gains.ndim != gains.shape[1] + 2:
+            raise ValueError("Les gains doivent être de forme (B, n_joueurs, *forme) avec un axe par joueur")
+        self.gains = gains
+        self.taille_bloc = taille_bloc
+        self.n_jeux = gains.shape[0]
+        self.n_joueurs = gains.shape[1]
+        self.forme = gains.shape[2:]
+
+    @classmethod
+    def depuis_jeux(cls, jeux: List[Jeu], taille_bloc: int = 1024) -> "AnalyseurLot":
+        """Empile des jeux de même forme (joueurs dans l'ordre de jeu.joueurs)."""
+        gains = np.stack([jeu.tenseur for jeu in jeux])
+        return cls(gains, taille_bloc)
+
+    def _blocs(self) -> Iterator[Tuple[slice, np.ndarray]]:
+        for debut in range(0, self.n_jeux, self.taille_bloc):
+            sl = slice(debut, debut + self.taille_bloc)
+            yield sl, self.gains[sl]
+
+    def equilibres_nash(self, epsilon: float = 0.0) -> np.ndarray:
+        """Masque (B, *forme) des équilibres de Nash en stratégies pures."""
+        return self.analyser(epsilon, analyses=("nash",))["nash"]
+
+    def optima_pareto(self) -> np.ndarray:
+        """Masque (B, *forme) des optima de Pareto."""
+        return self.analyser(analyses=("pareto",))["pareto"]
+
+    def niveaux_securite(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Gains garantis (maxmin en stratégies pures) et stratégies de sécurité, chacun de forme (B, n_joueurs)."""
+        return self.analyser(analyses=("securite",))["securite"]
+
+    def strategies_dominantes(self) -> Dict[str, List[np.ndarray]]:
+        """
+        Stratégies strictement et faiblement dominantes : pour chaque joueur,
+        un masque (B, n_strategies).
+        """
+        return self.analyser(analyses=("dominantes",))["dominantes"]
+
+    def analyser(self, epsilon: float = 0.0, analyses: Tuple[str, ...] = ANALYSES) -> Dict[str, object]:
+        """Les analyses demandées, calculées en une seule passe sur les blocs."""
+        inconnues = set(analyses) - set(ANALYSES)
+        if inconnues:
+            raise ValueError(f"Analyses inconnues: {sorted(inconnues)}")
+
+        B, n = self.n_jeux, self.n_joueurs
+        resultat: Dict[str, object] = {}
+        if "nash" in analyses:
+            resultat["nash"] = np.empty((B,) + self.forme, dtype=bool)
+        if "pareto" in analyses:
+            resultat["pareto"] = np.empty((B,) + self.forme, dtype=bool)
+        if "securite" in analyses:
+            resultat["securite"] = (
+                np.empty((B, n), dtype=np.result_type(self.gains.dtype, np.float64)),
+                np.empty((B, n), dtype=np.intp),
+            )
+        if "dominantes" in analyses:
+            resultat["dominantes"] = {
+                "strict": [np.empty((B, s), dtype=bool) for s in self.forme],
+                "weak": [np.empty((B, s), dtype=bool) for s in self.forme],
+            }
+
+        for sl, g in self._blocs():
+            if "nash" in analyses:
+                resultat["nash"][sl] = _masque_nash([g[:, i] for i in range(n)], epsilon, decalage=1)
+            if "pareto" in analyses:
+                resultat["pareto"][sl] = self._pareto_bloc(g)
+            if "securite" in analyses:
+                valeurs, strategies = resultat["securite"]
+                valeurs[sl], strategies[sl] = self._securite_bloc(g)
+            if "dominantes" in analyses:
+                strict, weak = self._dominantes_bloc(g)
+                for i in range(n):
+                    resultat["dominantes"]["strict"][i][sl] = strict[i]
+                    resultat["dominantes"]["weak"][i][sl] = weak[i]
+        return resultat
+
+    def _pareto_bloc(self, g: np.ndarray) -> np.ndarray:
+        b = g.shape[0]
+        points = g.reshape(b, self.n_joueurs, -1).transpose(0, 2, 1)  # (b, P, n)
+        n_profils = points.shape[1]
+        non_domine = np.ones((b, n_profils), dtype=bool)
+
+        if n_profils * n_profils > _PAIRES_PAR_PAQUET:
+            # Jeux trop grands pour la comparaison exhaustive : moteur skyline, jeu par jeu
+            for k in range(b):
+                non_domine[k] = False
+                non_domine[k, frontiere_pareto(points[k])] = True
+            return non_domine.reshape((b,) + self.forme)
+
+        pas = max(1, _PAIRES_PAR_PAQUET // (n_profils * n_profils))
+        for debut in range(0, b, pas):
+            p = points[debut:debut + pas]
+            # ge[k, q, r] : q fait au moins aussi bien que r pour tous les joueurs
+            ge = np.ones((len(p), n_profils, n_profils), dtype=bool)
+            gt = np.zeros((len(p), n_profils, n_profils), dtype=bool)
+            for i in range(self.n_joueurs):
+                x = p[:, :, i]
+                ge &= x[:, :, None] >= x[:, None, :]
+                gt |= x[:, :, None] > x[:, None, :]
+            non_domine[debut:debut + pas] = ~np.any(ge & gt, axis=1)
+        return non_domine.reshape((b,) + self.forme)
+
+    def _securite_bloc(self, g: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        valeurs = np.empty((g.shape[0], self.n_joueurs), dtype=np.result_type(g.dtype, np.float64))
+        strategies = np.empty((g.shape[0], self.n_joueurs), dtype=np.intp)
+        for i in range(self.n_joueurs):
+            # Pire cas sur tous les axes adverses en une seule réduction
+            autres = tuple(1 + k for k in range(self.n_joueurs) if k != i)
+            minima = np.min(g[:, i], axis=autres)
+            strategies[:, i] = np.argmax(minima, axis=1)
+            valeurs[:, i] = np.take_along_axis(minima, strategies[:, i, None], axis=1)[:, 0]
+        return valeurs, strategies
+
+    def _dominantes_bloc(self, g: np.ndarray) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+        strict, weak = [], []
+        for i in range(self.n_joueurs):
+            # (b, s_i, profils adverses) : une stratégie est faiblement dominante si elle
+            # atteint le maximum partout, strictement si elle est en plus seule à l'atteindre
+            G = np.moveaxis(g[:, i], i + 1, 1).reshape(g.shape[0], self.forme[i], -1)
+            au_max = G == G.max(axis=1, keepdims=True)
+            unique = au_max.sum(axis=1, keepdims=True) == 1
+            weak.append(au_max.all(axis=2))
+            strict.append((au_max & unique).all(axis=2))
+        return strict, weak
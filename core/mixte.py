@@ -0,0 +1,193 @@
+import numpy as np
+from itertools import combinations
+from math import comb
+from typing import Callable, List, Optional, Tuple
+
+EquilibreMixte = Tuple[np.ndarray, np.ndarray]
+
+_MAX_PIVOTS_PAR_ETIQUETTE = 1000
+# Pivots de Lemke-Howson entre deux appels du rappel de progression
+_PIVOTS_PAR_RAPPEL = 256
+
+
+def enumeration_supports(A: np.ndarray, B: np.ndarray, tolerance: float = 1e-9,
+                         progression: Optional[Callable[[float], None]] = None) -> List[EquilibreMixte]:
+    """
+    Tous les équilibres de Nash (en stratégies mixtes) d'un jeu bimatriciel
+    non dégénéré, par énumération des supports de même taille.
+    A : gains du joueur 1 (lignes), B : gains du joueur 2 (colonnes).
+    `progression` est appelé après chaque support du joueur 1, avec la
+    fraction des paires de supports parcourues.
+    """
+    A = np.asarray(A, dtype=np.float64)
+    B = np.asarray(B, dtype=np.float64)
+    m, n = A.shape
+    equilibres: List[EquilibreMixte] = []
+    total = sum(comb(m, t) * comb(n, t) for t in range(1, min(m, n) + 1))
+    parcourues = 0
+
+    for taille in range(1, min(m, n) + 1):
+        for I in combinations(range(m), taille):
+            if progression is not None:
+                progression(parcourues / total)
+                parcourues += comb(n, taille)
+            for J in combinations(range(n), taille):
+                y = _rend_indifferent(A[np.ix_(I, J)], tolerance)
+                if y is None:
+                    continue
+                x = _rend_indifferent(B[np.ix_(I, J)].T, tolerance)
+                if x is None:
+                    continue
+
+                strat_x = np.zeros(m)
+                strat_x[list(I)] = x
+                strat_y = np.zeros(n)
+                strat_y[list(J)] = y
+                # Aucune stratégie hors support ne doit faire mieux
+                gains_lignes = A @ strat_y
+                gains_colonnes = strat_x @ B
+                if gains_lignes.max() > gains_lignes[list(I)].max() + tolerance:
+                    continue
+                if gains_colonnes.max() > gains_colonnes[list(J)].max() + tolerance:
+                    continue
+                if not any(np.allclose(strat_x, ex) and np.allclose(strat_y, ey) for ex, ey in equilibres):
+                    equilibres.append((strat_x, strat_y))
+    return equilibres
+
+
+def _rend_indifferent(M: np.ndarray, tolerance: float):
+    """
+    Mixte (à support plein) de l'adversaire qui rend indifférent entre toutes
+    les lignes de M, ou None s'il n'existe pas ou n'est pas une distribution.
+    """
+    k = M.shape[0]
+    # M z = u·1 et somme(z) = 1, inconnues (z, u)
+    systeme = np.zeros((k + 1, k + 1))
+    systeme[:k, :k] = M
+    systeme[:k, k] = -1.0
+    systeme[k, :k] = 1.0
+    second_membre = np.zeros(k + 1)
+    second_membre[k] = 1.0
+    try:
+        solution = np.linalg.solve(systeme, second_membre)
+    except np.linalg.LinAlgError:
+        return None
+    z = solution[:k]
+    if np.any(z < -tolerance):
+        return None
+    return np.clip(z, 0.0, None)
+
+
+def lemke_howson(A: np.ndarray, B: np.ndarray, etiquette_initiale: Optional[int] = None,
+                 tolerance: float = 1e-9, progression: Optional[Callable[[float], None]] = None) -> EquilibreMixte:
+    """
+    Un équilibre de Nash d'un jeu bimatriciel par l'algorithme de Lemke-Howson.
+    Les étiquettes 0..m-1 sont les stratégies du joueur 1, m..m+n-1 celles du
+    joueur 2. Sans étiquette initiale, toutes les étiquettes sont essayées avec
+    un nombre de pivots borné (puis relevé), car la longueur du chemin varie
+    énormément d'une étiquette à l'autre. `progression` est appelé tous les
+    _PIVOTS_PAR_RAPPEL pivots (fraction des étiquettes essayées au budget courant).
+    """
+    A = np.asarray(A, dtype=np.float64)
+    B = np.asarray(B, dtype=np.float64)
+    m, n = A.shape
+    max_pivots = _MAX_PIVOTS_PAR_ETIQUETTE * (m + n)
+
+    if etiquette_initiale is not None:
+        if not 0 <= etiquette_initiale < m + n:
+            raise ValueError(f"Étiquette initiale hors bornes: {etiquette_initiale}")
+        equilibre = _chemin_lemke_howson(A, B, etiquette_initiale, max_pivots, tolerance, progression)
+        if equilibre is None:
+            raise RuntimeError("Lemke-Howson n'a pas convergé")
+        return equilibre
+
+    budget = max(10, (m + n) // 10)
+    while budget < 4 * max_pivots:
+        for etiquette in range(m + n):
+            rappel = None
+            if progression is not None:
+                rappel = lambda f, e=etiquette: progression((e + f) / (m + n))
+            equilibre = _chemin_lemke_howson(A, B, etiquette, budget, tolerance, rappel)
+            if equilibre is not None:
+                return equilibre
+        budget *= 4
+    raise RuntimeError("Lemke-Howson n'a pas convergé")
+
+
+def _chemin_lemke_howson(A: np.ndarray, B: np.ndarray, etiquette_initiale: int, max_pivots: int, tolerance: float,
+                         progression: Optional[Callable[[float], None]] = None) -> Optional[EquilibreMixte]:
+    """Suit le chemin complémentaire depuis une étiquette ; None si le budget de pivots est épuisé."""
+    m, n = A.shape
+    # Gains strictement positifs : l'équilibre est invariant par translation
+    A = A - A.min() + 1.0
+    B = B - B.min() + 1.0
+
+    # Chaque colonne d'un tableau porte l'étiquette de sa variable
+    # P : B^T x + r = 1, variables x (0..m-1) puis r (m..m+n-1)
+    P = np.zeros((n, m + n + 1))
+    P[:, :m] = B.T
+    P[:, m:m + n] = np.eye(n)
+    P[:, -1] = 1.0
+    base_P = np.arange(m, m + n)
+    # Q : s + A y = 1, variables s (0..m-1) puis y (m..m+n-1)
+    Q = np.zeros((m, m + n + 1))
+    Q[:, :m] = np.eye(m)
+    Q[:, m:m + n] = A
+    Q[:, -1] = 1.0
+    base_Q = np.arange(m)
+
+    # Le tampon sert à la mise à jour de rang 1 : aucune copie du tableau par pivot
+    tableaux = {
+        "P": (P, base_P, np.r_[m + n, m:m + n], np.empty_like(P)),
+        "Q": (Q, base_Q, np.r_[m + n, 0:m], np.empty_like(Q)),
+    }
+    # La variable d'étiquette k est hors base dans P si k < m, dans Q sinon
+    courant = "P" if etiquette_initiale < m else "Q"
+    entrante = etiquette_initiale
+    for pivot in range(max_pivots):
+        if progression is not None and pivot % _PIVOTS_PAR_RAPPEL == 0:
+            progression(pivot / max_pivots)
+        T, base, colonnes_lex, tampon = tableaux[courant]
+        sortante = _pivoter(T, base, entrante, colonnes_lex, tampon, tolerance)
+        if sortante == etiquette_initiale:
+            break
+        entrante = sortante
+        courant = "Q" if courant == "P" else "P"
+    else:
+        return None
+
+    x = np.zeros(m)
+    lignes = base_P < m
+    x[base_P[lignes]] = P[lignes, -1]
+    y = np.zeros(n)
+    lignes = base_Q >= m
+    y[base_Q[lignes] - m] = Q[lignes, -1]
+    return x / x.sum(), y / y.sum()
+
+
+def _pivoter(T: np.ndarray, base: np.ndarray, entrante: int, colonnes_lex: np.ndarray,
+             tampon: np.ndarray, tolerance: float) -> int:
+    """Fait entrer une variable en base (en place) et retourne l'étiquette sortante."""
+    colonne = T[:, entrante]
+    candidats = np.flatnonzero(colonne > tolerance)
+    if len(candidats) == 0:
+        raise RuntimeError("Rayon non borné : le jeu est mal formé")
+
+    # Test du rapport minimal, départagé lexicographiquement
+    for c in colonnes_lex:
+        rapports = T[candidats, c] / colonne[candidats]
+        minimum = rapports.min()
+        candidats = candidats[rapports <= minimum + tolerance * max(1.0, abs(minimum))]
+        if len(candidats) == 1:
+            break
+    ligne = candidats[0]
+
+    T[ligne] /= T[ligne, entrante]
+    facteurs = T[:, entrante].copy()
+    facteurs[ligne] = 0.0
+    np.einsum("i,j->ij", facteurs, T[ligne], out=tampon)
+    T -= tampon
+
+    sortante = int(base[ligne])
+    base[ligne] = entrante
+    return sortante
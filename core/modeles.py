@@ -1,36 +1,120 @@
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
 import numpy as np
 
 class Joueur:
+    __slots__ = ("id", "strategies", "n_strategies")
+
     def __init__(self, id_joueur: int, strategies: List[str]):
         self.id = id_joueur
         self.strategies = strategies
         self.n_strategies = len(strategies)
-        
+
     def __repr__(self):
         return f"Joueur {self.id} ({self.n_strategies} stratégies)"
 
 class Jeu:
-    def __init__(self, joueurs: List[Joueur], gains: Dict[int, np.ndarray]):
+    """
+    Jeu sous forme normale. Les gains sont stockés dans un seul tenseur
+    contigu (n_joueurs, *forme), le joueur k (dans l'ordre de `joueurs`)
+    portant ses stratégies sur l'axe k. `gains[id]` reste disponible comme
+    vue (sans copie) sur la tranche du joueur.
+
+    `version` compte les modifications en place des gains : tout code qui
+    écrit dans le tenseur (AnalyseurIncremental, np.memmap ouvert en "r+")
+    doit appeler signaler_modification() pour que les tables et résultats
+    dérivés du jeu soient recalculés.
+    """
+    __slots__ = ("joueurs", "tenseur", "gains", "version")
+
+    def __init__(self, joueurs: List[Joueur], gains: Dict[int, np.ndarray], dtype: Optional[np.dtype] = None):
         self.joueurs = joueurs
-        self.gains = gains
-        self._valider_matrice_gains()  # Ajout de la validation
-        
-   
-    def _valider_matrice_gains(self):
-        expected_shape = tuple(len(j.strategies) for j in self.joueurs)
+        gains = self._valider_matrice_gains(gains)  # Ajout de la validation
+
+        if dtype is None:
+            dtype = np.result_type(*gains)
+        dtype = np.dtype(dtype)
+        _verifier_plage(gains, dtype)
+
+        self.tenseur = np.empty((len(joueurs),) + self.forme, dtype=dtype)
+        for k, g in enumerate(gains):
+            self.tenseur[k] = g
+        self.gains = {j.id: self.tenseur[k] for k, j in enumerate(joueurs)}
+        self.version = 0
+
+    @classmethod
+    def depuis_tenseur(cls, joueurs: List[Joueur], tenseur: np.ndarray) -> "Jeu":
+        """
+        Construit un jeu autour d'un tenseur (n_joueurs, *forme) existant,
+        sans copie : le tenseur peut être un np.memmap.
+        """
+        jeu = cls.__new__(cls)
+        jeu.joueurs = joueurs
+        if tenseur.shape != (len(joueurs),) + jeu.forme:
+            raise ValueError(f"Dimensions incorrectes pour le tenseur de gains: {tenseur.shape}")
+        jeu.tenseur = tenseur
+        jeu.gains = {j.id: tenseur[k] for k, j in enumerate(joueurs)}
+        jeu.version = 0
+        return jeu
+
+    def signaler_modification(self):
+        """À appeler après toute écriture en place dans le tenseur de gains"""
+        self.version += 1
+
+    def empreinte_courante(self) -> Tuple[int, int, Tuple[int, ...], str, int]:
+        """
+        Empreinte en O(1) de l'état des gains : identité et adresse du
+        tenseur, forme, type et nombre de modifications signalées.
+        """
+        return (id(self.tenseur), self.tenseur.ctypes.data, self.tenseur.shape,
+                self.tenseur.dtype.str, self.version)
+
+    @property
+    def forme(self) -> Tuple[int, ...]:
+        return tuple(len(j.strategies) for j in self.joueurs)
+
+    @property
+    def n_joueurs(self) -> int:
+        return len(self.joueurs)
+
+    def _valider_matrice_gains(self, gains: Dict[int, np.ndarray]) -> List[np.ndarray]:
+        expected_shape = self.forme
+        matrices = []
         for j in self.joueurs:
-            if self.gains[j.id].shape != expected_shape:
+            if j.id not in gains:
+                raise ValueError(f"Gains manquants pour le joueur {j.id}")
+            matrice = np.asarray(gains[j.id])
+            if matrice.shape != expected_shape:
                 raise ValueError(f"Dimensions incorrectes pour le joueur {j.id}")
-                
+            matrices.append(matrice)
+        return matrices
+
     def get_strategie_name(self, id_joueur: int, index: int) -> str:
         """Retourne le nom d'une stratégie"""
         for j in self.joueurs:
             if j.id == id_joueur:
                 return j.strategies[index]
         raise ValueError("Joueur non trouvé")
-    
 
+    def detecter_symetrie(self, tolerance: float = 0.0) -> Optional[str]:
+        """"symetrique", "anonyme" (gains fonction des comptes de stratégies) ou None"""
+        from .symetrie import detecter_symetrie
+        return detecter_symetrie(self, tolerance)
+
+    def compresser(self, tolerance: float = 0.0):
+        """Représentation par vecteurs de comptes (JeuAnonyme) d'un jeu symétrique ou anonyme"""
+        from .symetrie import compresser
+        return compresser(self, tolerance)
 
     def __repr__(self):
-        return f"Jeu à {self.n_joueurs} joueurs"
\ No newline at end of file
+        return f"Jeu à {self.n_joueurs} joueurs"
+
+def _verifier_plage(gains: List[np.ndarray], dtype: np.dtype):
+    """Refuse un type entier trop étroit pour les gains fournis"""
+    if dtype.kind not in "iu":
+        return
+    info = np.iinfo(dtype)
+    for g in gains:
+        if g.size and (np.min(g) < info.min or np.max(g) > info.max):
+            raise ValueError(f"Gains hors de la plage du type {dtype}")
+        if g.dtype.kind == "f" and not np.all(np.mod(g, 1) == 0):
+            raise ValueError(f"Gains non entiers pour le type {dtype}")
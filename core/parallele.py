@@ -0,0 +1,146 @@
+"""
+Recherche parallèle (ProcessPoolExecutor) des équilibres de Nash et des
+optima de Pareto sur les très grands jeux. Les processus lisent les gains
+par np.memmap : soit le fichier .tjeu du jeu, soit une copie temporaire
+placée en mémoire partagée (/dev/shm), jamais une copie sérialisée.
+"""
+import mmap
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+import numpy as np
+from .pareto import frontiere_pareto
+
+# (chemin, dtype, forme, offset) d'un tenseur (n_joueurs, *forme) en mémoire projetée
+Descripteur = Tuple[str, str, Tuple[int, ...], int]
+
+_OUVERTS: Dict[Descripteur, np.memmap] = {}
+
+
+def _projection_propre(tenseur: np.ndarray) -> bool:
+    """
+    Le tenseur couvre-t-il exactement sa projection, à partir de son offset ?
+    Une vue (m[1:], m[::2]...) garde filename et offset de la projection
+    d'origine sans commencer à la même adresse : on compare l'adresse des
+    données au début de la projection plus l'offset.
+    """
+    if not (isinstance(tenseur, np.memmap) and tenseur.filename and tenseur.flags.c_contiguous):
+        return False
+    projection = tenseur.base if isinstance(tenseur.base, mmap.mmap) else getattr(tenseur, "_mmap", None)
+    if not isinstance(projection, mmap.mmap):
+        return False
+    # np.memmap projette à partir de l'offset arrondi à la granularité d'allocation
+    decalage = tenseur.offset % mmap.ALLOCATIONGRANULARITY
+    try:
+        debut = np.frombuffer(projection, dtype=np.uint8).ctypes.data
+    except (TypeError, ValueError):
+        return False
+    return tenseur.ctypes.data == debut + decalage and decalage + tenseur.nbytes <= len(projection)
+
+
+@contextmanager
+def tenseur_partage(tenseur: np.ndarray) -> Iterator[Descripteur]:
+    """Rend un tenseur accessible aux processus : réutilise son fichier s'il est projeté, sinon en écrit une copie temporaire."""
+    if _projection_propre(tenseur):
+        yield (tenseur.filename, tenseur.dtype.str, tenseur.shape, tenseur.offset)
+        return
+
+    repertoire = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    fd, chemin = tempfile.mkstemp(dir=repertoire, suffix=".gains")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for k in range(len(tenseur)):
+                np.ascontiguousarray(tenseur[k]).tofile(f)
+        yield (chemin, tenseur.dtype.str, tenseur.shape, 0)
+    finally:
+        os.unlink(chemin)
+
+
+def _ouvrir(descripteur: Descripteur) -> np.memmap:
+    """Projection du tenseur dans le processus courant (ouverte une seule fois par processus)."""
+    if descripteur not in _OUVERTS:
+        chemin, dtype, forme, offset = descripteur
+        _OUVERTS[descripteur] = np.memmap(chemin, dtype=np.dtype(dtype), mode="r", offset=offset, shape=forme)
+    return _OUVERTS[descripteur]
+
+
+def _tranches(longueur: int, n_parts: int) -> List[Tuple[int, int]]:
+    bornes = np.linspace(0, longueur, min(n_parts, longueur) + 1).astype(int)
+    return [(int(a), int(b)) for a, b in zip(bornes[:-1], bornes[1:]) if b > a]
+
+
+def _max_tranche(descripteur: Descripteur, axe: int, debut: int, fin: int) -> np.ndarray:
+    """Max des gains du joueur `axe` le long de son axe, sur une tranche de cet axe."""
+    tenseur = _ouvrir(descripteur)
+    index = [slice(None)] * (tenseur.ndim - 1)
+    index[axe] = slice(debut, fin)
+    return np.max(tenseur[axe][tuple(index)], axis=axe, keepdims=True)
+
+
+def _nash_tranche(descripteur: Descripteur, axe: int, debut: int, fin: int,
+                  meilleur_axe: np.ndarray, epsilon: float) -> np.ndarray:
+    """Profils d'équilibre (coordonnées absolues) dont la coordonnée `axe` est dans [debut, fin)."""
+    tenseur = _ouvrir(descripteur)
+    index = [slice(None)] * (tenseur.ndim - 1)
+    index[axe] = slice(debut, fin)
+    index = tuple(index)
+
+    masque = np.asarray(tenseur[axe][index]) >= meilleur_axe - epsilon
+    for joueur in range(len(tenseur)):
+        if joueur == axe:
+            continue
+        g = np.asarray(tenseur[joueur][index])
+        masque &= g >= np.max(g, axis=joueur, keepdims=True) - epsilon
+    profils = np.argwhere(masque)
+    profils[:, axe] += debut
+    return profils
+
+
+def _pareto_tranche(descripteur: Descripteur, debut: int, fin: int, taille_bloc: int) -> np.ndarray:
+    """Indices (à plat) de la frontière locale d'une tranche de profils."""
+    tenseur = _ouvrir(descripteur)
+    points = tenseur.reshape(len(tenseur), -1).T[debut:fin]
+    return frontiere_pareto(points, taille_bloc) + debut
+
+
+def equilibre_nash_parallele(tenseur: np.ndarray, epsilon: float, n_processus: int) -> List[Tuple[int, ...]]:
+    """
+    Équilibres de Nash purs, le tenseur étant découpé le long de l'axe le plus
+    long. Le joueur de cet axe a besoin du max sur l'axe complet : il est
+    calculé par tranches au premier passage puis combiné.
+    """
+    forme = tenseur.shape[1:]
+    axe = int(np.argmax(forme))
+    tranches = _tranches(forme[axe], n_processus)
+
+    with tenseur_partage(tenseur) as descripteur, ProcessPoolExecutor(max_workers=n_processus) as pool:
+        futures = [pool.submit(_max_tranche, descripteur, axe, a, b) for a, b in tranches]
+        meilleur_axe = futures[0].result()
+        for f in futures[1:]:
+            meilleur_axe = np.maximum(meilleur_axe, f.result())
+
+        futures = [pool.submit(_nash_tranche, descripteur, axe, a, b, meilleur_axe, epsilon)
+                   for a, b in tranches]
+        profils = np.concatenate([f.result() for f in futures])
+
+    # Fusion déterministe : ordre lexicographique des profils, comme la version séquentielle
+    ordre = np.lexsort(profils.T[::-1])
+    return [tuple(int(i) for i in p) for p in profils[ordre]]
+
+
+def optimum_pareto_parallele(tenseur: np.ndarray, n_processus: int, taille_bloc: int = 4096) -> np.ndarray:
+    """
+    Indices (à plat, triés) des optima de Pareto : frontière locale de chaque
+    tranche de profils dans un processus, puis frontière de leur union.
+    """
+    n_profils = int(np.prod(tenseur.shape[1:]))
+    tranches = _tranches(n_profils, n_processus)
+
+    with tenseur_partage(tenseur) as descripteur, ProcessPoolExecutor(max_workers=n_processus) as pool:
+        futures = [pool.submit(_pareto_tranche, descripteur, a, b, taille_bloc) for a, b in tranches]
+        candidats = np.concatenate([f.result() for f in futures])
+
+    points = tenseur.reshape(len(tenseur), -1).T[candidats]
+    return np.sort(candidats[frontiere_pareto(points, taille_bloc)])
@@ -0,0 +1,163 @@
+import numpy as np
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+_TRANCHE_FENETRE = 64
+
+
+def frontiere_pareto(points: np.ndarray, taille_bloc: int = 4096,
+                     compteurs: Optional[Dict[str, int]] = None,
+                     progression: Optional[Callable[[float], None]] = None) -> np.ndarray:
+    """
+    Indices (triés) des lignes non dominées d'un tableau de gains (P, n_joueurs).
+    Une ligne est dominée si une autre fait au moins aussi bien pour tous
+    les joueurs et strictement mieux pour au moins un.
+    `compteurs["comparaisons"]`, s'il est fourni, est augmenté du nombre de
+    comparaisons de profils effectuées. `progression`, s'il est fourni, est
+    appelé après chaque bloc avec la fraction des profils traités (une
+    exception levée par ce rappel interrompt le calcul).
+    """
+    morceaux = list(iter_frontiere_pareto(points, taille_bloc, compteurs, progression))
+    if not morceaux:
+        return np.empty(0, dtype=np.intp)
+    return np.sort(np.concatenate(morceaux))
+
+
+def iter_frontiere_pareto(points: np.ndarray, taille_bloc: int = 4096,
+                          compteurs: Optional[Dict[str, int]] = None,
+                          progression: Optional[Callable[[float], None]] = None) -> Iterator[np.ndarray]:
+    """
+    Version paresseuse de frontiere_pareto : produit les indices non dominés
+    par paquets, dès qu'ils sont confirmés (dans l'ordre de découverte, non trié).
+    """
+    if points.ndim != 2:
+        raise ValueError("Les gains doivent être un tableau (profils, joueurs)")
+    if points.shape[0] == 0:
+        return
+    if points.shape[1] == 2:
+        if compteurs is not None:
+            # Un seul balayage après le tri : chaque profil est comparé au meilleur précédent
+            compteurs["comparaisons"] = compteurs.get("comparaisons", 0) + points.shape[0]
+        indices = _frontiere_deux_joueurs(points)
+        if progression is not None:
+            progression(1.0)
+        yield indices
+    else:
+        yield from _frontiere_skyline(points, taille_bloc, compteurs, progression)
+
+
+def _frontiere_deux_joueurs(points: np.ndarray) -> np.ndarray:
+    """Tri puis balayage : O(P log P) pour deux joueurs."""
+    x, y = points[:, 0], points[:, 1]
+    # Tri par x décroissant, puis y décroissant à x égal
+    ordre = np.lexsort((-y, -x))
+    xs, ys = x[ordre], y[ordre]
+
+    debuts = np.flatnonzero(np.r_[True, xs[1:] != xs[:-1]])
+    tailles = np.diff(np.r_[debuts, len(xs)])
+
+    # Meilleur y du groupe (premier élément) et meilleur y des groupes de x strictement plus grand
+    max_groupe = ys[debuts]
+    cumul = np.maximum.accumulate(ys)
+    precedent = np.empty(len(debuts), dtype=np.float64)
+    precedent[0] = -np.inf
+    precedent[1:] = cumul[debuts[1:] - 1]
+
+    garde = (ys == np.repeat(max_groupe, tailles)) & (ys > np.repeat(precedent, tailles))
+    return np.sort(ordre[garde])
+
+
+def _frontiere_skyline(points: np.ndarray, taille_bloc: int,
+                       compteurs: Optional[Dict[str, int]] = None,
+                       progression: Optional[Callable[[float], None]] = None) -> Iterator[np.ndarray]:
+    """
+    Sort-filter-skyline par blocs : après un tri par somme décroissante, un
+    profil ne peut être dominé que par un profil placé avant lui. Chaque bloc
+    est comparé à la frontière déjà trouvée puis à lui-même, ce qui borne la
+    mémoire à taille_bloc² booléens par comparaison. Les indices retenus
+    sont produits bloc par bloc.
+    """
+    n_joueurs = points.shape[1]
+    ordre = _ordre_somme_decroissante(points)
+
+    fenetre = np.empty((0, n_joueurs), dtype=points.dtype)
+    comparaisons = 0
+    for debut in range(0, len(ordre), taille_bloc):
+        idx = ordre[debut:debut + taille_bloc]
+        bloc = points[idx]
+        vivant = np.ones(len(idx), dtype=bool)
+        # Profils dont le vecteur de gains est déjà dans la fenêtre : la
+        # fenêtre ne garde que des vecteurs distincts (jeux à gains entiers)
+        connu = np.zeros(len(idx), dtype=bool)
+
+        # Les premiers points de la frontière (somme la plus élevée) éliminent
+        # presque tout : on les parcourt par petites tranches pour s'arrêter tôt
+        for k in range(0, len(fenetre), _TRANCHE_FENETRE):
+            tranche = fenetre[k:k + _TRANCHE_FENETRE]
+            if compteurs is not None:
+                comparaisons += int(vivant.sum()) * len(tranche)
+            domine, egal = _comparer(bloc[vivant], tranche)
+            connu[vivant] |= egal
+            vivant[vivant] &= ~domine
+            if not vivant.any():
+                break
+
+        # Un profil égal à un point de la fenêtre est non dominé comme lui ;
+        # seuls les autres survivants doivent encore être comparés entre eux
+        nouveaux = vivant & ~connu
+        if nouveaux.any():
+            if compteurs is not None:
+                comparaisons += int(nouveaux.sum()) ** 2
+            nouveaux[nouveaux] &= ~_comparer(bloc[nouveaux], bloc[nouveaux])[0]
+            vivant &= connu | nouveaux
+            if nouveaux.any():
+                fenetre = np.concatenate([fenetre, np.unique(bloc[nouveaux], axis=0)])
+        if compteurs is not None:
+            compteurs["comparaisons"] = compteurs.get("comparaisons", 0) + comparaisons
+            comparaisons = 0
+        if progression is not None:
+            progression(min(1.0, (debut + taille_bloc) / len(ordre)))
+        if vivant.any():
+            yield idx[vivant]
+
+
+def _ordre_somme_decroissante(points: np.ndarray) -> np.ndarray:
+    """
+    Ordre des profils par somme des gains décroissante. Les ex aequo sont
+    départagés lexicographiquement : en flottant, un profil dominant peut
+    avoir la même somme arrondie que le profil qu'il domine.
+    """
+    exact = np.issubdtype(points.dtype, np.integer) or points.dtype == bool
+    somme = points.sum(axis=1, dtype=np.int64 if exact else np.float64)
+    ordre = np.argsort(-somme, kind="stable")
+    if exact:
+        return ordre
+
+    triees = somme[ordre]
+    egal = triees[1:] == triees[:-1]
+    ex_aequo = np.zeros(len(ordre), dtype=bool)
+    ex_aequo[1:] |= egal
+    ex_aequo[:-1] |= egal
+    if ex_aequo.any():
+        positions = np.flatnonzero(ex_aequo)
+        sous = ordre[positions]
+        groupe = np.cumsum(np.r_[True, ~egal])[positions]
+        cles = [-points[sous, k] for k in reversed(range(points.shape[1]))] + [groupe]
+        ordre[positions] = sous[np.lexsort(cles)]
+    return ordre
+
+
+def _comparer(cibles: np.ndarray, front: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pour chaque ligne de `cibles`, indique si une ligne de `front` la domine
+    et si une ligne de `front` lui est égale.
+    """
+    # Boucle sur les joueurs (peu nombreux) plutôt qu'une réduction sur un axe de
+    # taille n, sur des colonnes contiguës (une colonne d'un tableau ligne par
+    # ligne est lue avec un pas de n éléments)
+    colonnes = np.ascontiguousarray(cibles.T)
+    ge = front[:, None, 0] >= colonnes[None, 0]
+    gt = front[:, None, 0] > colonnes[None, 0]
+    for k in range(1, cibles.shape[1]):
+        ge &= front[:, None, k] >= colonnes[None, k]
+        gt |= front[:, None, k] > colonnes[None, k]
+    return np.any(ge & gt, axis=0), np.any(ge & ~gt, axis=0)
@@ -0,0 +1,326 @@
+"""
+Analyse hors ligne de corpus de jeux, en ligne de commande :
+
+    python -m core.pipeline jeux.jsonl corpus/ --analyses nash pareto --sortie resultats.jsonl
+    python -m core.pipeline - --processus 8 --sortie resultats.parquet < jeux.jsonl
+
+Entrées, lues au fil de l'eau : fichiers JSON lines ("-" pour l'entrée
+standard), fichiers .tjeu (core.stockage) et répertoires (leurs *.jsonl et
+*.tjeu, récursivement). Une ligne JSON décrit un jeu :
+
+    {"id": "g1", "joueurs": [{"id": 1, "strategies": ["A", "B"]}, ...],
+     "gains": [...]}
+
+"gains" est le tenseur (n_joueurs, s1, ..., sn) en listes imbriquées (ou à
+plat). Les lignes sont décodées dans les processus de travail ; un fichier
+.tjeu y est ouvert en np.memmap, seul son chemin est transmis.
+
+Les jeux sont soumis par paquets (--paquet) et le nombre de paquets en
+cours (soumis et pas encore écrits) est borné par --en-vol : la mémoire ne
+dépend pas de la taille du corpus (--memoire-travailleur plafonne en plus
+chaque processus). Les résultats sont écrits au fur et à mesure, en JSON
+lines ou en Parquet (pyarrow, optionnel : une colonne JSON par analyse), et
+le débit est affiché sur la sortie d'erreur.
+"""
+import argparse
+import json
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .algorithems import AnalyseurJeu
+from .modeles import Jeu, Joueur
+from .stockage import charger_jeu_binaire
+
+
+def _resume_potentiel(analyseur: AnalyseurJeu) -> Optional[Dict[str, Any]]:
+    """Type, poids et équilibres maximisant le potentiel (sans le tenseur Φ)"""
+    resultat = analyseur.potentiel()
+    if resultat is None:
+        return None
+    return {"type": resultat["type"], "poids": resultat["poids"], "equilibres": analyseur.equilibres_potentiel()}
+
+
+# Analyse -> fonction (analyseur, epsilon) produisant un résultat sérialisable en JSON
+ANALYSES_PIPELINE: Dict[str, Callable[[AnalyseurJeu, float], Any]] = {
+    "nash": lambda a, eps: a.equilibre_nash(eps),
+    "nombre_nash": lambda a, eps: a.nombre_equilibres_nash(eps),
+    "pareto": lambda a, eps: a.optimum_pareto(),
+    "securite": lambda a, eps: [a.niveau_securite(j.id) for j in a.jeu.joueurs],
+    "securite_mixte": lambda a, eps: a.niveaux_securite_mixtes(),
+    "dominantes": lambda a, eps: [a.strategies_dominantes(j.id) for j in a.jeu.joueurs],
+    "iesds": lambda a, eps: dict(zip(("restants", "chemin"), a.equilibre_iteratif_dominance_stricte())),
+    "mixtes": lambda a, eps: a.equilibres_mixtes(),
+    "dominance_mixte": lambda a, eps: {cle: valeur for cle, valeur in a.elimination_dominance_mixte().items()
+                                       if cle != "jeu_reduit"},
+    "potentiel": lambda a, eps: _resume_potentiel(a),
+}
+
+
+# Élément du flux d'entrée : (source, "jsonl" ou "tjeu", ligne JSON ou chemin)
+Element = Tuple[str, str, str]
+
+
+def lire_sources(chemins: Iterable[str]) -> Iterator[Element]:
+    """Parcourt paresseusement les entrées, un élément par jeu"""
+    for chemin in chemins:
+        if chemin == "-":
+            yield from _lignes("<stdin>", sys.stdin)
+            continue
+        p = Path(chemin)
+        fichiers = sorted(f for f in p.rglob("*") if f.suffix in (".jsonl", ".tjeu")) if p.is_dir() else [p]
+        for f in fichiers:
+            if f.suffix == ".tjeu":
+                yield str(f), "tjeu", str(f)
+            else:
+                with open(f, encoding="utf-8") as flux:
+                    yield from _lignes(str(f), flux)
+
+
+def _lignes(source: str, flux) -> Iterator[Element]:
+    for numero, ligne in enumerate(flux, 1):
+        if ligne.strip():
+            yield f"{source}:{numero}", "jsonl", ligne
+
+
+def jeu_depuis_json(donnees: Dict) -> Jeu:
+    """Jeu décrit par un objet JSON (voir le format en tête du module)"""
+    joueurs = [Joueur(j["id"], list(j["strategies"])) for j in donnees["joueurs"]]
+    forme = (len(joueurs),) + tuple(len(j.strategies) for j in joueurs)
+    gains = np.asarray(donnees["gains"])
+    if gains.size != int(np.prod(forme)):
+        raise ValueError(f"Dimensions incorrectes pour les gains: {gains.shape}, attendu {forme}")
+    return Jeu.depuis_tenseur(joueurs, gains.reshape(forme))
+
+
+def analyser_element(element: Element, analyses: Tuple[str, ...], epsilon: float = 0.0) -> Dict[str, Any]:
+    """Charge et analyse un jeu (dans un processus de travail) ; une erreur est rapportée dans le résultat"""
+    source, type_element, contenu = element
+    resultat: Dict[str, Any] = {"id": None, "source": source, "forme": None, "duree": 0.0, "erreur": None}
+    debut = time.perf_counter()
+    try:
+        if type_element == "tjeu":
+            jeu = charger_jeu_binaire(contenu)
+            resultat["id"] = Path(contenu).stem
+        else:
+            donnees = json.loads(contenu)
+            resultat["id"] = donnees.get("id", source)
+            jeu = jeu_depuis_json(donnees)
+        resultat["forme"] = list(jeu.forme)
+        analyseur = AnalyseurJeu(jeu)
+        for nom in analyses:
+            resultat[nom] = ANALYSES_PIPELINE[nom](analyseur, epsilon)
+    except Exception as e:
+        resultat["erreur"] = f"{type(e).__name__}: {e}"
+    resultat["duree"] = time.perf_counter() - debut
+    return resultat
+
+
+def analyser_paquet(elements: List[Element], analyses: Tuple[str, ...], epsilon: float = 0.0) -> List[Dict[str, Any]]:
+    """Plusieurs petits jeux par soumission : un seul aller-retour entre processus"""
+    return [analyser_element(element, analyses, epsilon) for element in elements]
+
+
+def _paquets(elements: Iterable[Element], taille: int) -> Iterator[List[Element]]:
+    paquet = []
+    for element in elements:
+        paquet.append(element)
+        if len(paquet) == taille:
+            yield paquet
+            paquet = []
+    if paquet:
+        yield paquet
+
+
+def _en_json(valeur: Any) -> Any:
+    if isinstance(valeur, np.ndarray):
+        return valeur.tolist()
+    if isinstance(valeur, np.generic):
+        return valeur.item()
+    raise TypeError(f"Type non sérialisable: {type(valeur).__name__}")
+
+
+class EcrivainJsonl:
+    """Un objet JSON par résultat"""
+
+    def __init__(self, chemin: Optional[str]):
+        self._flux = open(chemin, "w", encoding="utf-8") if chemin else sys.stdout
+        self._fermer = chemin is not None
+
+    def ecrire(self, resultat: Dict[str, Any]):
+        self._flux.write(json.dumps(resultat, ensure_ascii=False, default=_en_json) + "\n")
+
+    def fermer(self):
+        if self._fermer:
+            self._flux.close()
+        else:
+            self._flux.flush()
+
+
+class EcrivainParquet:
+    """
+    Fichier Parquet écrit par groupes de `lignes_par_groupe` résultats. Les
+    résultats d'analyse (structures imbriquées) sont des colonnes texte JSON.
+    """
+
+    def __init__(self, chemin: str, analyses: Tuple[str, ...], lignes_par_groupe: int = 1024):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as erreur:
+            raise ImportError("La sortie Parquet nécessite pyarrow (pip install pyarrow)") from erreur
+        self._pa = pa
+        self.analyses = analyses
+        self.lignes_par_groupe = lignes_par_groupe
+        champs = [("index", pa.int64()), ("id", pa.string()), ("source", pa.string()),
+                  ("forme", pa.list_(pa.int64())), ("duree", pa.float64()), ("erreur", pa.string())]
+        self._schema = pa.schema(champs + [(nom, pa.string()) for nom in analyses])
+        self._ecrivain = pq.ParquetWriter(chemin, self._schema)
+        self._tampon: List[Dict[str, Any]] = []
+
+    def ecrire(self, resultat: Dict[str, Any]):
+        ligne = {cle: resultat.get(cle) for cle in ("index", "source", "forme", "duree", "erreur")}
+        ligne["id"] = None if resultat.get("id") is None else str(resultat["id"])
+        for nom in self.analyses:
+            ligne[nom] = json.dumps(resultat[nom], ensure_ascii=False, default=_en_json) if nom in resultat else None
+        self._tampon.append(ligne)
+        if len(self._tampon) >= self.lignes_par_groupe:
+            self._vider()
+
+    def _vider(self):
+        if self._tampon:
+            self._ecrivain.write_table(self._pa.Table.from_pylist(self._tampon, schema=self._schema))
+            self._tampon = []
+
+    def fermer(self):
+        self._vider()
+        self._ecrivain.close()
+
+
+def _limiter_memoire(octets: int):
+    """Plafond d'espace d'adressage d'un processus de travail (systèmes POSIX)"""
+    try:
+        import resource
+    except ImportError:
+        return
+    resource.setrlimit(resource.RLIMIT_AS, (octets, octets))
+
+
+def executer(elements: Iterable[Element], analyses: Tuple[str, ...], ecrivain, n_processus: int = 1,
+             en_vol: Optional[int] = None, paquet: int = 1, epsilon: float = 0.0, ordonne: bool = False,
+             memoire_travailleur: Optional[int] = None,
+             rapport: Optional[Callable[[Dict[str, float]], None]] = None,
+             intervalle: float = 5.0) -> Dict[str, float]:
+    """
+    Analyse le flux `elements` et écrit chaque résultat (avec son rang
+    "index" dans le flux) dès qu'il est prêt, ou dans l'ordre du flux si
+    `ordonne`. Les jeux sont soumis par paquets de `paquet` ; au plus
+    `en_vol` paquets sont en cours à la fois (2 par processus par défaut).
+    Avec n_processus <= 1, tout se fait dans le processus courant. `rapport`
+    reçoit les statistiques toutes les `intervalle` secondes. Retourne les
+    statistiques finales.
+    """
+    inconnues = set(analyses) - set(ANALYSES_PIPELINE)
+    if inconnues:
+        raise ValueError(f"Analyses inconnues: {sorted(inconnues)}")
+    debut = time.perf_counter()
+    stats = {"jeux": 0, "erreurs": 0, "duree": 0.0, "debit": 0.0}
+    dernier_rapport = debut
+
+    def ecrire(premier: int, resultats: List[Dict[str, Any]]):
+        nonlocal dernier_rapport
+        for index, resultat in enumerate(resultats, premier):
+            resultat["index"] = index
+            ecrivain.ecrire(resultat)
+            stats["jeux"] += 1
+            stats["erreurs"] += resultat["erreur"] is not None
+        maintenant = time.perf_counter()
+        stats["duree"] = maintenant - debut
+        stats["debit"] = stats["jeux"] / stats["duree"] if stats["duree"] > 0 else 0.0
+        if rapport is not None and maintenant - dernier_rapport >= intervalle:
+            dernier_rapport = maintenant
+            rapport(dict(stats))
+
+    if n_processus <= 1:
+        for index, element in enumerate(elements):
+            ecrire(index, [analyser_element(element, analyses, epsilon)])
+        return stats
+
+    en_vol = en_vol or 2 * n_processus
+    initialisation = (_limiter_memoire, (memoire_travailleur,)) if memoire_travailleur else (None, ())
+    with ProcessPoolExecutor(max_workers=n_processus, initializer=initialisation[0],
+                             initargs=initialisation[1]) as pool:
+        en_cours: Deque[Tuple[int, Future]] = deque()
+        premier = 0
+        for elements_paquet in _paquets(elements, paquet):
+            en_cours.append((premier, pool.submit(analyser_paquet, elements_paquet, analyses, epsilon)))
+            premier += len(elements_paquet)
+            if len(en_cours) >= en_vol:
+                _recolter(en_cours, ordonne, ecrire, tout=False)
+        _recolter(en_cours, ordonne, ecrire, tout=True)
+    return stats
+
+
+def _recolter(en_cours: Deque[Tuple[int, Future]], ordonne: bool, ecrire, tout: bool):
+    """Écrit au moins un résultat (tous si `tout`) : le plus ancien si `ordonne`, sinon ceux qui sont prêts"""
+    while en_cours:
+        if ordonne:
+            index, future = en_cours.popleft()
+            ecrire(index, future.result())
+        else:
+            prets, _ = wait([f for _, f in en_cours], return_when=FIRST_COMPLETED)
+            restants = deque()
+            for index, future in en_cours:
+                if future in prets:
+                    ecrire(index, future.result())
+                else:
+                    restants.append((index, future))
+            en_cours.clear()
+            en_cours.extend(restants)
+        if not tout:
+            return
+
+
+def main(arguments: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("entrees", nargs="+", help="fichiers .jsonl ou .tjeu, répertoires, ou - (entrée standard)")
+    parser.add_argument("--analyses", nargs="+", default=["nash", "pareto", "securite", "dominantes"],
+                        choices=sorted(ANALYSES_PIPELINE))
+    parser.add_argument("--sortie", help="fichier .jsonl ou .parquet (JSON lines sur la sortie standard par défaut)")
+    parser.add_argument("--processus", type=int, default=1, help="processus de travail (1 : tout en local)")
+    parser.add_argument("--en-vol", type=int, help="paquets en cours au plus (2 par processus par défaut)")
+    parser.add_argument("--paquet", type=int, default=16, help="jeux par soumission à un processus de travail")
+    parser.add_argument("--epsilon", type=float, default=0.0)
+    parser.add_argument("--ordonne", action="store_true", help="écrire les résultats dans l'ordre des entrées")
+    parser.add_argument("--memoire-travailleur", type=int, help="plafond mémoire par processus de travail (Mio)")
+    parser.add_argument("--lignes-par-groupe", type=int, default=1024, help="taille des groupes de lignes Parquet")
+    parser.add_argument("--intervalle", type=float, default=5.0, help="secondes entre deux rapports de débit")
+    args = parser.parse_args(arguments)
+
+    analyses = tuple(args.analyses)
+    if args.sortie and args.sortie.endswith(".parquet"):
+        ecrivain = EcrivainParquet(args.sortie, analyses, args.lignes_par_groupe)
+    else:
+        ecrivain = EcrivainJsonl(args.sortie)
+
+    def afficher(stats: Dict[str, float]):
+        print(f"{stats['jeux']} jeux ({stats['erreurs']} erreurs) en {stats['duree']:.1f} s : "
+              f"{stats['debit']:.1f} jeux/s", file=sys.stderr)
+
+    memoire = args.memoire_travailleur * (1 << 20) if args.memoire_travailleur else None
+    try:
+        stats = executer(lire_sources(args.entrees), analyses, ecrivain, args.processus, args.en_vol,
+                         args.paquet, args.epsilon, args.ordonne, memoire, afficher, args.intervalle)
+    finally:
+        ecrivain.fermer()
+    afficher(stats)
+    return 1 if stats["erreurs"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+"""
+Jeux de potentiel (exact ou pondéré), typiquement les jeux de congestion et
+de routage.
+
+Un jeu admet un potentiel pondéré de poids w > 0 si une fonction Φ des
+profils vérifie, pour toute déviation unilatérale du joueur i,
+u_i(s'_i, s_-i) - u_i(s_i, s_-i) = w_i (Φ(s'_i, s_-i) - Φ(s_i, s_-i)) ;
+le potentiel est exact si tous les poids valent 1. D'après Monderer et
+Shapley, il suffit que la somme des écarts de v_k = u_k / w_k soit nulle sur
+les cycles de longueur 4 entre stratégies consécutives de deux joueurs i, j,
+c'est-à-dire que la différence croisée Δ_i Δ_j (v_i - v_j) soit nulle.
+
+Les maxima de Φ sont des équilibres de Nash purs, et toute suite de
+déviations profitables (chemin d'amélioration) y conduit en un nombre fini
+de pas : on remonte Φ par la déviation qui l'augmente le plus.
+"""
+import numpy as np
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from .modeles import Jeu
+
+TYPES_POTENTIEL = ("exact", "pondere")
+
+# Cellules d'un tenseur traitées à la fois lors des différences croisées
+_CELLULES_PAR_BLOC = 1 << 22
+
+
+def _blocs(forme: Tuple[int, ...], i: int, j: int) -> Iterator[Tuple[slice, ...]]:
+    """Découpe le tenseur d'un joueur le long d'un axe autre que i et j"""
+    autres = [a for a in range(len(forme)) if a not in (i, j)]
+    if not autres:
+        yield (slice(None),) * len(forme)
+        return
+    axe = max(autres, key=lambda a: forme[a])
+    lignes = max(1, _CELLULES_PAR_BLOC * forme[axe] // int(np.prod(forme, dtype=np.int64)))
+    for debut in range(0, forme[axe], lignes):
+        tranche = [slice(None)] * len(forme)
+        tranche[axe] = slice(debut, debut + lignes)
+        yield tuple(tranche)
+
+
+def _difference_croisee(gains: np.ndarray, i: int, j: int) -> np.ndarray:
+    return np.diff(np.diff(np.asarray(gains, dtype=np.float64), axis=i), axis=j)
+
+
+def _echelle(jeu: Jeu) -> float:
+    return max(1.0, float(np.abs(jeu.tenseur).max()))
+
+
+def _verifier_poids(jeu: Jeu, poids: np.ndarray, tolerance: float) -> bool:
+    """Les différences croisées de u_i / w_i - u_j / w_j sont-elles nulles pour toute paire ?"""
+    forme = jeu.forme
+    seuil = tolerance * _echelle(jeu) / poids.min()
+    for i in range(len(forme)):
+        for j in range(i + 1, len(forme)):
+            if forme[i] < 2 or forme[j] < 2:
+                continue
+            for tranche in _blocs(forme, i, j):
+                ecart = (_difference_croisee(jeu.tenseur[i][tranche], i, j) / poids[i]
+                         - _difference_croisee(jeu.tenseur[j][tranche], i, j) / poids[j])
+                if np.abs(ecart).max() > seuil:
+                    return False
+    return True
+
+
+def _poids_candidats(jeu: Jeu, tolerance: float) -> Optional[np.ndarray]:
+    """
+    Poids tels que Δ_iΔ_j u_i = (w_i / w_j) Δ_iΔ_j u_j, par moindres carrés
+    sur chaque paire puis propagation (w = 1 pour le premier joueur de chaque
+    composante) ; None si un rapport est négatif ou incohérent.
+    """
+    forme = jeu.forme
+    n = len(forme)
+    seuil = (tolerance * _echelle(jeu)) ** 2
+    rapports: Dict[Tuple[int, int], float] = {}
+    for i in range(n):
+        for j in range(i + 1, n):
+            if forme[i] < 2 or forme[j] < 2:
+                continue
+            ab = bb = aa = 0.0
+            for tranche in _blocs(forme, i, j):
+                a = _difference_croisee(jeu.tenseur[i][tranche], i, j)
+                b = _difference_croisee(jeu.tenseur[j][tranche], i, j)
+                ab += float(np.vdot(a, b))
+                bb += float(np.vdot(b, b))
+                aa += float(np.vdot(a, a))
+            if bb <= seuil and aa <= seuil:
+                continue
+            if bb <= seuil or aa <= seuil or ab <= 0:
+                return None
+            rapports[(i, j)] = ab / bb
+
+    voisins: List[List[Tuple[int, float]]] = [[] for _ in range(n)]
+    for (i, j), r in rapports.items():
+        # w_i = r * w_j
+        voisins[i].append((j, 1.0 / r))
+        voisins[j].append((i, r))
+    poids = np.full(n, np.nan)
+    for racine in range(n):
+        if not np.isnan(poids[racine]):
+            continue
+        poids[racine] = 1.0
+        pile = [racine]
+        while pile:
+            k = pile.pop()
+            for voisin, facteur in voisins[k]:
+                valeur = poids[k] * facteur
+                if np.isnan(poids[voisin]):
+                    poids[voisin] = valeur
+                    pile.append(voisin)
+                elif not np.isclose(poids[voisin], valeur, rtol=1e-6):
+                    return None
+    return poids
+
+
+def fonction_potentiel(jeu: Jeu, poids: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Tenseur Φ (forme du jeu, Φ = 0 au profil (0, ..., 0)) construit en
+    changeant les stratégies une à une : Φ(s) = somme des écarts de v_i le long
+    du chemin (0, ..., 0) -> (s_1, 0, ...) -> ... -> s. Suppose que le jeu
+    admet un potentiel de ces poids.
+    """
+    forme = jeu.forme
+    n = len(forme)
+    poids = np.ones(n) if poids is None else np.asarray(poids, dtype=np.float64)
+    potentiel = np.zeros(forme)
+    for i in range(n):
+        # v_i(s_1, ..., s_i, 0, ..., 0) - v_i(s_1, ..., s_{i-1}, 0, ..., 0)
+        v = np.asarray(jeu.tenseur[i][(Ellipsis,) + (0,) * (n - i - 1)], dtype=np.float64) / poids[i]
+        ecarts = v - v[..., :1]
+        potentiel += ecarts.reshape(ecarts.shape + (1,) * (n - i - 1))
+    return potentiel
+
+
+def detecter_potentiel(jeu: Jeu, tolerance: float = 1e-9) -> Optional[Dict[str, object]]:
+    """
+    Potentiel exact, sinon pondéré, du jeu ; None s'il n'en admet pas.
+    La tolérance est relative au plus grand gain en valeur absolue.
+    Retourne {"type": "exact" | "pondere", "poids": w, "potentiel": Φ}.
+    """
+    poids = np.ones(jeu.n_joueurs)
+    if _verifier_poids(jeu, poids, tolerance):
+        type_potentiel = "exact"
+    else:
+        poids = _poids_candidats(jeu, tolerance)
+        if poids is None or np.allclose(poids, 1.0) or not _verifier_poids(jeu, poids, tolerance):
+            return None
+        type_potentiel = "pondere"
+    return {"type": type_potentiel, "poids": poids, "potentiel": fonction_potentiel(jeu, poids)}
+
+
+def maxima_potentiel(potentiel: np.ndarray, tolerance: float = 1e-9) -> List[Tuple[int, ...]]:
+    """Profils maximisant Φ (des équilibres de Nash purs)"""
+    seuil = potentiel.max() - tolerance * max(1.0, float(np.abs(potentiel).max()))
+    return [tuple(int(x) for x in p) for p in np.argwhere(potentiel >= seuil)]
+
+
+def chemins_amelioration(potentiel: np.ndarray, departs: Union[None, int, Sequence[Sequence[int]]] = None,
+                         max_iterations: int = 10000, graine: Optional[int] = None,
+                         tolerance: float = 1e-9) -> Dict[str, object]:
+    """
+    Chemins d'amélioration guidés par le potentiel, depuis plusieurs départs à
+    la fois : à chaque pas, parmi les meilleures réponses des joueurs, on
+    joue celle qui augmente le plus Φ ; un chemin s'arrête sur un équilibre
+    de Nash pur (aucune déviation n'augmente Φ).
+    departs: None -> (0, ..., 0) ; un entier B -> B profils tirés uniformément ;
+    sinon les profils donnés.
+    Retourne "profils" (B, n) atteints, "longueurs", "converge" et "chemins"
+    (un tableau (longueur + 1, n) de profils par départ).
+    """
+    forme = potentiel.shape
+    n = len(forme)
+    if departs is None:
+        profils = np.zeros((1, n), dtype=np.int64)
+    elif isinstance(departs, (int, np.integer)):
+        if departs < 1:
+            raise ValueError("Il faut au moins un départ")
+        rng = np.random.default_rng(graine)
+        profils = np.stack([rng.integers(0, s, size=int(departs)) for s in forme], axis=1).astype(np.int64)
+    else:
+        profils = np.atleast_2d(np.asarray(departs, dtype=np.int64)).copy()
+        if profils.shape[1] != n or np.any(profils < 0) or np.any(profils >= np.array(forme)):
+            raise ValueError("Profil de départ invalide")
+
+    plat = potentiel.ravel()
+    pas = np.array([int(np.prod(forme[k + 1:], dtype=np.int64)) for k in range(n)], dtype=np.int64)
+    seuil = tolerance * max(1.0, float(np.abs(potentiel).max()))
+    B = len(profils)
+    longueurs = np.zeros(B, dtype=np.int64)
+    actifs = np.arange(B)
+    historique = [(actifs, profils.copy())]
+
+    for _ in range(max_iterations):
+        if not len(actifs):
+            break
+        courants = profils[actifs]
+        codes = courants @ pas
+        valeurs = plat[codes]
+        meilleur_gain = np.zeros(len(actifs))
+        meilleur_joueur = np.full(len(actifs), -1)
+        meilleure_strategie = np.zeros(len(actifs), dtype=np.int64)
+        for k in range(n):
+            # Φ le long de l'axe k, les autres stratégies fixées
+            fibres = plat[(codes - courants[:, k] * pas[k])[:, None] + np.arange(forme[k]) * pas[k]]
+            strategie = fibres.argmax(axis=1)
+            gain = fibres[np.arange(len(actifs)), strategie] - valeurs
+            mieux = gain > np.maximum(meilleur_gain, seuil)
+            meilleur_gain[mieux] = gain[mieux]
+            meilleur_joueur[mieux] = k
+            meilleure_strategie[mieux] = strategie[mieux]
+
+        bouge = meilleur_joueur >= 0
+        actifs = actifs[bouge]
+        profils[actifs, meilleur_joueur[bouge]] = meilleure_strategie[bouge]
+        longueurs[actifs] += 1
+        historique.append((actifs, profils[actifs].copy()))
+
+    chemins = [[] for _ in range(B)]
+    for indices, etape in historique:
+        for b, profil in zip(indices.tolist(), etape):
+            chemins[b].append(profil)
+    converge = np.ones(B, dtype=bool)
+    converge[actifs] = False
+    return {"profils": profils, "longueurs": longueurs, "converge": converge,
+            "chemins": [np.array(c) for c in chemins]}
@@ -0,0 +1,215 @@
+"""
+Table précalculée des meilleures réponses et dynamique de meilleure réponse
+vectorisée.
+
+Pour chaque joueur et chaque profil adverse, la table garde la plus petite
+meilleure réponse (tableau d'argmax) et l'ensemble des meilleures réponses
+ex aequo (masque de bits, np.packbits, bit k = stratégie k) : une requête
+est une lecture de tableau.
+"""
+import numpy as np
+from typing import Dict, List, Tuple
+from .modeles import Jeu
+
+DYNAMIQUES = ("sequentielle", "simultanee")
+# Cellules d'états gardées à la fois lors du parcours des cycles
+_ETATS_PAR_PAQUET = 1 << 22
+
+
+class TableMeilleuresReponses:
+    def __init__(self, jeu: Jeu, epsilon: float = 0.0):
+        self.jeu = jeu
+        self.epsilon = epsilon
+        self.forme = jeu.forme
+        self._axes = {j.id: k for k, j in enumerate(jeu.joueurs)}
+        # Par joueur (axe k), tables à plat indexées par le profil adverse
+        self.argmax: List[np.ndarray] = []
+        self.egalites: List[np.ndarray] = []
+        # Pas de l'index à plat du profil adverse, pour chaque axe du profil complet (0 sur l'axe k)
+        self._pas: List[np.ndarray] = []
+        self._pas_autres: List[List[int]] = []
+        self._formes_autres: List[List[int]] = []
+        for k in range(len(self.forme)):
+            autres = [s for a, s in enumerate(self.forme) if a != k]
+            pas = np.zeros(len(self.forme), dtype=np.int64)
+            pas[[a for a in range(len(self.forme)) if a != k]] = _pas_c(autres)
+            self._pas.append(pas)
+            self._pas_autres.append(_pas_c(autres).tolist())
+            self._formes_autres.append(autres)
+
+            g = np.moveaxis(np.asarray(jeu.tenseur[k]), k, -1).reshape(-1, self.forme[k])
+            meilleur = g.max(axis=1, keepdims=True)
+            masque = g >= meilleur - epsilon
+            self.argmax.append(masque.argmax(axis=1).astype(np.min_scalar_type(self.forme[k] - 1)))
+            self.egalites.append(np.packbits(masque, axis=1, bitorder="little"))
+
+        # Vues memoryview pour les requêtes unitaires : l'accès à un élément
+        # rend un int Python, sans passer par un scalaire numpy
+        self._argmax_vues = [memoryview(a) for a in self.argmax]
+        self._egalites_vues = [memoryview(e.reshape(-1)) for e in self.egalites]
+
+    def _index(self, k: int, strategies_autres: Tuple[int, ...]) -> int:
+        """Index à plat d'un profil adverse (calcul en Python : plus rapide que numpy pour un seul profil)"""
+        if len(strategies_autres) != len(self.forme) - 1:
+            raise ValueError("Il faut une stratégie pour chacun des autres joueurs")
+        index = 0
+        for s, pas, taille in zip(strategies_autres, self._pas_autres[k], self._formes_autres[k]):
+            if not 0 <= s < taille:
+                raise ValueError(f"Stratégie {s} hors limites")
+            index += s * pas
+        return index
+
+    def axe(self, id_joueur: int) -> int:
+        if id_joueur not in self._axes:
+            raise ValueError("Joueur non trouvé")
+        return self._axes[id_joueur]
+
+    def meilleure(self, id_joueur: int, strategies_autres: Tuple[int, ...]) -> int:
+        """Plus petite meilleure réponse aux stratégies des autres joueurs (dans l'ordre des joueurs)"""
+        k = self.axe(id_joueur)
+        return self._argmax_vues[k][self._index(k, strategies_autres)]
+
+    def meilleures(self, id_joueur: int, strategies_autres: Tuple[int, ...]) -> List[int]:
+        """Toutes les meilleures réponses (ex aequo compris)"""
+        k = self.axe(id_joueur)
+        largeur = self.egalites[k].shape[1]
+        debut = self._index(k, strategies_autres) * largeur
+        bits = int.from_bytes(self._egalites_vues[k][debut:debut + largeur], "little")
+        # Un tour de boucle par meilleure réponse (bit de poids faible à chaque fois)
+        meilleures = []
+        while bits:
+            bas = bits & -bits
+            meilleures.append(bas.bit_length() - 1)
+            bits ^= bas
+        return meilleures
+
+    def est_meilleure(self, id_joueur: int, profil: Tuple[int, ...]) -> bool:
+        """Vrai si la stratégie du joueur dans `profil` est une meilleure réponse aux autres"""
+        k = self.axe(id_joueur)
+        s = profil[k]
+        octet = self.egalites[k][int(np.dot(self._pas[k], profil)), s >> 3]
+        return bool((octet >> (s & 7)) & 1)
+
+    def reponses(self, k: int, profils: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Pour un lot de profils (B, n) : plus petite meilleure réponse du joueur
+        d'axe k, et si sa stratégie actuelle est déjà une meilleure réponse.
+        """
+        index = profils @ self._pas[k]
+        s = profils[:, k]
+        deja = (self.egalites[k][index, s >> 3] >> (s & 7)) & 1
+        return self.argmax[k][index], deja.astype(bool)
+
+    def dynamique(self, departs: np.ndarray, mode: str = "sequentielle",
+                  max_iterations: int = 1000) -> Dict[str, object]:
+        """
+        Dynamique de meilleure réponse depuis un lot de profils de départ (B, n).
+        Un joueur ne change de stratégie que si la sienne n'est pas une
+        meilleure réponse, et prend alors la plus petite meilleure réponse.
+        mode: "sequentielle" (les joueurs révisent l'un après l'autre ; une
+        itération est un tour complet) ou "simultanee" (tous à la fois).
+
+        Les cycles sont détectés par l'algorithme de Brent, sur l'état aux
+        débuts d'itération. Retourne un dictionnaire :
+            "profils": profils atteints (B, n) (un profil du cycle pour un cycle)
+            "statut": tableau de chaînes "equilibre", "cycle" ou "non_converge"
+            "iterations": itérations effectuées par départ
+            "cycle": indice du cycle atteint dans "cycles" (-1 sinon)
+            "cycles": cycles distincts, chacun commençant par son plus petit profil
+        """
+        if mode not in DYNAMIQUES:
+            raise ValueError(f"Dynamique inconnue: {mode}")
+        profils = np.array(departs, dtype=np.int64, copy=True)
+        if profils.ndim != 2 or profils.shape[1] != len(self.forme):
+            raise ValueError("Les départs doivent être un tableau (B, n_joueurs)")
+        if np.any(profils < 0) or np.any(profils >= np.array(self.forme)):
+            raise ValueError("Stratégie hors limites dans les départs")
+
+        B = len(profils)
+        pas = _pas_c(list(self.forme))
+        statut = np.full(B, "non_converge", dtype=object)
+        iterations = np.zeros(B, dtype=np.int64)
+        numero_cycle = np.full(B, -1, dtype=np.int64)
+        cycles: List[List[Tuple[int, ...]]] = []
+        index_cycles: Dict[int, int] = {}
+
+        actifs = np.arange(B)
+        # Brent : état de référence (profil à plat), puissance de 2 courante, longueur depuis la référence
+        reference = profils @ pas
+        puissance = np.ones(B, dtype=np.int64)
+        longueur = np.zeros(B, dtype=np.int64)
+
+        for t in range(1, max_iterations + 1):
+            suivant, stable = self._etape(profils[actifs], mode)
+            profils[actifs] = suivant
+            iterations[actifs] = t
+            statut[actifs[stable]] = "equilibre"
+
+            longueur[actifs] += 1
+            boucle = ~stable & (suivant @ pas == reference[actifs])
+            if boucle.any():
+                r = actifs[boucle]
+                statut[r] = "cycle"
+                numero_cycle[r] = self._cycles(profils[r], longueur[r], mode, pas, index_cycles, cycles)
+            fini = stable | boucle
+
+            # Nouvelle référence quand la longueur atteint la puissance de 2 courante
+            relance = ~fini & (longueur[actifs] == puissance[actifs])
+            a = actifs[relance]
+            reference[a] = profils[a] @ pas
+            puissance[a] *= 2
+            longueur[a] = 0
+
+            actifs = actifs[~fini]
+            if len(actifs) == 0:
+                break
+
+        return {"profils": profils, "statut": statut, "iterations": iterations,
+                "cycle": numero_cycle, "cycles": cycles}
+
+    def _etape(self, profils: np.ndarray, mode: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Une itération pour un lot de profils ; retourne (profils suivants, aucun changement)"""
+        suivant = profils.copy()
+        stable = np.ones(len(profils), dtype=bool)
+        for k in range(len(self.forme)):
+            meilleure, deja = self.reponses(k, suivant if mode == "sequentielle" else profils)
+            suivant[:, k] = np.where(deja, suivant[:, k], meilleure)
+            stable &= deja
+        return suivant, stable
+
+    def _cycles(self, departs: np.ndarray, longueurs: np.ndarray, mode: str, pas: np.ndarray,
+                index_cycles: Dict[int, int], cycles: List[List[Tuple[int, ...]]]) -> np.ndarray:
+        """
+        Parcourt en lot (par paquets) les cycles passant par `departs`, de
+        longueurs connues. Un cycle est identifié par son plus petit profil à
+        plat ; seuls les cycles nouveaux sont ajoutés à `cycles`, en commençant
+        par ce profil. Retourne l'indice du cycle de chaque départ.
+        """
+        numeros = np.empty(len(departs), dtype=np.int64)
+        paquet = max(1, _ETATS_PAR_PAQUET // max(1, int(longueurs.max()) * len(self.forme)))
+        for debut in range(0, len(departs), paquet):
+            courant = departs[debut:debut + paquet]
+            lg = longueurs[debut:debut + paquet]
+            etats = np.empty((int(lg.max()),) + courant.shape, dtype=np.int64)
+            for t in range(len(etats)):
+                etats[t] = courant
+                courant, _ = self._etape(courant, mode)
+            codes = etats @ pas
+            codes[np.arange(len(etats))[:, None] >= lg[None, :]] = np.iinfo(np.int64).max
+            premiers = np.argmin(codes, axis=0)
+            for r, (premier, cle) in enumerate(zip(premiers, codes[premiers, np.arange(len(lg))])):
+                cle = int(cle)
+                if cle not in index_cycles:
+                    ordre = np.r_[premier:lg[r], 0:premier]
+                    index_cycles[cle] = len(cycles)
+                    cycles.append([tuple(int(s) for s in p) for p in etats[ordre, r]])
+                numeros[debut + r] = index_cycles[cle]
+        return numeros
+
+
+def _pas_c(forme: List[int]) -> np.ndarray:
+    """Pas (en éléments) d'un tableau C de forme `forme`"""
+    pas = np.ones(len(forme), dtype=np.int64)
+    for a in range(len(forme) - 2, -1, -1):
+        pas[a] = pas[a + 1] * forme[a + 1]
+    return pas
@@ -0,0 +1,74 @@
+"""
+Niveaux de sécurité (maxmin) des joueurs d'un jeu à N joueurs.
+
+En stratégies pures, le gain garanti par une stratégie est son minimum sur
+tous les profils adverses : une seule réduction sur tous les axes adverses.
+
+En stratégies mixtes, le joueur k cherche x dans le simplexe maximisant
+min_{s_-k} somme_a x_a u_k(a, s_-k) ; le gain étant multilinéaire, le pire
+cas est atteint en un profil adverse pur. Programme linéaire :
+    max v  s.c.  v - somme_a x_a u_k(a, s_-k) <= 0 pour tout s_-k,
+                 somme_a x_a = 1,  x >= 0
+Les programmes des joueurs, indépendants, sont assemblés en un seul
+programme bloc-diagonal (objectif : somme des v_k) résolu en une fois par
+HiGHS (scipy, dépendance optionnelle).
+"""
+import time
+import numpy as np
+from typing import Callable, Dict, Optional
+from .modeles import Jeu
+from .utils import importer_scipy
+
+
+def minima_par_strategie(gains: np.ndarray, axe: int) -> np.ndarray:
+    """Pire gain de chaque stratégie du joueur de l'axe `axe`, sur tous les profils adverses"""
+    autres = tuple(a for a in range(gains.ndim) if a != axe)
+    return np.min(gains, axis=autres) if autres else np.asarray(gains)
+
+
+def niveaux_securite_mixtes(jeu: Jeu, progression: Optional[Callable[[float], None]] = None) -> Dict[str, object]:
+    """
+    Gains garantis en stratégies mixtes de tous les joueurs (un seul programme
+    linéaire). `progression` est appelé avant l'assemblage du bloc de chaque
+    joueur et avant la résolution, qui ne s'interrompt pas. Retourne un
+    dictionnaire :
+        "valeurs": gain garanti de chaque joueur
+        "strategies": stratégie mixte de sécurité de chaque joueur
+        "contraintes": nombre de contraintes du programme
+        "temps_resolution": durée de la résolution (secondes)
+    """
+    optimize, sparse = importer_scipy("Les niveaux de sécurité mixtes")
+    blocs, sommes, tailles = [], [], []
+    for k, s in enumerate(jeu.forme):
+        if progression is not None:
+            progression(k / (jeu.n_joueurs + 1))
+        # Une ligne par profil adverse : -u_k(., s_-k) sur les x_k, 1 sur v_k
+        G = np.moveaxis(np.asarray(jeu.tenseur[k], dtype=np.float64), k, -1).reshape(-1, s)
+        blocs.append(sparse.hstack([sparse.csr_array(-G), sparse.csr_array(np.ones((len(G), 1)))]))
+        sommes.append(sparse.csr_array(np.r_[np.ones(s), 0.0][None, :]))
+        tailles.append(s + 1)
+    A_ub = sparse.block_diag(blocs, format="csc")
+    A_eq = sparse.block_diag(sommes, format="csc")
+    debuts = np.r_[0, np.cumsum(tailles)]
+    c = np.zeros(debuts[-1])
+    c[debuts[1:] - 1] = -1.0
+    bornes = np.zeros((debuts[-1], 2))
+    bornes[:, 1] = np.inf
+    bornes[debuts[1:] - 1] = (-np.inf, np.inf)
+
+    if progression is not None:
+        progression(jeu.n_joueurs / (jeu.n_joueurs + 1))
+    debut = time.perf_counter()
+    resultat = optimize.linprog(c, A_ub=A_ub, b_ub=np.zeros(A_ub.shape[0]), A_eq=A_eq,
+                                b_eq=np.ones(jeu.n_joueurs), bounds=bornes, method="highs")
+    temps_resolution = time.perf_counter() - debut
+    if resultat.status != 0:
+        raise RuntimeError(f"Le programme linéaire n'a pas été résolu: {resultat.message}")
+
+    valeurs = resultat.x[debuts[1:] - 1].copy()
+    strategies = []
+    for k in range(jeu.n_joueurs):
+        x = np.clip(resultat.x[debuts[k]:debuts[k + 1] - 1], 0, None)
+        strategies.append(x / x.sum())
+    return {"valeurs": valeurs, "strategies": strategies, "contraintes": A_ub.shape[0],
+            "temps_resolution": temps_resolution}
@@ -0,0 +1,77 @@
+"""
+Format binaire des jeux (.tjeu), lisible par morceaux avec np.memmap.
+
+Disposition du fichier (entiers en little-endian) :
+
+    octets 0-3    signature b"TJEU"
+    octets 4-5    version du format (uint16, actuellement 1)
+    octets 6-7    réservé (0)
+    octets 8-11   longueur L de l'en-tête JSON (uint32)
+    octets 12-    en-tête JSON UTF-8 de L octets, complété par des espaces
+                  pour que les gains commencent sur un multiple de 64 octets :
+                  {"dtype": "<f8", "forme": [s1, ..., sn],
+                   "joueurs": [{"id": 1, "strategies": ["A", "B"]}, ...]}
+    ensuite       tenseur de gains (n_joueurs, s1, ..., sn) brut, ordre C,
+                  dans le type "dtype" (toujours little-endian)
+"""
+import json
+import struct
+import numpy as np
+from typing import Dict
+from .modeles import Jeu, Joueur
+
+SIGNATURE = b"TJEU"
+VERSION = 1
+_PREAMBULE = struct.Struct("<4sHHI")
+_ALIGNEMENT = 64
+
+
+def sauvegarder_jeu(jeu: Jeu, chemin: str):
+    """Écrit un jeu au format binaire, joueur par joueur (sans copie complète du tenseur)."""
+    dtype = jeu.tenseur.dtype.newbyteorder("<")
+    entete = {
+        "dtype": dtype.str,
+        "forme": list(jeu.forme),
+        "joueurs": [{"id": j.id, "strategies": list(j.strategies)} for j in jeu.joueurs],
+    }
+    texte = json.dumps(entete, ensure_ascii=False).encode("utf-8")
+    debut = _PREAMBULE.size + len(texte)
+    texte += b" " * (-debut % _ALIGNEMENT)
+
+    with open(chemin, "wb") as f:
+        f.write(_PREAMBULE.pack(SIGNATURE, VERSION, 0, len(texte)))
+        f.write(texte)
+        for k in range(jeu.n_joueurs):
+            np.ascontiguousarray(jeu.tenseur[k], dtype=dtype).tofile(f)
+
+
+def lire_entete(chemin: str) -> Dict:
+    """Lit l'en-tête d'un fichier de jeu ; ajoute "offset", la position des gains."""
+    with open(chemin, "rb") as f:
+        preambule = f.read(_PREAMBULE.size)
+        if len(preambule) < _PREAMBULE.size:
+            raise ValueError(f"Fichier de jeu tronqué: {chemin}")
+        signature, version, _, longueur = _PREAMBULE.unpack(preambule)
+        if signature != SIGNATURE:
+            raise ValueError(f"Ce n'est pas un fichier de jeu: {chemin}")
+        if version != VERSION:
+            raise ValueError(f"Version de format non supportée: {version}")
+        entete = json.loads(f.read(longueur).decode("utf-8"))
+    entete["offset"] = _PREAMBULE.size + longueur
+    return entete
+
+
+def charger_jeu_binaire(chemin: str, mode: str = "r") -> Jeu:
+    """
+    Ouvre un fichier de jeu sans lire les gains : le tenseur du jeu est un
+    np.memmap, les pages sont chargées à la demande par les analyses.
+    mode: "r" (lecture seule), "r+" (modifications écrites dans le fichier)
+    ou "c" (copie à l'écriture). Après une écriture dans le tenseur, appeler
+    jeu.signaler_modification().
+    """
+    entete = lire_entete(chemin)
+    joueurs = [Joueur(j["id"], j["strategies"]) for j in entete["joueurs"]]
+    forme = (len(joueurs),) + tuple(entete["forme"])
+    tenseur = np.memmap(chemin, dtype=np.dtype(entete["dtype"]), mode=mode,
+                        offset=entete["offset"], shape=forme, order="C")
+    return Jeu.depuis_tenseur(joueurs, tenseur)
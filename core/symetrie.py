@@ -0,0 +1,303 @@
+"""
+Jeux symétriques et anonymes, représentés par vecteurs de comptes.
+
+Dans un jeu anonyme, tous les joueurs ont le même nombre de stratégies et le
+gain d'un joueur ne dépend que de sa stratégie et du nombre d'autres joueurs
+choisissant chaque stratégie (vecteur de comptes). Un jeu symétrique est un
+jeu anonyme où tous les joueurs ont la même fonction de gain.
+
+JeuAnonyme stocke, par joueur (une seule table pour un jeu symétrique), les
+gains de forme (s, C(n - 1 + s - 1, s - 1)) : le nombre de vecteurs de comptes
+est polynomial en n au lieu des s^n profils du tenseur dense.
+
+Les vecteurs de comptes sont numérotés par le rang colexicographique de la
+combinaison « étoiles et barres » associée : le compte c se lit comme les
+positions b_i = c_0 + ... + c_i + i des s - 1 barres, de rang somme C(b_i, i + 1).
+"""
+import numpy as np
+from itertools import combinations
+from math import comb
+from typing import List, Optional, Tuple
+from .modeles import Jeu, Joueur
+from .pareto import frontiere_pareto
+
+# Taille maximale (en cellules) d'un tenseur dense produit par vers_jeu()
+_MAX_CELLULES_DENSE = 1 << 24
+
+# Équilibre ou optimum : (vecteur de comptes, un profil réalisant ces comptes)
+ClasseProfils = Tuple[Tuple[int, ...], Tuple[int, ...]]
+
+
+def _binomiaux(total: int, n_strategies: int) -> np.ndarray:
+    """Table C(x, y) pour x < total + n_strategies et y < n_strategies"""
+    return np.array([[comb(x, y) for y in range(n_strategies)]
+                     for x in range(total + n_strategies)], dtype=np.int64)
+
+
+def rang_comptes(comptes: np.ndarray) -> np.ndarray:
+    """Rang de vecteurs de comptes (..., s) de même somme parmi tous ceux de cette somme"""
+    comptes = np.asarray(comptes, dtype=np.int64)
+    s = comptes.shape[-1]
+    if s == 1:
+        return np.zeros(comptes.shape[:-1], dtype=np.int64)
+    binom = _binomiaux(int(comptes.sum(axis=-1).max(initial=0)), s)
+    barres = np.cumsum(comptes[..., :-1], axis=-1) + np.arange(s - 1)
+    return binom[barres, np.arange(1, s)].sum(axis=-1)
+
+
+def comptes_possibles(total: int, n_strategies: int) -> np.ndarray:
+    """Tous les vecteurs de comptes de somme `total`, rangés par rang_comptes"""
+    if n_strategies == 1:
+        return np.array([[total]], dtype=np.int64)
+    barres = np.array(list(combinations(range(total + n_strategies - 1), n_strategies - 1)), dtype=np.int64)
+    bornes = np.concatenate([np.full((len(barres), 1), -1), barres,
+                             np.full((len(barres), 1), total + n_strategies - 1)], axis=1)
+    comptes = np.diff(bornes, axis=1) - 1
+    resultat = np.empty_like(comptes)
+    resultat[rang_comptes(comptes)] = comptes
+    return resultat
+
+
+class JeuAnonyme:
+    """
+    Jeu anonyme (ou symétrique) : tables[t][a, r] est le gain d'un joueur
+    jouant a quand les autres ont le vecteur de comptes de rang r. Une seule
+    table (jeu symétrique) ou une par joueur, dans l'ordre de `joueurs`.
+    """
+
+    __slots__ = ("joueurs", "tables")
+
+    def __init__(self, joueurs: List[Joueur], tables: np.ndarray):
+        tailles = {len(j.strategies) for j in joueurs}
+        if len(tailles) != 1:
+            raise ValueError("Tous les joueurs doivent avoir le même nombre de stratégies")
+        self.joueurs = joueurs
+        tables = np.asarray(tables)
+        s = tailles.pop()
+        attendu = (s, comb(len(joueurs) - 1 + s - 1, s - 1))
+        if tables.ndim != 3 or tables.shape[1:] != attendu or tables.shape[0] not in (1, len(joueurs)):
+            raise ValueError(f"Dimensions incorrectes pour les tables de gains: {tables.shape}")
+        self.tables = tables
+
+    @property
+    def symetrique(self) -> bool:
+        return len(self.tables) == 1
+
+    @property
+    def n_joueurs(self) -> int:
+        return len(self.joueurs)
+
+    @property
+    def n_strategies(self) -> int:
+        return self.tables.shape[1]
+
+    @property
+    def forme(self) -> Tuple[int, ...]:
+        return (self.n_strategies,) * self.n_joueurs
+
+    def table(self, id_joueur: int) -> np.ndarray:
+        """Table (s, n_comptes) du joueur"""
+        for k, j in enumerate(self.joueurs):
+            if j.id == id_joueur:
+                return self.tables[0 if self.symetrique else k]
+        raise ValueError("Joueur non trouvé")
+
+    def gain(self, id_joueur: int, profil: Tuple[int, ...]) -> float:
+        k = [j.id for j in self.joueurs].index(id_joueur)
+        autres = np.bincount(np.delete(np.asarray(profil), k), minlength=self.n_strategies)
+        return self.table(id_joueur)[profil[k], rang_comptes(autres)]
+
+    def vers_jeu(self) -> Jeu:
+        """Jeu dense équivalent (petits jeux uniquement)"""
+        if float(self.n_strategies) ** self.n_joueurs * self.n_joueurs > _MAX_CELLULES_DENSE:
+            raise ValueError("Jeu trop grand pour une représentation dense")
+        comptes = _comptes_profils(self.n_joueurs, self.n_strategies)
+        tenseur = np.empty((self.n_joueurs,) + self.forme, dtype=self.tables.dtype)
+        for k in range(self.n_joueurs):
+            propre, rang = _rang_autres(comptes, k)
+            tenseur[k] = self.tables[0 if self.symetrique else k][propre, rang]
+        return Jeu.depuis_tenseur(self.joueurs, tenseur)
+
+
+def _comptes_profils(n_joueurs: int, n_strategies: int) -> np.ndarray:
+    """Vecteur de comptes de chaque profil du tenseur dense, de forme (s,) * n + (s,)"""
+    comptes = np.zeros((n_strategies,) * n_joueurs + (n_strategies,), dtype=np.int64)
+    unite = np.eye(n_strategies, dtype=np.int64)
+    for k in range(n_joueurs):
+        forme = [1] * n_joueurs + [n_strategies]
+        forme[k] = n_strategies
+        comptes += unite.reshape(forme)
+    return comptes
+
+
+def _rang_autres(comptes: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Pour chaque profil : stratégie du joueur k et rang du vecteur de comptes des autres"""
+    n_joueurs = comptes.ndim - 1
+    s = comptes.shape[-1]
+    forme = [1] * n_joueurs
+    forme[k] = s
+    propre = np.broadcast_to(np.arange(s).reshape(forme), comptes.shape[:-1])
+    if s == 1:
+        return propre, np.zeros(comptes.shape[:-1], dtype=np.int64)
+    # Barres des comptes complets, décalées d'un cran à partir de la stratégie propre
+    barres = np.cumsum(comptes[..., :-1], axis=-1) + np.arange(s - 1)
+    barres -= propre[..., None] <= np.arange(s - 1)
+    binom = _binomiaux(n_joueurs - 1, s)
+    return propre, binom[barres, np.arange(1, s)].sum(axis=-1)
+
+
+def _tables_anonymes(jeu: Jeu, tolerance: float) -> Optional[List[np.ndarray]]:
+    """Tables (s, n_comptes) de chaque joueur si le jeu est anonyme, None sinon"""
+    tailles = set(jeu.forme)
+    if len(tailles) != 1:
+        return None
+    s = tailles.pop()
+    n = jeu.n_joueurs
+    comptes = _comptes_profils(n, s)
+    tables = []
+    for k, joueur in enumerate(jeu.joueurs):
+        gains = np.asarray(jeu.gains[joueur.id])
+        propre, rang = _rang_autres(comptes, k)
+        table = np.empty((s, comb(n - 1 + s - 1, s - 1)), dtype=gains.dtype)
+        table[propre, rang] = gains
+        # Anonyme si chaque profil retrouve son gain dans la table remplie
+        if not _egaux(table[propre, rang], gains, tolerance):
+            return None
+        tables.append(table)
+    return tables
+
+
+def _egaux(a: np.ndarray, b: np.ndarray, tolerance: float) -> bool:
+    if not tolerance:
+        return bool(np.array_equal(a, b))
+    # Différence en flottant : pas de débordement pour les types non signés
+    return bool(np.all(np.abs(a.astype(np.float64) - b) <= tolerance))
+
+
+def _symetriques(tables: List[np.ndarray], tolerance: float) -> bool:
+    return all(_egaux(t, tables[0], tolerance) for t in tables[1:])
+
+
+def detecter_symetrie(jeu: Jeu, tolerance: float = 0.0) -> Optional[str]:
+    """"symetrique", "anonyme" ou None (gains égaux à `tolerance` près)"""
+    tables = _tables_anonymes(jeu, tolerance)
+    if tables is None:
+        return None
+    return "symetrique" if _symetriques(tables, tolerance) else "anonyme"
+
+
+def compresser(jeu: Jeu, tolerance: float = 0.0) -> JeuAnonyme:
+    """Représentation par vecteurs de comptes d'un jeu anonyme ou symétrique"""
+    tables = _tables_anonymes(jeu, tolerance)
+    if tables is None:
+        raise ValueError("Le jeu n'est ni symétrique ni anonyme")
+    if _symetriques(tables, tolerance):
+        tables = tables[:1]
+    return JeuAnonyme(jeu.joueurs, np.stack(tables))
+
+
+class AnalyseurAnonyme:
+    """
+    Analyses sur la représentation compressée : les profils sont parcourus
+    par vecteur de comptes (C(n + s - 1, s - 1) classes) au lieu de s^n profils.
+    """
+
+    def __init__(self, jeu: JeuAnonyme):
+        self.jeu = jeu
+        s = jeu.n_strategies
+        self.comptes = comptes_possibles(jeu.n_joueurs, s)
+        # Rang des comptes des autres pour un joueur jouant a (valide si comptes[:, a] > 0)
+        autres = self.comptes[:, None, :] - np.eye(s, dtype=np.int64)
+        self._presents = self.comptes > 0
+        self._rangs = rang_comptes(np.maximum(autres, 0))
+        self._rangs[~self._presents] = 0
+
+    def _representant(self, comptes: np.ndarray) -> Tuple[int, ...]:
+        """Profil où les premiers joueurs jouent la stratégie 0, les suivants la 1, etc."""
+        return tuple(np.repeat(np.arange(len(comptes)), comptes).tolist())
+
+    def _gains_classes(self, t: int) -> np.ndarray:
+        """Gain (classes, s) d'un joueur de la table t jouant a, dans chaque classe"""
+        return self.jeu.tables[t][np.arange(self.jeu.n_strategies), self._rangs]
+
+    def equilibres_nash(self, epsilon: float = 0.0) -> List[ClasseProfils]:
+        """Équilibres de Nash purs, un par vecteur de comptes (avec un profil qui le réalise)"""
+        s = self.jeu.n_strategies
+        equilibres = []
+        if self.jeu.symetrique:
+            table = self.jeu.tables[0]
+            # Pour chaque classe et stratégie présente a : gain actuel et meilleure déviation
+            meilleur = table[:, self._rangs].max(axis=0)
+            heureux = ~self._presents | (self._gains_classes(0) >= meilleur - epsilon)
+            for c in self.comptes[heureux.all(axis=1)]:
+                equilibres.append((tuple(c.tolist()), self._representant(c)))
+            return equilibres
+
+        # Jeu anonyme : heureux[t, classe, a] pour le joueur t placé sur a
+        heureux = np.stack([self._gains_classes(t) >= self.jeu.tables[t][:, self._rangs].max(axis=0) - epsilon
+                            for t in range(self.jeu.n_joueurs)])
+        heureux &= self._presents
+        # Condition nécessaire : assez de joueurs satisfaits pour chaque stratégie présente
+        candidats = np.all(heureux.sum(axis=0) >= self.comptes, axis=1) & heureux.any(axis=2).all(axis=0)
+        for i in np.flatnonzero(candidats):
+            profil = _affectation(heureux[:, i, :], self.comptes[i])
+            if profil is not None:
+                equilibres.append((tuple(self.comptes[i].tolist()), profil))
+        return equilibres
+
+    def optimum_pareto(self, taille_bloc: int = 4096) -> List[ClasseProfils]:
+        """
+        Optima de Pareto d'un jeu symétrique, par vecteur de comptes : tous
+        les profils d'une classe sont des permutations les uns des autres, et
+        un profil en domine un autre (à permutation près) si et seulement si
+        ses gains triés dominent ceux de l'autre, composante par composante.
+        """
+        if not self.jeu.symetrique:
+            raise ValueError("L'optimum de Pareto compressé requiert un jeu symétrique")
+        n = self.jeu.n_joueurs
+        gains = self._gains_classes(0)
+        # Gains des n joueurs de chaque classe, triés par ordre décroissant
+        ordre = np.argsort(-gains, axis=1, kind="stable")
+        cumul = np.cumsum(np.take_along_axis(self.comptes, ordre, axis=1), axis=1)
+        position = (np.arange(n)[None, :, None] >= cumul[:, None, :]).sum(axis=2)
+        points = np.take_along_axis(np.take_along_axis(gains, ordre, axis=1), position, axis=1)
+        return [(tuple(self.comptes[i].tolist()), self._representant(self.comptes[i]))
+                for i in frontiere_pareto(points, taille_bloc)]
+
+    def niveau_securite(self, id_joueur: int) -> Tuple[float, int]:
+        """Niveau de sécurité (max-min) et stratégie qui l'atteint"""
+        min_gains = self.jeu.table(id_joueur).min(axis=1)
+        meilleure_strat = int(np.argmax(min_gains))
+        return (min_gains[meilleure_strat], meilleure_strat)
+
+
+def _affectation(heureux: np.ndarray, comptes: np.ndarray) -> Optional[Tuple[int, ...]]:
+    """
+    Affecte chaque joueur à une stratégie où il est satisfait, en respectant
+    les comptes (couplage biparti à capacités, chemins augmentants). None si
+    impossible.
+    """
+    n_joueurs = len(heureux)
+    occupants: List[List[int]] = [[] for _ in comptes]
+    choix = [-1] * n_joueurs
+
+    def placer(joueur: int, vus: set) -> bool:
+        for a in np.flatnonzero(heureux[joueur]):
+            if a in vus:
+                continue
+            vus.add(a)
+            if len(occupants[a]) < comptes[a]:
+                occupants[a].append(joueur)
+                choix[joueur] = a
+                return True
+            for i, autre in enumerate(occupants[a]):
+                if placer(autre, vus):
+                    occupants[a][i] = joueur
+                    choix[joueur] = a
+                    return True
+        return False
+
+    for joueur in range(n_joueurs):
+        if not placer(joueur, set()):
+            return None
+    return tuple(int(a) for a in choix)
@@ -0,0 +1,198 @@
+"""
+Exécution d'analyses en arrière-plan, pour une interface qui ne doit pas
+attendre : pool de fils d'exécution, progression, délai et annulation.
+
+L'annulation est coopérative : la fonction d'une tâche reçoit un Suivi et
+l'appelle régulièrement (Suivi.avancer, par exemple comme rappel
+`progression` d'AnalyseurJeu) ; l'appel lève TacheAnnulee si la tâche a été
+annulée ou a dépassé son délai. Les analyses longues d'AnalyseurJeu (équilibres
+purs et mixtes, Pareto, dominance, IESDS, sécurité mixte) acceptent ce rappel
+et s'interrompent donc en cours de calcul ; seule la résolution d'un programme
+linéaire par scipy va jusqu'au bout. Une tâche pas encore démarrée est retirée
+de la file sans être exécutée.
+
+Les tâches sont rangées par espace (une session d'interface) : chaque espace
+n'a qu'un groupe actif (une configuration de jeu). Activer un autre groupe
+abandonne les tâches du précédent.
+"""
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+ETATS_TACHE = ("en_attente", "en_cours", "terminee", "erreur", "annulee", "expiree")
+
+
+class TacheAnnulee(Exception):
+    """Levée dans une tâche annulée ou dont le délai est dépassé"""
+
+
+class Suivi:
+    """Progression et point d'annulation d'une tâche"""
+
+    def __init__(self, delai: Optional[float] = None):
+        self.delai = delai
+        self.progression = 0.0
+        self.message = ""
+        self.echeance: Optional[float] = None
+        self._annulee = threading.Event()
+
+    def demarrer(self):
+        """Le délai court à partir du démarrage (pas de la mise en file)"""
+        if self.delai is not None:
+            self.echeance = time.monotonic() + self.delai
+
+    def annuler(self):
+        self._annulee.set()
+
+    @property
+    def annulee(self) -> bool:
+        return self._annulee.is_set()
+
+    @property
+    def expiree(self) -> bool:
+        return self.echeance is not None and time.monotonic() > self.echeance
+
+    def verifier(self):
+        if self.annulee:
+            raise TacheAnnulee("Tâche annulée")
+        if self.expiree:
+            raise TacheAnnulee(f"Délai de {self.delai} s dépassé")
+
+    def avancer(self, progression: float, message: str = ""):
+        """Met à jour la progression (entre 0 et 1) puis vérifie l'annulation"""
+        self.progression = min(1.0, max(0.0, float(progression)))
+        if message:
+            self.message = message
+        self.verifier()
+
+
+class Tache:
+    def __init__(self, nom: str, future: Future, suivi: Suivi):
+        self.nom = nom
+        self.suivi = suivi
+        self._future = future
+
+    @property
+    def etat(self) -> str:
+        """Un des ETATS_TACHE"""
+        if self._future.cancelled():
+            return "annulee"
+        if not self._future.done():
+            # Une tâche annulée ou expirée qui tourne encore s'arrêtera au prochain point de contrôle
+            if self.suivi.annulee:
+                return "annulee"
+            if self.suivi.expiree:
+                return "expiree"
+            return "en_cours" if self._future.running() else "en_attente"
+        erreur = self._future.exception()
+        if isinstance(erreur, TacheAnnulee):
+            return "annulee" if self.suivi.annulee else "expiree"
+        return "erreur" if erreur is not None else "terminee"
+
+    @property
+    def finie(self) -> bool:
+        return self.etat not in ("en_attente", "en_cours")
+
+    def resultat(self) -> Any:
+        """Résultat d'une tâche terminée (lève son exception sinon)"""
+        return self._future.result(timeout=0)
+
+    @property
+    def erreur(self) -> Optional[BaseException]:
+        if not self._future.done() or self._future.cancelled():
+            return None
+        return self._future.exception()
+
+    def annuler(self):
+        self.suivi.annuler()
+        self._future.cancel()
+
+
+class ExecuteurTaches:
+    """
+    Pool de `n_travailleurs` fils d'exécution partagé entre espaces. Au-delà
+    de `max_espaces`, les espaces les plus anciens sont abandonnés.
+    """
+
+    def __init__(self, n_travailleurs: int = 2, max_espaces: int = 64):
+        if n_travailleurs < 1:
+            raise ValueError("Il faut au moins un travailleur")
+        self._pool = ThreadPoolExecutor(max_workers=n_travailleurs, thread_name_prefix="analyse")
+        self.max_espaces = max_espaces
+        # espace -> (groupe actif, tâches par nom)
+        self._espaces: "OrderedDict[Hashable, Tuple[Hashable, Dict[str, Tache]]]" = OrderedDict()
+        self._verrou = threading.Lock()
+
+    def activer(self, espace: Hashable, groupe: Hashable) -> bool:
+        """
+        Rend `groupe` actif dans l'espace ; les tâches d'un groupe précédent
+        sont annulées. Retourne True si le groupe a changé.
+        """
+        with self._verrou:
+            actuel = self._espaces.get(espace)
+            if actuel is not None:
+                self._espaces.move_to_end(espace)
+                if actuel[0] == groupe:
+                    return False
+                _annuler_toutes(actuel[1])
+            self._espaces[espace] = (groupe, {})
+            while len(self._espaces) > self.max_espaces:
+                _annuler_toutes(self._espaces.popitem(last=False)[1][1])
+            return True
+
+    def soumettre(self, espace: Hashable, nom: str, fonction: Callable[..., Any], *args,
+                  delai: Optional[float] = None, remplacer: bool = False, **kwargs) -> Tache:
+        """
+        Lance fonction(suivi, *args, **kwargs) dans le groupe actif de l'espace,
+        sauf si une tâche `nom` y existe déjà (elle est alors retournée, à
+        moins que `remplacer` ne demande de l'annuler et de relancer).
+        """
+        with self._verrou:
+            if espace not in self._espaces:
+                raise ValueError(f"Espace inconnu: {espace}")
+            taches = self._espaces[espace][1]
+            existante = taches.get(nom)
+            if existante is not None and not remplacer:
+                return existante
+            if existante is not None:
+                existante.annuler()
+
+            suivi = Suivi(delai)
+
+            def executer():
+                suivi.demarrer()
+                suivi.verifier()
+                resultat = fonction(suivi, *args, **kwargs)
+                suivi.progression = 1.0
+                return resultat
+
+            tache = Tache(nom, self._pool.submit(executer), suivi)
+            taches[nom] = tache
+            return tache
+
+    def tache(self, espace: Hashable, nom: str) -> Optional[Tache]:
+        with self._verrou:
+            actuel = self._espaces.get(espace)
+            return None if actuel is None else actuel[1].get(nom)
+
+    def retirer(self, espace: Hashable, nom: str):
+        """Annule et oublie une tâche du groupe actif"""
+        with self._verrou:
+            actuel = self._espaces.get(espace)
+            tache = None if actuel is None else actuel[1].pop(nom, None)
+        if tache is not None:
+            tache.annuler()
+
+    def fermer(self):
+        with self._verrou:
+            for _, taches in self._espaces.values():
+                _annuler_toutes(taches)
+            self._espaces.clear()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _annuler_toutes(taches: Dict[str, Tache]):
+    for tache in taches.values():
+        tache.annuler()
@@ -1,18 +1,22 @@
+import csv
+import io
 import numpy as np
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence, Tuple
 from core.modeles import Jeu, Joueur 
 
-def creer_jeu_depuis_matrices(gains_joueurs: Dict[int, np.ndarray], noms_strategies: Dict[int, List[str]]) -> Jeu:
+def creer_jeu_depuis_matrices(gains_joueurs: Dict[int, np.ndarray], noms_strategies: Dict[int, List[str]],
+                              dtype: Optional[np.dtype] = None) -> Jeu:
     """
     Crée un jeu à partir des matrices de gains et noms de stratégies
     gains_joueurs: {id_joueur: matrice_gains}
     noms_strategies: {id_joueur: [noms_strategies]}
+    dtype: type de stockage des gains (ex. np.int16, np.float32), déduit par défaut
     """
     joueurs = []
     for id_joueur, noms in noms_strategies.items():
         joueurs.append(Joueur(id_joueur, noms))
     
-    return Jeu(joueurs, gains_joueurs)
+    return Jeu(joueurs, gains_joueurs, dtype)
 
 def charger_jeu_classique(nom_jeu: str) -> Jeu:
     jeux = {
@@ -55,6 +59,17 @@ def charger_jeu_classique(nom_jeu: str) -> Jeu:
     joueurs = [Joueur(id, strat) for id, strat in config["strategies"].items()]
     return Jeu(joueurs, config["gains"])
 
+def importer_scipy(usage: str):
+    """
+    Modules optimize et sparse de scipy (dépendance optionnelle des
+    programmes linéaires) ; `usage` nomme la fonctionnalité dans l'erreur.
+    """
+    try:
+        from scipy import optimize, sparse
+    except ImportError as erreur:
+        raise ImportError(f"{usage} nécessitent scipy (pip install scipy)") from erreur
+    return optimize, sparse
+
 def normaliser_gains(gains: Dict[int, np.ndarray]) -> Dict[int, np.ndarray]:
     """
     Normalise les gains entre 0 et 1 pour chaque joueur
@@ -68,3 +83,116 @@ def normaliser_gains(gains: Dict[int, np.ndarray]) -> Dict[int, np.ndarray]:
         else:
             normalises[joueur] = np.ones_like(mat) * 0.5
     return normalises
+
+def deplier_gains(gains: np.ndarray) -> np.ndarray:
+    """
+    Dépliage 2-D des gains d'un joueur : une ligne par profil des joueurs
+    1..n-1 (ordre C), une colonne par stratégie du dernier joueur. Pour deux
+    joueurs, c'est la matrice habituelle. Retourne une vue quand c'est possible.
+    """
+    gains = np.asarray(gains)
+    return gains.reshape(-1, gains.shape[-1])
+
+def replier_gains(table: np.ndarray, forme: Tuple[int, ...]) -> np.ndarray:
+    """Inverse de deplier_gains : tenseur de forme `forme`"""
+    table = np.asarray(table)
+    attendu = (int(np.prod(forme[:-1], dtype=np.int64)), forme[-1])
+    if table.shape != attendu and table.shape != tuple(forme):
+        raise ValueError(f"Dimensions incorrectes: {table.shape}, attendu {attendu} ou {tuple(forme)}")
+    return table.reshape(forme)
+
+def lire_gains_fichier(contenu: bytes, nom_fichier: str) -> np.ndarray:
+    """
+    Lit des gains depuis un fichier .npy (tableau quelconque) ou .csv
+    (tableau 2-D ; une ligne d'en-tête et une colonne d'étiquettes non
+    numériques sont ignorées, séparateur "," ou ";").
+    """
+    if nom_fichier.lower().endswith(".npy"):
+        tableau = np.load(io.BytesIO(contenu), allow_pickle=False)
+        if not np.issubdtype(tableau.dtype, np.number):
+            raise ValueError(f"Gains non numériques dans {nom_fichier}")
+        return tableau
+    if not nom_fichier.lower().endswith(".csv"):
+        raise ValueError(f"Format non supporté: {nom_fichier} (csv ou npy)")
+
+    texte = contenu.decode("utf-8-sig")
+    separateur = ";" if texte.count(";") > texte.count(",") else ","
+    lignes = [l for l in csv.reader(io.StringIO(texte), delimiter=separateur) if any(c.strip() for c in l)]
+    if lignes and not all(_est_nombre(c) for c in lignes[0][1:]):
+        lignes = lignes[1:]
+    if lignes and not all(_est_nombre(l[0]) for l in lignes):
+        lignes = [l[1:] for l in lignes]
+    try:
+        return np.array([[float(c) for c in l] for l in lignes])
+    except ValueError:
+        raise ValueError(f"Gains non numériques ou lignes de longueurs différentes dans {nom_fichier}")
+
+def _est_nombre(texte: str) -> bool:
+    try:
+        float(texte)
+    except ValueError:
+        return False
+    return True
+
+TYPES_JEUX_ALEATOIRES = ("uniforme", "somme_nulle", "coordination", "covariance", "dominance")
+
+def generer_jeu_aleatoire(n_strategies: Sequence[int], type_jeu: str = "uniforme", graine: Optional[int] = None,
+                          bas: int = 0, haut: int = 10, correlation: float = 0.0) -> Jeu:
+    """
+    Génère un jeu aléatoire reproductible (même graine, même jeu)
+    n_strategies: nombre de stratégies de chaque joueur (joueurs 1..n)
+    type_jeu:
+        - "uniforme": gains entiers uniformes dans [bas, haut]
+        - "somme_nulle": gains uniformes, le dernier joueur reçoit l'opposé de la somme des autres
+        - "coordination": tous les joueurs reçoivent les mêmes gains
+        - "covariance": gains normaux de corrélation `correlation` entre joueurs sur chaque profil
+        - "dominance": résoluble par élimination itérative des stratégies strictement dominées
+    """
+    if type_jeu not in TYPES_JEUX_ALEATOIRES:
+        raise ValueError(f"Type de jeu inconnu: {type_jeu}")
+    forme = tuple(int(s) for s in n_strategies)
+    n = len(forme)
+    if n < 2 or min(forme) < 1:
+        raise ValueError("Il faut au moins deux joueurs et une stratégie par joueur")
+    rng = np.random.default_rng(graine)
+
+    if type_jeu == "uniforme":
+        tenseur = rng.integers(bas, haut, size=(n,) + forme, endpoint=True)
+    elif type_jeu == "somme_nulle":
+        tenseur = rng.integers(bas, haut, size=(n,) + forme, endpoint=True)
+        tenseur[-1] = -tenseur[:-1].sum(axis=0)
+    elif type_jeu == "coordination":
+        commun = rng.integers(bas, haut, size=forme, endpoint=True)
+        tenseur = np.broadcast_to(commun, (n,) + forme)
+    elif type_jeu == "covariance":
+        if not -1.0 / (n - 1) <= correlation <= 1.0:
+            raise ValueError(f"Corrélation impossible pour {n} joueurs: {correlation}")
+        covariance = np.full((n, n), correlation)
+        np.fill_diagonal(covariance, 1.0)
+        tirages = rng.multivariate_normal(np.zeros(n), covariance, size=forme, method="eigh")
+        tenseur = np.moveaxis(tirages, -1, 0)
+    else:
+        tenseur = _gains_dominance(forme, rng, bas, haut)
+
+    joueurs = [Joueur(k + 1, [f"S{s + 1}" for s in range(forme[k])]) for k in range(n)]
+    return Jeu.depuis_tenseur(joueurs, np.ascontiguousarray(tenseur))
+
+def _gains_dominance(forme: Tuple[int, ...], rng: np.random.Generator, bas: int, haut: int) -> np.ndarray:
+    """
+    Gains aléatoires plus un bonus de rang : le joueur k classe strictement ses
+    stratégies dès que les joueurs précédents jouent leur stratégie survivante,
+    l'élimination se fait donc joueur par joueur jusqu'à un profil unique.
+    """
+    n = len(forme)
+    tenseur = rng.integers(bas, haut, size=(n,) + forme, endpoint=True)
+    ecart = haut - bas + 1
+    survivants = []
+    for k in range(n):
+        rangs = rng.permutation(forme[k])
+        forme_rang = [1] * n
+        forme_rang[k] = forme[k]
+        bonus = (ecart * rangs).reshape(forme_rang)
+        index = tuple(survivants) + (slice(None),) * (n - k)
+        tenseur[k][index] += bonus[(0,) * k]
+        survivants.append(int(np.argmax(rangs)))
+    return tenseur
@@ -1,5 +1,8 @@
 import streamlit as st
+import hashlib
+import os
 import sys
+import uuid
 from pathlib import Path
 import numpy as np
 import pandas as pd
@@ -13,7 +16,23 @@ sys.path.insert(0, str(project_root))
 
 from core.modeles import Jeu, Joueur
 from core.algorithems import AnalyseurJeu
-from core.utils import charger_jeu_classique, normaliser_gains
+from core.utils import charger_jeu_classique, normaliser_gains, deplier_gains, replier_gains, lire_gains_fichier
+from core.cache import CacheResultats, AnalyseurCache, empreinte_jeu
+from core.instrumentation import Instrumentation, PuitsMemoire
+from core.taches import ExecuteurTaches
+
+# Intervalle (s) de rafraîchissement d'un panneau dont l'analyse est en cours
+INTERVALLE_SUIVI = 0.5
+
+@st.cache_resource
+def obtenir_cache():
+    """Cache partagé par toutes les sessions ; niveau disque si THEORIE_JEUX_CACHE est défini"""
+    return CacheResultats(taille_max=256, repertoire=os.environ.get("THEORIE_JEUX_CACHE"))
+
+@st.cache_resource
+def obtenir_executeur():
+    """Pool d'analyses en arrière-plan partagé par toutes les sessions"""
+    return ExecuteurTaches(n_travailleurs=int(os.environ.get("THEORIE_JEUX_TRAVAILLEURS", "2")))
 
 def creer_jeu_personnalise():
     st.header("🎮 Configuration du Jeu Personnalisé")
@@ -46,44 +65,69 @@ def creer_jeu_personnalise():
                 for j in range(strat_count)
             ]
     
-    # Configuration des gains (using dynamic ND-arrays)
+    # Configuration des gains : un tableau déplié par joueur (lignes = profils
+    # des joueurs 1..n-1, colonnes = stratégies du dernier joueur)
     st.subheader("Matrices des Gains")
-    gains = {}
+    shape = tuple(len(s) for s in strategies.values())
     
-    # Create all possible strategy combinations
-    all_strat_combinations = list(product(*[range(len(s)) for s in strategies.values()]))
+    # Gains conservés entre les exécutions tant que les dimensions ne changent pas
+    if st.session_state.get("gains_forme") != shape:
+        st.session_state["gains_forme"] = shape
+        st.session_state["gains_tenseur"] = np.zeros((num_players,) + shape)
+        st.session_state["gains_version"] = 0
+    tenseur = st.session_state["gains_tenseur"]
     
-    for player_id in range(1, num_players + 1):
-        st.markdown(f"**Joueur {player_id}**")
-        
-        # Initialize ND-array for this player's gains
-        shape = tuple(len(s) for s in strategies.values())
-        player_gains = np.zeros(shape)
-        
-        for combo in all_strat_combinations:
-            # Create readable label
-            combo_label = " / ".join(
-                f"{strategies[p+1][s]}" 
-                for p, s in enumerate(combo)
+    fichier = st.file_uploader(
+        f"Importer tous les gains (.npy de forme {(num_players,) + shape})", type=["npy"], key="gains_tous"
+    )
+    if fichier is not None and st.session_state.get("gains_fichier_tous") != fichier.file_id:
+        st.session_state["gains_fichier_tous"] = fichier.file_id
+        try:
+            tableau = lire_gains_fichier(fichier.getvalue(), fichier.name)
+            if tableau.shape != tenseur.shape:
+                raise ValueError(f"Dimensions incorrectes: {tableau.shape}, attendu {tenseur.shape}")
+            tenseur[...] = tableau
+            st.session_state["gains_version"] += 1
+        except ValueError as e:
+            st.error(f"Import impossible: {str(e)}")
+    
+    index = [" / ".join(strategies[p + 1][s] for p, s in enumerate(combo))
+             for combo in product(*[range(n) for n in shape[:-1]])]
+    onglets = st.tabs([f"Joueur {i}" for i in range(1, num_players + 1)])
+    for k, onglet in enumerate(onglets):
+        with onglet:
+            fichier = st.file_uploader(
+                f"Importer les gains du Joueur {k + 1} (.csv ou .npy)", type=["csv", "npy"], key=f"gains_fichier_{k}"
             )
+            if fichier is not None and st.session_state.get(f"gains_fichier_id_{k}") != fichier.file_id:
+                st.session_state[f"gains_fichier_id_{k}"] = fichier.file_id
+                try:
+                    tenseur[k] = replier_gains(lire_gains_fichier(fichier.getvalue(), fichier.name), shape)
+                    st.session_state["gains_version"] += 1
+                except ValueError as e:
+                    st.error(f"Import impossible: {str(e)}")
             
-            # Input for this specific combination
-            player_gains[combo] = st.number_input(
-                f"Gain J{player_id} quand {combo_label}",
-                value=0,
-                key=f"gain_{player_id}_{'_'.join(map(str, combo))}"
+            # La clé change après un import pour que l'éditeur reparte des nouvelles valeurs
+            df = pd.DataFrame(deplier_gains(tenseur[k]), index=index, columns=strategies[num_players])
+            edite = st.data_editor(
+                df, key=f"gains_editeur_{k}_{st.session_state['gains_version']}", use_container_width=True
             )
-        
-        gains[player_id] = player_gains
+            tenseur[k] = replier_gains(edite.to_numpy(dtype=float), shape)
     
-    # Create players and game
-    joueurs = [Joueur(i, strategies[i]) for i in range(1, num_players + 1)]
+    # Le jeu n'est reconstruit que si les gains ou les stratégies ont changé
+    cle = (tuple(tuple(s) for s in strategies.values()), hashlib.blake2b(tenseur.tobytes(), digest_size=16).hexdigest())
+    if st.session_state.get("jeu_personnalise_cle") == cle:
+        return st.session_state["jeu_personnalise"]
     
+    joueurs = [Joueur(i, strategies[i]) for i in range(1, num_players + 1)]
     try:
-        return Jeu(joueurs, gains)
+        jeu = Jeu.depuis_tenseur(joueurs, tenseur.copy())
     except ValueError as e:
         st.error(f"Erreur de configuration: {str(e)}")
         return None
+    st.session_state["jeu_personnalise_cle"] = cle
+    st.session_state["jeu_personnalise"] = jeu
+    return jeu
 
 def display_payoff_matrices(jeu):
     """Display payoff matrices in a user-friendly way"""
@@ -118,50 +162,197 @@ def display_payoff_matrices(jeu):
                 st.write("Premières valeurs:")
                 st.write(jeu.gains[player.id].take(indices=0, axis=range(len(jeu.joueurs))))
 
-def display_iesds_results(analyseur, jeu):
+def display_iesds_results(resultat, jeu):
     """Display results of Iterated Elimination of Strictly Dominated Strategies"""
-    with st.expander("Élimination Itérative des Stratégies Strictement Dominées (IESDS)", expanded=True):
-        try:
-            equilibres_iesds, chemin = analyseur.equilibre_iteratif_dominance_stricte()
+    equilibres_iesds, chemin = resultat
+    if equilibres_iesds:
+        st.success("Profils stratégiques restants après élimination itérative:")
+        
+        # Create a table of results
+        results = []
+        for eq in equilibres_iesds:
+            result = {
+                "Profil": ", ".join(jeu.joueurs[j].strategies[s] for j, s in enumerate(eq))
+            }
+            for player in jeu.joueurs:
+                result[f"Gain J{player.id}"] = jeu.gains[player.id][eq]
+            results.append(result)
+        
+        df = pd.DataFrame(results)
+        st.dataframe(df.style.highlight_max(axis=0, color=''))
+        
+        if len(equilibres_iesds) == 1:
+            st.success("Solution unique trouvée par IESDS")
+        else:
+            st.warning("Plusieurs profils restants - le jeu n'a pas de solution unique par IESDS")
+    else:
+        st.error("Toutes les stratégies ont été éliminées - aucun équilibre trouvé")
+    if chemin:
+        st.markdown("### 🔄 Chemin d'élimination")
+        for etape in chemin:
+            st.write(f"- {etape}")
+    else:
+        st.write("Aucune stratégie éliminée")    
+    st.markdown("""
+    **Explication:**
+    - Les stratégies strictement dominées sont éliminées itérativement
+    - L'ordre d'élimination n'affecte pas le résultat final (pour la domination stricte)
+    - Les profils restants sont des équilibres potentiels
+    """)
 
-            
-            if equilibres_iesds:
-                st.success("Profils stratégiques restants après élimination itérative:")
-                
-                # Create a table of results
-                results = []
-                for eq in equilibres_iesds:
-                    result = {
-                        "Profil": ", ".join(jeu.joueurs[j].strategies[s] for j, s in enumerate(eq))
-                    }
-                    for player in jeu.joueurs:
-                        result[f"Gain J{player.id}"] = jeu.gains[player.id][eq]
-                    results.append(result)
-                
-                df = pd.DataFrame(results)
-                st.dataframe(df.style.highlight_max(axis=0, color=''))
-                
-                if len(equilibres_iesds) == 1:
-                    st.success("Solution unique trouvée par IESDS")
-                else:
-                    st.warning("Plusieurs profils restants - le jeu n'a pas de solution unique par IESDS")
-            else:
-                st.error("Toutes les stratégies ont été éliminées - aucun équilibre trouvé")
-            if chemin:
-                st.markdown("### 🔄 Chemin d'élimination")
-                for etape in chemin:
-                    st.write(f"- {etape}")
+def display_nash_results(resultat, jeu):
+    equilibres, mixtes = resultat
+    if equilibres:
+        st.write("Équilibres trouvés:")
+        for eq in equilibres:
+            noms = [jeu.joueurs[j].strategies[s] for j, s in enumerate(eq)]
+            st.write(f"- Profil stratégique: {', '.join(noms)}")
+            st.write(f"  Gains correspondants:")
+            for player in jeu.joueurs:
+                st.write(f"  Joueur {player.id}: {jeu.gains[player.id][eq]}")
+    else:
+        st.warning("Aucun équilibre de Nash en stratégies pures trouvé")
+        if mixtes is not None:
+            st.write("Équilibres en stratégies mixtes:")
+            for x, y in mixtes:
+                for player, mixte in zip(jeu.joueurs, (x, y)):
+                    probas = ", ".join(
+                        f"{s}: {p:.2f}" for s, p in zip(player.strategies, mixte) if p > 1e-9
+                    )
+                    st.write(f"- Joueur {player.id}: {probas}")
+
+def display_pareto_results(pareto_optima, jeu):
+    if pareto_optima:
+        st.write("Optima de Pareto trouvés:")
+        for opt in pareto_optima:
+            noms = [jeu.joueurs[j].strategies[s] for j, s in enumerate(opt)]
+            st.write(f"- Profil stratégique: {', '.join(noms)}")
+            st.write(f"  Gains correspondants:")
+            for player in jeu.joueurs:
+                st.write(f"  Joueur {player.id}: {jeu.gains[player.id][opt]}")
+    else:
+        st.warning("Aucun optimum de Pareto trouvé")
+
+def display_security_results(resultat, jeu):
+    niveaux, mixtes = resultat
+    for k, (player, (valeur, strat)) in enumerate(zip(jeu.joueurs, niveaux)):
+        st.write(f"**Joueur {player.id}**:")
+        st.write(f"- Stratégie de sécurité: {player.strategies[strat]}")
+        st.write(f"- Gain garanti: {valeur:.2f}")
+        if mixtes is not None:
+            melange = ", ".join(f"{nom}: {p:.2f}" for nom, p in zip(player.strategies, mixtes["strategies"][k]) if p > 1e-9)
+            st.write(f"- Gain garanti en stratégies mixtes: {mixtes['valeurs'][k]:.2f} ({melange})")
+        st.write("---")
+    if mixtes is None:
+        st.info("Installez scipy pour les niveaux de sécurité en stratégies mixtes")
+
+def display_dominance_results(dominantes, jeu):
+    for player, dom in zip(jeu.joueurs, dominantes):
+        st.write(f"**Joueur {player.id}**:")
+        
+        if dom['strict']:
+            st.write("- Strictement dominantes:")
+            for s in dom['strict']:
+                st.write(f"  - {player.strategies[s]}")
+        else:
+            st.write("- Pas de stratégie strictement dominante")
+        
+        if dom['weak']:
+            st.write("- Faiblement dominantes:")
+            for s in dom['weak']:
+                st.write(f"  - {player.strategies[s]}")
+        else:
+            st.write("- Pas de stratégie faiblement dominante")
+        
+        st.write("---")
+
+# Analyses exécutées en arrière-plan : fonction(suivi, analyseur) -> résultat
+def tache_nash(suivi, analyseur):
+    equilibres = analyseur.equilibre_nash(progression=suivi.avancer)
+    mixtes = None
+    if not equilibres and len(analyseur.jeu.joueurs) == 2:
+        suivi.avancer(0.0, "Équilibres mixtes")
+        mixtes = analyseur.equilibres_mixtes(progression=suivi.avancer)
+    return equilibres, mixtes
+
+def tache_pareto(suivi, analyseur):
+    return analyseur.optimum_pareto(progression=suivi.avancer)
+
+def tache_par_joueur(nom_methode, suivre=False):
+    """Appelle la méthode pour chaque joueur ; avec `suivre`, lui passe aussi le rappel de progression"""
+    def tache(suivi, analyseur):
+        joueurs = analyseur.jeu.joueurs
+        resultats = []
+        for k, player in enumerate(joueurs):
+            options = {}
+            if suivre:
+                options["progression"] = lambda f, k=k: suivi.avancer((k + f) / len(joueurs))
+            resultats.append(getattr(analyseur, nom_methode)(player.id, **options))
+            suivi.avancer((k + 1) / len(joueurs))
+        return resultats
+    return tache
+
+def tache_securite(suivi, analyseur):
+    niveaux = tache_par_joueur("niveau_securite")(suivi, analyseur)
+    suivi.avancer(0.0, "Stratégies mixtes")
+    try:
+        mixtes = analyseur.niveaux_securite_mixtes(progression=suivi.avancer)
+    except ImportError:
+        mixtes = None
+    return niveaux, mixtes
+
+def tache_iesds(suivi, analyseur):
+    return analyseur.equilibre_iteratif_dominance_stricte(progression=suivi.avancer)
+
+ANALYSES = {
+    "nash": ("Équilibre de Nash", tache_nash, display_nash_results),
+    "pareto": ("Optimum de Pareto", tache_pareto, display_pareto_results),
+    "securite": ("Niveaux de Sécurité", tache_securite, display_security_results),
+    "dominance": ("Stratégies Dominantes", tache_par_joueur("strategies_dominantes", suivre=True), display_dominance_results),
+    "iesds": ("Élimination Itérative des Stratégies Strictement Dominées (IESDS)", tache_iesds, display_iesds_results),
+}
+
+def panneau_analyse(espace, nom, analyseur, jeu, delai):
+    """
+    Panneau d'une analyse en arrière-plan : progression et bouton d'annulation
+    tant qu'elle tourne (rafraîchi seul, sans relancer la page), résultat dès
+    qu'il arrive.
+    """
+    executeur = obtenir_executeur()
+    titre, fonction, afficher = ANALYSES[nom]
+    tache = executeur.tache(espace, nom)
+    if tache is None:
+        return
+    suivie = not tache.finie
+
+    @st.fragment(run_every=INTERVALLE_SUIVI if suivie else None)
+    def contenu():
+        etat = tache.etat
+        if suivie and etat not in ("en_attente", "en_cours"):
+            # Page complète relancée une fois, pour arrêter le rafraîchissement
+            st.rerun()
+        with st.expander(titre, expanded=True):
+            if etat == "terminee":
+                afficher(tache.resultat(), jeu)
+                return
+            if etat in ("en_attente", "en_cours"):
+                texte = "En attente d'un travailleur" if etat == "en_attente" else (tache.suivi.message or "Calcul en cours")
+                st.progress(tache.suivi.progression, text=f"{texte} ({tache.suivi.progression:.0%})")
+                if st.button("Annuler", key=f"annuler_{nom}"):
+                    tache.annuler()
+                    st.rerun()
+                return
+            if etat == "erreur":
+                st.error(f"Erreur dans l'analyse: {str(tache.erreur)}")
+            elif etat == "expiree":
+                st.warning(f"Analyse interrompue : délai de {tache.suivi.delai:.0f} s dépassé")
             else:
-                st.write("Aucune stratégie éliminée")    
-            st.markdown("""
-            **Explication:**
-            - Les stratégies strictement dominées sont éliminées itérativement
-            - L'ordre d'élimination n'affecte pas le résultat final (pour la domination stricte)
-            - Les profils restants sont des équilibres potentiels
-            """)
-                
-        except Exception as e:
-            st.error(f"Erreur dans l'analyse IESDS: {str(e)}")
+                st.warning("Analyse annulée")
+            if st.button("Relancer", key=f"relancer_{nom}"):
+                executeur.soumettre(espace, nom, fonction, analyseur, delai=delai, remplacer=True)
+                st.rerun()
+
+    contenu()
 
 # Configuration de la page
 st.set_page_config(page_title="Analyse des Jeux Stratégiques", page_icon="🎮", layout="wide")
@@ -186,6 +377,12 @@ with st.sidebar:
     analyse_securite = st.checkbox("Niveaux de Sécurité", True)
     analyse_dominance = st.checkbox("Stratégies Dominantes", True)
     analyse_iesds = st.checkbox("Élimination Itérative des Stratégies Dominées", True)
+    
+    delai = st.number_input("Délai maximal par analyse (s)", min_value=1, max_value=3600, value=60)
+    
+    st.markdown("---")
+    instrumenter = st.checkbox("Mesurer les performances", False,
+                               help="Temps, profils parcourus, lectures de gains et comparaisons par méthode")
 
 # Chargement du jeu
 try:
@@ -195,7 +392,19 @@ try:
         jeu = charger_jeu_classique(choix_jeu)
     
     if jeu:
-        analyseur = AnalyseurJeu(jeu)
+        cache = obtenir_cache()
+        executeur = obtenir_executeur()
+        espace = st.session_state.setdefault("espace_taches", uuid.uuid4().hex)
+        
+        # Un groupe de tâches par configuration : les analyses d'une
+        # configuration remplacée sont abandonnées, celles de la configuration
+        # courante survivent aux autres changements de widgets
+        groupe = (empreinte_jeu(jeu), instrumenter)
+        if executeur.activer(espace, groupe):
+            # Mesures propres au jeu affiché, partagées par ses tâches
+            st.session_state["instrumentation"] = Instrumentation([PuitsMemoire()]) if instrumenter else None
+        instrumentation = st.session_state.get("instrumentation")
+        analyseur = AnalyseurCache(AnalyseurJeu(jeu, instrumentation), cache)
         
         # Affichage des matrices de gains
         display_payoff_matrices(jeu)
@@ -203,67 +412,33 @@ try:
         # Affichage des résultats
         st.subheader("Résultats de l'Analyse")
         
-        if analyse_nash:
-            with st.expander("Équilibre de Nash", expanded=True):
-                equilibres = analyseur.equilibre_nash()
-                if equilibres:
-                    st.write("Équilibres trouvés:")
-                    for eq in equilibres:
-                        noms = [jeu.joueurs[j].strategies[s] for j, s in enumerate(eq)]
-                        st.write(f"- Profil stratégique: {', '.join(noms)}")
-                        st.write(f"  Gains correspondants:")
-                        for player in jeu.joueurs:
-                            st.write(f"  Joueur {player.id}: {jeu.gains[player.id][eq]}")
-                else:
-                    st.warning("Aucun équilibre de Nash en stratégies pures trouvé")
-        
-        if analyse_pareto:
-            with st.expander("Optimum de Pareto", expanded=True):
-                pareto_optima = analyseur.optimum_pareto()
-                if pareto_optima:
-                    st.write("Optima de Pareto trouvés:")
-                    for opt in pareto_optima:
-                        noms = [jeu.joueurs[j].strategies[s] for j, s in enumerate(opt)]
-                        st.write(f"- Profil stratégique: {', '.join(noms)}")
-                        st.write(f"  Gains correspondants:")
-                        for player in jeu.joueurs:
-                            st.write(f"  Joueur {player.id}: {jeu.gains[player.id][opt]}")
-                else:
-                    st.warning("Aucun optimum de Pareto trouvé")
-        
-        if analyse_securite:
-            with st.expander("Niveaux de Sécurité", expanded=True):
-                for player in jeu.joueurs:
-                    valeur, strat = analyseur.niveau_securite(player.id)
-                    st.write(f"**Joueur {player.id}**:")
-                    st.write(f"- Stratégie de sécurité: {player.strategies[strat]}")
-                    st.write(f"- Gain garanti: {valeur:.2f}")
-                    st.write("---")
+        choisies = {"nash": analyse_nash, "pareto": analyse_pareto, "securite": analyse_securite,
+                    "dominance": analyse_dominance, "iesds": analyse_iesds}
+        for nom, choisie in choisies.items():
+            if choisie:
+                executeur.soumettre(espace, nom, ANALYSES[nom][1], analyseur, delai=delai)
+            else:
+                executeur.retirer(espace, nom)
+        for nom, choisie in choisies.items():
+            if choisie:
+                panneau_analyse(espace, nom, analyseur, jeu, delai)
         
-        if analyse_dominance:
-            with st.expander("Stratégies Dominantes", expanded=True):
-                for player in jeu.joueurs:
-                    st.write(f"**Joueur {player.id}**:")
-                    dom = analyseur.strategies_dominantes(player.id)
-                    
-                    if dom['strict']:
-                        st.write("- Strictement dominantes:")
-                        for s in dom['strict']:
-                            st.write(f"  - {player.strategies[s]}")
-                    else:
-                        st.write("- Pas de stratégie strictement dominante")
-                    
-                    if dom['weak']:
-                        st.write("- Faiblement dominantes:")
-                        for s in dom['weak']:
-                            st.write(f"  - {player.strategies[s]}")
-                    else:
-                        st.write("- Pas de stratégie faiblement dominante")
-                    
-                    st.write("---")
+        stats = cache.stats()
+        st.sidebar.caption(
+            f"Cache d'analyse : {stats['hits'] + stats['hits_disque']} hits, "
+            f"{stats['misses']} misses ({stats['entrees']}/{stats['taille_max']} entrées)"
+        )
         
-        if analyse_iesds:
-            display_iesds_results(analyseur, jeu)
+        if instrumentation is not None:
+            with st.sidebar.expander("Performances de l'analyse", expanded=True):
+                resume = instrumentation.memoire().resume()
+                if resume:
+                    df = pd.DataFrame.from_dict(resume, orient="index")
+                    df["duree_totale"] *= 1e3
+                    df["duree_max"] *= 1e3
+                    st.dataframe(df.rename(columns={"duree_totale": "total (ms)", "duree_max": "max (ms)"}))
+                else:
+                    st.write("Aucune mesure : analyses en cours ou résultats venus du cache")
         
         # Guide théorique
         with st.expander("Guide Théorique", expanded=False):
@@ -0,0 +1,97 @@
+"""
+Implémentations de référence, par énumération des profils, des analyses
+d'AnalyseurJeu : lentes mais directement lisibles sur les définitions.
+Le joueur k (dans l'ordre de jeu.joueurs) porte ses stratégies sur l'axe k.
+"""
+from itertools import product
+from typing import List, Set, Tuple
+
+import numpy as np
+
+from core.modeles import Jeu
+from core.utils import generer_jeu_aleatoire
+
+# Formes testées : 2 à 4 joueurs, dont des axes de taille 1
+FORMES = [(2, 2), (3, 4), (1, 3), (2, 3, 2), (3, 1, 2), (2, 2, 2, 2)]
+
+
+def jeux_aleatoires(forme: Tuple[int, ...], n: int = 5) -> List[Jeu]:
+    """Jeux à gains entiers dans [0, 3] : beaucoup d'égalités"""
+    return [generer_jeu_aleatoire(forme, graine=g, haut=3) for g in range(n)]
+
+
+def profils(forme: Tuple[int, ...]):
+    return product(*[range(s) for s in forme])
+
+
+def deviation(profil: Tuple[int, ...], k: int, s: int) -> Tuple[int, ...]:
+    return profil[:k] + (s,) + profil[k + 1:]
+
+
+def nash(jeu: Jeu, epsilon: float = 0.0) -> List[Tuple[int, ...]]:
+    forme = jeu.forme
+    return [p for p in profils(forme)
+            if all(jeu.tenseur[k][deviation(p, k, s)] <= jeu.tenseur[k][p] + epsilon
+                   for k in range(len(forme)) for s in range(forme[k]))]
+
+
+def pareto(jeu: Jeu) -> List[Tuple[int, ...]]:
+    tous = list(profils(jeu.forme))
+    vecteurs = {p: jeu.tenseur[(slice(None),) + p] for p in tous}
+    return [p for p in tous
+            if not any(np.all(vecteurs[q] >= vecteurs[p]) and np.any(vecteurs[q] > vecteurs[p]) for q in tous)]
+
+
+def meilleures_reponses(jeu: Jeu, k: int, profil: Tuple[int, ...]) -> List[int]:
+    gains = [jeu.tenseur[k][deviation(profil, k, s)] for s in range(jeu.forme[k])]
+    return [s for s, g in enumerate(gains) if g == max(gains)]
+
+
+def _domine(jeu: Jeu, k: int, a: int, b: int, actives: List[List[int]], faiblement: bool) -> bool:
+    """La stratégie a du joueur k domine-t-elle b sur les profils adverses actifs ?"""
+    ecarts = []
+    for p in product(*actives):
+        ecarts.append(jeu.tenseur[k][deviation(p, k, a)] - jeu.tenseur[k][deviation(p, k, b)])
+    if faiblement:
+        return min(ecarts) >= 0 and max(ecarts) > 0
+    return min(ecarts) > 0
+
+
+def dominantes(jeu: Jeu, k: int, faiblement: bool) -> List[int]:
+    """Stratégies qui dominent (strictement, ou au sens large avec égalités admises) chacune des autres"""
+    actives = [list(range(s)) for s in jeu.forme]
+    resultat = []
+    for a in range(jeu.forme[k]):
+        autres = [b for b in range(jeu.forme[k]) if b != a]
+        if faiblement:
+            # Au moins aussi bonne que toute autre partout
+            ok = all(jeu.tenseur[k][deviation(p, k, a)] >= jeu.tenseur[k][deviation(p, k, b)]
+                     for b in autres for p in product(*actives))
+        else:
+            ok = all(_domine(jeu, k, a, b, actives, False) for b in autres)
+        if ok:
+            resultat.append(a)
+    return resultat
+
+
+def iesds(jeu: Jeu) -> List[Set[int]]:
+    """Stratégies restantes après élimination itérée des stratégies strictement dominées (par des pures)"""
+    actives = [list(range(s)) for s in jeu.forme]
+    change = True
+    while change:
+        change = False
+        for k in range(len(actives)):
+            dominees = [b for b in actives[k]
+                        if any(_domine(jeu, k, a, b, actives, False) for a in actives[k] if a != b)]
+            if dominees:
+                actives[k] = [s for s in actives[k] if s not in dominees]
+                change = True
+    return [set(a) for a in actives]
+
+
+def securite(jeu: Jeu, k: int) -> Tuple[float, Set[int]]:
+    """Niveau de sécurité pur du joueur k et ensemble de ses stratégies de sécurité"""
+    forme = jeu.forme
+    minima = [min(jeu.tenseur[k][p] for p in profils(forme) if p[k] == s) for s in range(forme[k])]
+    valeur = max(minima)
+    return valeur, {s for s, m in enumerate(minima) if m == valeur}
@@ -0,0 +1,75 @@
+import numpy as np
+
+from core.algorithems import AnalyseurJeu
+from core.cache import AnalyseurCache, CacheResultats, empreinte_jeu
+from core.incremental import AnalyseurIncremental
+from core.utils import generer_jeu_aleatoire
+
+
+def _analyseur(cache, graine=0, forme=(3, 3)):
+    return AnalyseurCache(AnalyseurJeu(generer_jeu_aleatoire(forme, graine=graine, haut=3)), cache)
+
+
+def test_resultats_memorises():
+    cache = CacheResultats()
+    analyseur = _analyseur(cache)
+    premier = analyseur.equilibre_nash()
+    assert analyseur.equilibre_nash(epsilon=0.0) is premier
+    assert cache.stats()["hits"] == 1
+    # Un autre jeu de même contenu partage les résultats
+    assert _analyseur(cache).equilibre_nash() is premier
+    assert _analyseur(cache, graine=1).equilibre_nash() is not premier
+
+
+def test_empreinte_du_contenu():
+    a, b = generer_jeu_aleatoire((2, 3), graine=0), generer_jeu_aleatoire((2, 3), graine=0)
+    assert empreinte_jeu(a) == empreinte_jeu(b)
+    b.tenseur[1, 1, 2] += 1
+    assert empreinte_jeu(a) != empreinte_jeu(b)
+
+
+def test_iterateurs_non_memorises():
+    cache = CacheResultats()
+    analyseur = _analyseur(cache)
+    assert list(analyseur.iter_equilibres_nash()) == list(analyseur.iter_equilibres_nash())
+    assert cache.stats()["entrees"] == 0
+
+
+def test_arguments_tableaux_par_contenu():
+    cache = CacheResultats()
+    analyseur = AnalyseurCache(AnalyseurJeu(generer_jeu_aleatoire((40, 40), "coordination", graine=0)), cache)
+    departs = np.zeros((2000, 2), dtype=np.int64)
+    autres = departs.copy()
+    autres[1000] = (5, 5)
+    # repr() tronquerait ces deux tableaux de la même façon
+    premier = analyseur.chemins_amelioration(departs, graine=0)
+    second = analyseur.chemins_amelioration(autres, graine=0)
+    assert premier is not second
+    assert tuple(second["chemins"][1000][0]) == (5, 5)
+
+
+def test_methodes_aleatoires_sans_graine():
+    cache = CacheResultats()
+    analyseur = _analyseur(cache, forme=(2, 2))
+    analyseur.equilibre_approche(departs=2, max_iterations=10)
+    analyseur.equilibre_approche(departs=2, max_iterations=10)
+    assert cache.stats()["entrees"] == 0
+
+
+def test_niveau_disque(tmp_path):
+    analyseur = _analyseur(CacheResultats(repertoire=str(tmp_path)))
+    premier = analyseur.optimum_pareto()
+    autre_cache = CacheResultats(repertoire=str(tmp_path))
+    assert _analyseur(autre_cache).optimum_pareto() == premier
+    assert autre_cache.stats()["hits_disque"] == 1
+
+
+def test_modification_du_jeu():
+    cache = CacheResultats()
+    jeu = generer_jeu_aleatoire((3, 3), graine=0, haut=3)
+    analyseur = AnalyseurCache(AnalyseurJeu(jeu), cache)
+    analyseur.equilibre_nash()
+    AnalyseurIncremental(jeu).modifier_gain(1, (0, 0), 100)
+    AnalyseurIncremental(jeu).modifier_gain(2, (0, 0), 100)
+    assert analyseur.equilibre_nash() == AnalyseurJeu(jeu).equilibre_nash()
+    assert (0, 0) in analyseur.equilibre_nash()
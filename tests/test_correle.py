@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from core.algorithems import AnalyseurJeu
+from core.utils import charger_jeu_classique, generer_jeu_aleatoire
+
+import reference
+
+pytest.importorskip("scipy")
+
+
+def ecarts_incitation(jeu, mu, grossier):
+    """Plus grand gain espéré d'une déviation (par recommandation, ou avant recommandation)"""
+    pire = -np.inf
+    for k in range(jeu.n_joueurs):
+        gains = np.asarray(jeu.tenseur[k], dtype=np.float64)
+        for dev in range(jeu.forme[k]):
+            devie = np.take(gains, [dev] * jeu.forme[k], axis=k)
+            ecart = mu * (devie - gains)
+            if grossier:
+                pire = max(pire, ecart.sum())
+            else:
+                autres = tuple(a for a in range(jeu.n_joueurs) if a != k)
+                pire = max(pire, ecart.sum(axis=autres).max() if autres else ecart.max())
+    return pire
+
+
+@pytest.mark.parametrize("grossier", [False, True])
+@pytest.mark.parametrize("forme", [(2, 2), (3, 3), (2, 2, 3)])
+def test_contraintes_respectees(forme, grossier):
+    for jeu in reference.jeux_aleatoires(forme, 3):
+        resultat = AnalyseurJeu(jeu).equilibre_correle(grossier)
+        mu = resultat["distribution"]
+        assert mu.shape == jeu.forme
+        assert mu.min() >= -1e-9 and mu.sum() == pytest.approx(1.0)
+        assert ecarts_incitation(jeu, mu, grossier) <= 1e-7
+        gains = [float((mu * jeu.tenseur[k]).sum()) for k in range(jeu.n_joueurs)]
+        np.testing.assert_allclose(resultat["gains"], gains, atol=1e-7)
+        # Tout équilibre de Nash pur est corrélé : le bien-être optimal est au moins le sien
+        for p in reference.nash(jeu):
+            assert resultat["bien_etre"] >= jeu.tenseur[(slice(None),) + p].sum() - 1e-7
+
+
+def test_bataille_des_sexes():
+    resultat = AnalyseurJeu(charger_jeu_classique("bataille_sexes")).equilibre_correle()
+    assert resultat["bien_etre"] == pytest.approx(5.0)
+
+
+def test_objectif_inconnu():
+    with pytest.raises(ValueError):
+        AnalyseurJeu(generer_jeu_aleatoire((2, 2), graine=0)).equilibre_correle(objectif="inconnu")
@@ -0,0 +1,119 @@
+import signal
+from contextlib import contextmanager
+
+import numpy as np
+import pytest
+
+from core.algorithems import AnalyseurJeu
+from core.dominance import strategies_dominees_melange
+from core.modeles import Jeu, Joueur
+
+scipy = pytest.importorskip("scipy")
+from scipy.optimize import linprog  # noqa: E402
+
+
+@contextmanager
+def delai(secondes: int):
+    """Interrompt le bloc (TimeoutError) s'il dure plus de `secondes`"""
+    if not hasattr(signal, "SIGALRM"):
+        yield
+        return
+
+    def expire(*_):
+        raise TimeoutError(f"Pas de résultat en {secondes} s")
+
+    precedent = signal.signal(signal.SIGALRM, expire)
+    signal.alarm(secondes)
+    try:
+        yield
+    finally:
+        signal.alarm(0)
+        signal.signal(signal.SIGALRM, precedent)
+
+
+def dominees_reference(plat: np.ndarray, faiblement: bool) -> np.ndarray:
+    """Un programme linéaire complet (toutes les contraintes) par ligne"""
+    s, R = plat.shape
+    resultat = np.zeros(s, dtype=bool)
+    for a in range(s):
+        bornes = [(0, 0) if b == a else (0, None) for b in range(s)]
+        marge = linprog(np.r_[np.zeros(s), -1.0], A_ub=np.c_[-plat.T, np.ones(R)], b_ub=-plat[a],
+                        A_eq=np.r_[np.ones(s), 0.0][None, :], b_eq=[1.0], bounds=bornes + [(None, None)],
+                        method="highs")
+        if -marge.fun > 1e-6:
+            resultat[a] = True
+        elif faiblement and -marge.fun > -1e-6:
+            gain = linprog(-plat.sum(axis=1), A_ub=-plat.T, b_ub=-plat[a], A_eq=np.ones((1, s)), b_eq=[1.0],
+                           bounds=bornes, method="highs")
+            resultat[a] = gain.status == 0 and -gain.fun - plat[a].sum() > 1e-6
+    return resultat
+
+
+def test_dominee_par_un_melange():
+    plat = np.array([[3, 0], [0, 3], [1, 1]])
+    for faiblement in (False, True):
+        dominee, _ = strategies_dominees_melange(plat, faiblement)
+        assert dominee.tolist() == [False, False, True]
+    # Aucune stratégie pure ne domine la troisième ligne
+    strategies = {1: list(range(3)), 2: [0, 1]}
+    jeu = Jeu([Joueur(1, ["H", "B", "M"]), Joueur(2, ["G", "D"])], {1: plat, 2: np.zeros((3, 2))})
+    analyseur = AnalyseurJeu(jeu)
+    assert not analyseur.est_strictement_dominee(1, 2, strategies)
+    assert analyseur.est_strictement_dominee(1, 2, strategies, par_melange=True)
+
+
+def test_lignes_identiques():
+    plat = np.array([[1, 2, 0], [1, 2, 0], [0, 1, 3]])
+    for faiblement in (False, True):
+        dominee, _ = strategies_dominees_melange(plat, faiblement)
+        assert not dominee.any()
+    # Une combinaison convexe exacte des autres lignes n'est pas faiblement dominée
+    plat = np.array([[4.0, 0.0, 2.0], [0.0, 4.0, 2.0], [2.0, 2.0, 2.0]])
+    assert not strategies_dominees_melange(plat, True)[0].any()
+
+
+def test_faiblement_dominee():
+    plat = np.array([[2, 0, 1], [0, 2, 1], [1, 1, 0.5]])
+    assert strategies_dominees_melange(plat, False)[0].tolist() == [False, False, False]
+    assert strategies_dominees_melange(plat, True)[0].tolist() == [False, False, True]
+
+
+@pytest.mark.parametrize("graine", range(60))
+def test_comparaison_reference(graine):
+    rng = np.random.default_rng(graine)
+    s, R = int(rng.integers(2, 7)), int(rng.integers(1, 31))
+    plat = rng.integers(0, 6, size=(s, R)).astype(np.float64)
+    if graine % 3 == 0 and s > 2:
+        # Dernière ligne sur (ou juste sous) le segment entre les deux premières
+        plat[-1] = (plat[0] + plat[1]) / 2 - graine % 2
+    for faiblement in (False, True):
+        with delai(20):
+            dominee, _ = strategies_dominees_melange(plat, faiblement)
+        assert dominee.tolist() == dominees_reference(plat, faiblement).tolist()
+
+
+@pytest.mark.parametrize("graine", [1019, 1031, 1083, 1090, 1199])
+def test_terminaison_combinaison_convexe(graine):
+    # Ligne égale à un mélange des autres à 1e-9 près : la génération de
+    # contraintes tournait indéfiniment sur ces entrées
+    rng = np.random.default_rng(graine)
+    s, R = int(rng.integers(2, 7)), int(rng.integers(1, 31))
+    plat = rng.random((s, R)) * 10
+    plat[-1] = rng.dirichlet(np.ones(s - 1)) @ plat[:-1] + rng.normal(size=R) * 1e-9
+    with delai(20):
+        for faiblement in (False, True):
+            strategies_dominees_melange(plat, faiblement)
+
+
+def test_elimination_dominance_mixte():
+    gains_1 = np.array([[3, 0], [0, 3], [1, 1]])
+    gains_2 = np.array([[1, 0], [1, 0], [0, 1]])
+    jeu = Jeu([Joueur(1, ["H", "B", "M"]), Joueur(2, ["G", "D"])], {1: gains_1, 2: gains_2})
+    resultat = AnalyseurJeu(jeu).elimination_dominance_mixte()
+    # M éliminée par le mélange de H et B, puis D par G, puis B par H
+    assert resultat["eliminations"] == [(1, 2), (2, 1), (1, 1)]
+    assert resultat["actives"] == {1: [0], 2: [0]}
+    assert resultat["jeu_reduit"].forme == (1, 1)
+    assert AnalyseurJeu(jeu).elimination_dominance_mixte(faiblement=True, ordre="une_a_une")["actives"][2] == [0]
+    with pytest.raises(ValueError):
+        AnalyseurJeu(jeu).elimination_dominance_mixte(ordre="inconnu")
@@ -0,0 +1,48 @@
+import pytest
+
+from core.algorithems import AnalyseurJeu
+from core.utils import charger_jeu_classique, generer_jeu_aleatoire
+
+import reference
+from reference import FORMES, jeux_aleatoires
+
+
+@pytest.mark.parametrize("forme", FORMES)
+def test_strategies_dominantes(forme):
+    for jeu in jeux_aleatoires(forme):
+        analyseur = AnalyseurJeu(jeu)
+        for k, joueur in enumerate(jeu.joueurs):
+            resultat = analyseur.strategies_dominantes(joueur.id)
+            assert resultat["strict"] == reference.dominantes(jeu, k, False)
+            assert resultat["weak"] == reference.dominantes(jeu, k, True)
+
+
+@pytest.mark.parametrize("forme", FORMES + [(4, 4, 3)])
+def test_elimination_iteree(forme):
+    jeux = jeux_aleatoires(forme) + [generer_jeu_aleatoire(forme, "dominance", graine=g) for g in range(3)]
+    for jeu in jeux:
+        actives = reference.iesds(jeu)
+        attendus = sorted(p for p in reference.profils(jeu.forme) if all(s in a for s, a in zip(p, actives)))
+        analyseur = AnalyseurJeu(jeu)
+        assert sorted(analyseur.elimination_strategies_dominantes()) == attendus
+        restants, chemin = analyseur.equilibre_iteratif_dominance_stricte()
+        assert sorted(restants) == attendus
+        assert len(chemin) == sum(jeu.forme) - sum(len(a) for a in actives)
+
+
+def test_elimination_iteree_classique():
+    restants, chemin = AnalyseurJeu(charger_jeu_classique("dilemme_prisonnier")).equilibre_iteratif_dominance_stricte()
+    assert restants == [(0, 0)]
+    assert len(chemin) == 2
+
+
+@pytest.mark.parametrize("forme", FORMES)
+def test_est_strictement_dominee(forme):
+    for jeu in jeux_aleatoires(forme):
+        analyseur = AnalyseurJeu(jeu)
+        toutes = [list(range(s)) for s in jeu.forme]
+        actives = {j.id: toutes[k] for k, j in enumerate(jeu.joueurs)}
+        for k, joueur in enumerate(jeu.joueurs):
+            for b in range(jeu.forme[k]):
+                attendu = any(reference._domine(jeu, k, a, b, toutes, False) for a in toutes[k] if a != b)
+                assert analyseur.est_strictement_dominee(joueur.id, b, actives) == attendu
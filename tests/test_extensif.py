@@ -0,0 +1,96 @@
+from itertools import product
+
+import numpy as np
+import pytest
+
+from core.extensif import HASARD, TERMINAL, AnalyseurExtensif, JeuExtensif, generer_arbre_aleatoire
+from core.modeles import Joueur
+
+import reference
+
+
+def enfants(arbre, v):
+    return [int(c) for c in arbre.enfants_de(v)]
+
+
+def induction_recursive(arbre, v, choix):
+    """Valeurs du sous-jeu de v ; à égalité, la plus petite action"""
+    if arbre.joueur[v] == TERMINAL:
+        return arbre.gains[v]
+    valeurs = [induction_recursive(arbre, c, choix) for c in enfants(arbre, v)]
+    if arbre.joueur[v] == HASARD:
+        return sum(arbre.probabilites[c] * val for c, val in zip(enfants(arbre, v), valeurs))
+    k = arbre.joueur[v]
+    action = max(range(len(valeurs)), key=lambda a: (valeurs[a][k], -a))
+    choix[v] = action
+    return valeurs[action]
+
+
+def esperance(arbre, v, actions):
+    """Gains espérés depuis v quand chaque ensemble d'information joue actions[ensemble]"""
+    if arbre.joueur[v] == TERMINAL:
+        return arbre.gains[v]
+    if arbre.joueur[v] == HASARD:
+        return sum(arbre.probabilites[c] * esperance(arbre, c, actions) for c in enfants(arbre, v))
+    return esperance(arbre, enfants(arbre, v)[actions[int(arbre.ensemble_info[v])]], actions)
+
+
+def strategies(arbre, k):
+    """Stratégies pures du joueur k, dans l'ordre de vers_jeu : {ensemble: action}"""
+    decisions = [v for v in range(arbre.n_noeuds) if arbre.joueur[v] == k]
+    ensembles = sorted({int(arbre.ensemble_info[v]) for v in decisions})
+    tailles = [len(enfants(arbre, next(v for v in decisions if arbre.ensemble_info[v] == e))) for e in ensembles]
+    return [dict(zip(ensembles, s)) for s in product(*[range(t) for t in tailles])]
+
+
+@pytest.mark.parametrize("branchement, profondeur, n_joueurs, proba_hasard",
+                         [(2, 3, 2, 0.0), (2, 3, 2, 0.4), (3, 2, 2, 0.3), (2, 3, 3, 0.2), (1, 3, 2, 0.0)])
+def test_induction_et_forme_normale(branchement, profondeur, n_joueurs, proba_hasard):
+    for graine in range(4):
+        arbre = generer_arbre_aleatoire(branchement, profondeur, n_joueurs, graine=graine,
+                                        haut=3, proba_hasard=proba_hasard)
+        resultat = AnalyseurExtensif(arbre).induction_arriere()
+        choix = np.full(arbre.n_noeuds, -1)
+        np.testing.assert_allclose(resultat["gains"], induction_recursive(arbre, 0, choix))
+        np.testing.assert_array_equal(resultat["choix"], choix)
+
+        jeu = arbre.vers_jeu()
+        par_joueur = [strategies(arbre, k) for k in range(n_joueurs)]
+        assert jeu.forme == tuple(len(s) for s in par_joueur)
+        for p in reference.profils(jeu.forme):
+            actions = {}
+            for k, s in enumerate(p):
+                actions.update(par_joueur[k][s])
+            np.testing.assert_allclose(jeu.tenseur[(slice(None),) + p], esperance(arbre, 0, actions))
+
+        # L'équilibre parfait en sous-jeux est un équilibre de Nash de la forme normale
+        profil = tuple(next(s for s, actions in enumerate(par_joueur[k])
+                            if all(choix[e] == a for e, a in actions.items()))
+                       for k in range(n_joueurs))
+        assert profil in reference.nash(jeu, 1e-9)
+
+
+def test_information_imparfaite():
+    # Pièces assorties jouées l'une après l'autre, le second joueur n'observant pas le premier
+    joueurs = [Joueur(1, []), Joueur(2, [])]
+    parent = [-1, 0, 0, 1, 1, 2, 2]
+    joueur = [0, 1, 1, TERMINAL, TERMINAL, TERMINAL, TERMINAL]
+    gains = np.zeros((7, 2))
+    gains[3:] = [[1, -1], [-1, 1], [-1, 1], [1, -1]]
+    arbre = JeuExtensif(joueurs, parent, joueur, gains, ensemble_info=[0, 1, 1, -1, -1, -1, -1])
+    assert not arbre.information_parfaite
+    with pytest.raises(ValueError):
+        AnalyseurExtensif(arbre).induction_arriere()
+    jeu = arbre.vers_jeu()
+    np.testing.assert_array_equal(jeu.tenseur[0], [[1, -1], [-1, 1]])
+    np.testing.assert_array_equal(jeu.tenseur[1], [[-1, 1], [1, -1]])
+
+
+def test_arbres_invalides():
+    joueurs = [Joueur(1, [])]
+    with pytest.raises(ValueError):
+        JeuExtensif(joueurs, [0, 0], [0, TERMINAL], np.zeros((2, 1)))
+    with pytest.raises(ValueError):
+        JeuExtensif(joueurs, [-1, 0], [1, TERMINAL], np.zeros((2, 1)))
+    with pytest.raises(ValueError):
+        generer_arbre_aleatoire(0, 2)
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from core.algorithems import AnalyseurJeu
+from core.graphique import AnalyseurGraphique, JeuGraphique, JeuPolymatriciel, _JeuLocal
+from core.modeles import Joueur
+
+import reference
+
+
+def _joueurs(forme):
+    return [Joueur(k + 1, [f"S{s}" for s in range(n)]) for k, n in enumerate(forme)]
+
+
+def jeu_chaine(forme, graine):
+    """Joueurs en chaîne 1 - 2 - ... - n, tables locales aléatoires"""
+    rng = np.random.default_rng(graine)
+    n = len(forme)
+    voisins = {k + 1: [v + 1 for v in (k - 1, k + 1) if 0 <= v < n] for k in range(n)}
+    gains = {k + 1: rng.integers(0, 4, size=(forme[k],) + tuple(forme[v - 1] for v in voisins[k + 1]))
+             for k in range(n)}
+    return JeuGraphique(_joueurs(forme), voisins, gains)
+
+
+def jeu_polymatriciel(forme, graine):
+    rng = np.random.default_rng(graine)
+    n = len(forme)
+    matrices = {(i + 1, j + 1): rng.integers(0, 4, size=(forme[i], forme[j]))
+                for i in range(n) for j in range(n) if i != j and (i + j) % 3 != 2}
+    return JeuPolymatriciel(_joueurs(forme), matrices)
+
+
+@pytest.mark.parametrize("construire", [jeu_chaine, jeu_polymatriciel])
+@pytest.mark.parametrize("forme", [(2, 3), (2, 2, 3), (3, 2, 2, 2)])
+def test_identique_au_jeu_dense(construire, forme):
+    for graine in range(4):
+        local = construire(forme, graine)
+        dense = local.vers_jeu()
+        analyseur = AnalyseurGraphique(local)
+        assert sorted(analyseur.equilibre_nash()) == reference.nash(dense)
+        assert sorted(analyseur.equilibre_nash(1.0)) == reference.nash(dense, 1.0)
+        for k, joueur in enumerate(local.joueurs):
+            assert analyseur.niveau_securite(joueur.id)[0] == reference.securite(dense, k)[0]
+            for p in reference.profils(forme):
+                assert local.gain(joueur.id, p) == dense.tenseur[k][p]
+        assert AnalyseurJeu(dense).equilibre_nash() == reference.nash(dense)
+
+
+def test_representation_abstraite():
+    with pytest.raises(TypeError):
+        _JeuLocal(_joueurs((2, 2)), {})
+
+
+def test_voisinages_invalides():
+    with pytest.raises(ValueError):
+        JeuGraphique(_joueurs((2, 2)), {1: [1], 2: []}, {1: np.zeros((2, 2)), 2: np.zeros(2)})
+    with pytest.raises(ValueError):
+        JeuGraphique(_joueurs((2, 2)), {1: [3], 2: []}, {1: np.zeros((2, 2)), 2: np.zeros(2)})
+    with pytest.raises(ValueError):
+        JeuPolymatriciel(_joueurs((2, 2)), {(1, 2): np.zeros((2, 3))})
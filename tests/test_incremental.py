@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from core.algorithems import AnalyseurJeu
+from core.incremental import AnalyseurIncremental
+from core.utils import generer_jeu_aleatoire
+
+import reference
+
+
+@pytest.mark.parametrize("forme", [(3, 3), (2, 3, 2), (3, 2, 2, 2)])
+def test_modifications_successives(forme):
+    rng = np.random.default_rng(0)
+    jeu = generer_jeu_aleatoire(forme, graine=0, haut=3)
+    incremental = AnalyseurIncremental(jeu)
+    for _ in range(30):
+        k = int(rng.integers(jeu.n_joueurs))
+        if rng.random() < 0.5:
+            profil = tuple(int(rng.integers(s)) for s in forme)
+            incremental.modifier_gain(jeu.joueurs[k].id, profil, int(rng.integers(0, 4)))
+        else:
+            axe = int(rng.integers(len(forme)))
+            debut = int(rng.integers(forme[axe]))
+            index = tuple(slice(debut, None) if a == axe else slice(None) for a in range(len(forme)))
+            forme_tranche = tuple(forme[a] - debut if a == axe else forme[a] for a in range(len(forme)))
+            incremental.modifier_tranche(jeu.joueurs[k].id, index, rng.integers(0, 4, size=forme_tranche))
+
+        assert incremental.equilibre_nash() == reference.nash(jeu)
+        assert sorted(incremental.optimum_pareto()) == reference.pareto(jeu)
+        for i, joueur in enumerate(jeu.joueurs):
+            dominantes = incremental.strategies_dominantes(joueur.id)
+            assert dominantes["strict"] == reference.dominantes(jeu, i, False)
+            assert dominantes["weak"] == reference.dominantes(jeu, i, True)
+        assert incremental.elimination_strategies_dominantes() == AnalyseurJeu(jeu).elimination_strategies_dominantes()
+
+
+def test_modification_invalide():
+    incremental = AnalyseurIncremental(generer_jeu_aleatoire((2, 2), graine=0))
+    with pytest.raises(ValueError):
+        incremental.modifier_gain(1, (0,), 1)
+    with pytest.raises(ValueError):
+        incremental.modifier_gain(9, (0, 0), 1)
+    with pytest.raises(ValueError):
+        incremental.modifier_tranche(1, (slice(0, 2, 2), 0), 1)
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from core.algorithems import AnalyseurJeu
+from core.lot import AnalyseurLot
+
+import reference
+from reference import jeux_aleatoires
+
+
+@pytest.mark.parametrize("forme", [(2, 3), (2, 2, 3)])
+def test_lot_identique_jeu_par_jeu(forme):
+    jeux = jeux_aleatoires(forme, 7)
+    resultat = AnalyseurLot.depuis_jeux(jeux, taille_bloc=3).analyser()
+    for b, jeu in enumerate(jeux):
+        assert [tuple(p) for p in np.argwhere(resultat["nash"][b])] == reference.nash(jeu)
+        assert [tuple(p) for p in np.argwhere(resultat["pareto"][b])] == reference.pareto(jeu)
+        valeurs, strategies = resultat["securite"]
+        analyseur = AnalyseurJeu(jeu)
+        for k, joueur in enumerate(jeu.joueurs):
+            valeur, meilleures = reference.securite(jeu, k)
+            assert valeurs[b, k] == valeur and strategies[b, k] in meilleures
+            dominantes = analyseur.strategies_dominantes(joueur.id)
+            assert np.flatnonzero(resultat["dominantes"]["strict"][k][b]).tolist() == dominantes["strict"]
+            assert np.flatnonzero(resultat["dominantes"]["weak"][k][b]).tolist() == dominantes["weak"]
+
+
+def test_lot_invalide():
+    with pytest.raises(ValueError):
+        AnalyseurLot(np.zeros((4, 2, 3)))
+    with pytest.raises(ValueError):
+        AnalyseurLot(np.zeros((4, 2, 2, 2))).analyser(analyses=("inconnue",))
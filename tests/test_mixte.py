@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from core.algorithems import AnalyseurJeu
+from core.mixte import enumeration_supports, lemke_howson
+from core.utils import charger_jeu_classique, generer_jeu_aleatoire
+
+
+def est_equilibre(A, B, x, y, tolerance=1e-7):
+    assert np.all(x >= -tolerance) and np.all(y >= -tolerance)
+    assert x.sum() == pytest.approx(1.0) and y.sum() == pytest.approx(1.0)
+    return x @ A @ y >= (A @ y).max() - tolerance and x @ B @ y >= (x @ B).max() - tolerance
+
+
+def supports_et_lemke(A, B):
+    return enumeration_supports(A, B) + [lemke_howson(A, B)]
+
+
+def test_pile_ou_face():
+    A = np.array([[1.0, -1.0], [-1.0, 1.0]])
+    for x, y in supports_et_lemke(A, -A):
+        np.testing.assert_allclose(x, [0.5, 0.5])
+        np.testing.assert_allclose(y, [0.5, 0.5])
+
+
+def test_bataille_des_sexes():
+    jeu = charger_jeu_classique("bataille_sexes")
+    equilibres = AnalyseurJeu(jeu).equilibres_mixtes("supports")
+    # Deux équilibres purs et un mixte
+    assert len(equilibres) == 3
+    mixte = [(x, y) for x, y in equilibres if np.all(x > 0)]
+    assert len(mixte) == 1
+    np.testing.assert_allclose(mixte[0][0], [0.6, 0.4])
+    np.testing.assert_allclose(mixte[0][1], [0.4, 0.6])
+
+
+@pytest.mark.parametrize("forme", [(2, 3), (4, 4), (5, 3)])
+def test_equilibres_aleatoires(forme):
+    for graine in range(5):
+        jeu = generer_jeu_aleatoire(forme, "covariance", graine=graine)
+        A, B = jeu.tenseur
+        equilibres = enumeration_supports(A, B)
+        assert equilibres
+        for x, y in equilibres:
+            assert est_equilibre(A, B, x, y)
+        for etiquette in range(sum(forme)):
+            assert est_equilibre(A, B, *lemke_howson(A, B, etiquette))
+
+
+def test_methode_inconnue():
+    analyseur = AnalyseurJeu(generer_jeu_aleatoire((2, 2), graine=0))
+    with pytest.raises(ValueError):
+        analyseur.equilibres_mixtes("inconnue")
+    with pytest.raises(ValueError):
+        AnalyseurJeu(generer_jeu_aleatoire((2, 2, 2), graine=0)).equilibres_mixtes()
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from core.modeles import Jeu, Joueur
+from core.utils import generer_jeu_aleatoire
+
+
+def _joueurs(forme):
+    return [Joueur(k + 1, [f"S{s}" for s in range(n)]) for k, n in enumerate(forme)]
+
+
+def test_tenseur_empile_et_vues():
+    joueurs = _joueurs((2, 3))
+    gains = {1: np.arange(6).reshape(2, 3), 2: -np.arange(6).reshape(2, 3)}
+    jeu = Jeu(joueurs, gains)
+    assert jeu.tenseur.shape == (2, 2, 3)
+    assert jeu.tenseur.flags.c_contiguous
+    for k, j in enumerate(joueurs):
+        np.testing.assert_array_equal(jeu.gains[j.id], gains[j.id])
+        assert np.shares_memory(jeu.gains[j.id], jeu.tenseur)
+    jeu.tenseur[1, 0, 0] = 7
+    assert jeu.gains[2][0, 0] == 7
+
+
+def test_type_des_gains():
+    joueurs = _joueurs((2, 2))
+    gains = {1: np.ones((2, 2), dtype=np.int8), 2: np.zeros((2, 2), dtype=np.int16)}
+    assert Jeu(joueurs, gains).tenseur.dtype == np.int16
+    assert Jeu(joueurs, gains, dtype=np.float32).tenseur.dtype == np.float32
+    with pytest.raises(ValueError):
+        Jeu(joueurs, {1: np.full((2, 2), 300), 2: np.zeros((2, 2))}, dtype=np.int8)
+    with pytest.raises(ValueError):
+        Jeu(joueurs, {1: np.full((2, 2), 0.5), 2: np.zeros((2, 2))}, dtype=np.int32)
+
+
+def test_validation_des_gains():
+    joueurs = _joueurs((2, 2))
+    with pytest.raises(ValueError):
+        Jeu(joueurs, {1: np.zeros((2, 2))})
+    with pytest.raises(ValueError):
+        Jeu(joueurs, {1: np.zeros((2, 2)), 2: np.zeros((2, 3))})
+
+
+def test_depuis_tenseur_sans_copie():
+    tenseur = np.arange(2 * 2 * 3, dtype=np.float64).reshape(2, 2, 3)
+    jeu = Jeu.depuis_tenseur(_joueurs((2, 3)), tenseur)
+    assert jeu.tenseur is tenseur
+    assert np.shares_memory(jeu.gains[2], tenseur)
+    with pytest.raises(ValueError):
+        Jeu.depuis_tenseur(_joueurs((3, 2)), tenseur)
+
+
+def test_empreinte_courante():
+    jeu = generer_jeu_aleatoire((2, 2), graine=0)
+    avant = jeu.empreinte_courante()
+    assert jeu.empreinte_courante() == avant
+    jeu.signaler_modification()
+    assert jeu.empreinte_courante() != avant
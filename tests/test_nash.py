@@ -0,0 +1,27 @@
+import pytest
+
+from core.algorithems import AnalyseurJeu
+from core.utils import generer_jeu_aleatoire
+
+import reference
+from reference import FORMES, jeux_aleatoires
+
+
+@pytest.mark.parametrize("forme", FORMES)
+@pytest.mark.parametrize("epsilon", [0.0, 1.0])
+def test_equilibre_nash(forme, epsilon):
+    for jeu in jeux_aleatoires(forme):
+        attendus = reference.nash(jeu, epsilon)
+        analyseur = AnalyseurJeu(jeu)
+        assert analyseur.equilibre_nash(epsilon) == attendus
+        assert analyseur.equilibre_nash(epsilon, taille_bloc=1) == attendus
+        assert list(analyseur.iter_equilibres_nash(epsilon)) == attendus
+        assert analyseur.nombre_equilibres_nash(epsilon) == len(attendus)
+        assert analyseur.existe_equilibre_nash(epsilon) == bool(attendus)
+
+
+def test_equilibre_nash_progression():
+    jeu = generer_jeu_aleatoire((6, 5, 4), graine=3, haut=3)
+    fractions = []
+    assert AnalyseurJeu(jeu).equilibre_nash(progression=fractions.append) == reference.nash(jeu)
+    assert fractions and fractions[-1] == 1.0
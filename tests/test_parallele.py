@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from core.algorithems import AnalyseurJeu
+from core.parallele import tenseur_partage
+from core.stockage import charger_jeu_binaire, sauvegarder_jeu
+from core.utils import generer_jeu_aleatoire
+
+import reference
+
+
+@pytest.mark.parametrize("forme", [(5, 4), (4, 3, 3)])
+def test_recherche_parallele(forme):
+    jeu = generer_jeu_aleatoire(forme, graine=1, haut=3)
+    analyseur = AnalyseurJeu(jeu)
+    assert analyseur.equilibre_nash(n_processus=2) == reference.nash(jeu)
+    assert analyseur.equilibre_nash(1.0, n_processus=2) == reference.nash(jeu, 1.0)
+    assert sorted(analyseur.optimum_pareto(n_processus=2)) == reference.pareto(jeu)
+
+
+def test_recherche_parallele_memmap(tmp_path):
+    chemin = str(tmp_path / "jeu.tjeu")
+    sauvegarder_jeu(generer_jeu_aleatoire((6, 3, 2), graine=4, haut=3), chemin)
+    jeu = charger_jeu_binaire(chemin)
+    assert AnalyseurJeu(jeu).equilibre_nash(n_processus=2) == reference.nash(jeu)
+
+
+def _relire(descripteur):
+    chemin, dtype, forme, offset = descripteur
+    return np.memmap(chemin, dtype=np.dtype(dtype), mode="r", offset=offset, shape=forme)
+
+
+def test_tenseur_partage(tmp_path):
+    donnees = np.arange(3 * 4 * 5, dtype=np.float64).reshape(3, 4, 5)
+    chemin = tmp_path / "gains.bin"
+    chemin.write_bytes(b"x" * 16 + donnees.tobytes())
+    projete = np.memmap(str(chemin), dtype=np.float64, mode="r", offset=16, shape=donnees.shape)
+
+    with tenseur_partage(projete) as descripteur:
+        assert descripteur[0] == str(chemin)
+        np.testing.assert_array_equal(_relire(descripteur), donnees)
+
+    # Vues qui ne commencent pas au début de la projection : copie temporaire
+    for vue in (projete[1:], projete[:, 1:], donnees):
+        with tenseur_partage(vue) as descripteur:
+            assert descripteur[0] != str(chemin)
+            np.testing.assert_array_equal(_relire(descripteur), vue)
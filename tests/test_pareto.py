@@ -0,0 +1,16 @@
+import pytest
+
+from core.algorithems import AnalyseurJeu
+
+import reference
+from reference import FORMES, jeux_aleatoires
+
+
+@pytest.mark.parametrize("forme", FORMES)
+def test_optimum_pareto(forme):
+    for jeu in jeux_aleatoires(forme):
+        attendus = reference.pareto(jeu)
+        analyseur = AnalyseurJeu(jeu)
+        assert sorted(analyseur.optimum_pareto()) == attendus
+        assert sorted(analyseur.optimum_pareto(taille_bloc=2)) == attendus
+        assert sorted(analyseur.iter_optima_pareto()) == attendus
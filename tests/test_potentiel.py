@@ -0,0 +1,64 @@
+from itertools import product
+
+import numpy as np
+import pytest
+
+from core.algorithems import AnalyseurJeu
+from core.modeles import Jeu, Joueur
+from core.utils import generer_jeu_aleatoire
+
+import reference
+
+
+def jeu_congestion(n, ressources, graine, poids=None):
+    """Chaque joueur choisit une ressource ; il paie son coût selon le nombre de joueurs qui la partagent"""
+    rng = np.random.default_rng(graine)
+    couts = rng.integers(0, 5, size=(ressources, n + 1))
+    poids = np.ones(n) if poids is None else np.asarray(poids, dtype=np.float64)
+    joueurs = [Joueur(k + 1, [f"R{r}" for r in range(ressources)]) for k in range(n)]
+    tenseur = np.empty((n,) + (ressources,) * n)
+    for p in product(range(ressources), repeat=n):
+        for k in range(n):
+            tenseur[(k,) + p] = -poids[k] * couts[p[k], p.count(p[k])]
+    return Jeu.depuis_tenseur(joueurs, tenseur)
+
+
+def verifier_potentiel(jeu, resultat):
+    phi, poids = resultat["potentiel"], resultat["poids"]
+    for p in reference.profils(jeu.forme):
+        for k in range(jeu.n_joueurs):
+            for s in range(jeu.forme[k]):
+                q = reference.deviation(p, k, s)
+                assert jeu.tenseur[k][q] - jeu.tenseur[k][p] == pytest.approx(poids[k] * (phi[q] - phi[p]))
+
+
+@pytest.mark.parametrize("n, ressources", [(2, 3), (3, 2), (3, 3), (4, 2)])
+def test_congestion(n, ressources):
+    for graine in range(3):
+        jeu = jeu_congestion(n, ressources, graine)
+        analyseur = AnalyseurJeu(jeu)
+        resultat = analyseur.potentiel()
+        assert resultat["type"] == "exact"
+        verifier_potentiel(jeu, resultat)
+
+        nash = reference.nash(jeu)
+        assert set(analyseur.equilibres_potentiel()) <= set(nash)
+        chemins = analyseur.chemins_amelioration(departs=20, graine=graine)
+        assert chemins["converge"].all()
+        assert all(tuple(p) in nash for p in chemins["profils"].tolist())
+
+
+def test_pondere():
+    poids = [1.0, 2.5, 0.5]
+    jeu = jeu_congestion(3, 3, 0, poids)
+    resultat = AnalyseurJeu(jeu).potentiel()
+    assert resultat["type"] == "pondere"
+    np.testing.assert_allclose(resultat["poids"], poids)
+    verifier_potentiel(jeu, resultat)
+
+
+def test_sans_potentiel():
+    analyseur = AnalyseurJeu(generer_jeu_aleatoire((3, 3), graine=0))
+    assert analyseur.potentiel() is None
+    with pytest.raises(ValueError):
+        analyseur.equilibres_potentiel()
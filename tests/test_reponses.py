@@ -0,0 +1,32 @@
+import pytest
+
+from core.algorithems import AnalyseurJeu
+from core.incremental import AnalyseurIncremental
+from core.utils import generer_jeu_aleatoire
+
+import reference
+from reference import FORMES, jeux_aleatoires
+
+
+@pytest.mark.parametrize("forme", FORMES)
+def test_meilleure_reponse(forme):
+    for jeu in jeux_aleatoires(forme, 3):
+        analyseur = AnalyseurJeu(jeu)
+        for k, joueur in enumerate(jeu.joueurs):
+            for p in reference.profils(jeu.forme):
+                autres = p[:k] + p[k + 1:]
+                assert analyseur.meilleure_reponse(joueur.id, autres) == reference.meilleures_reponses(jeu, k, p)
+
+
+def test_meilleure_reponse_apres_modification():
+    jeu = generer_jeu_aleatoire((3, 3), graine=1, haut=3)
+    analyseur = AnalyseurJeu(jeu)
+    avant = analyseur.meilleure_reponse(1, (0,))
+    perdante = next(s for s in range(3) if s not in avant)
+    AnalyseurIncremental(jeu).modifier_gain(1, (perdante, 0), 100)
+    assert analyseur.meilleure_reponse(1, (0,)) == [perdante]
+
+    # Écriture directe dans le tenseur, signalée au jeu
+    jeu.tenseur[0][perdante, 0] = -100
+    jeu.signaler_modification()
+    assert analyseur.meilleure_reponse(1, (0,)) == reference.meilleures_reponses(jeu, 0, (0, 0))
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from core.algorithems import AnalyseurJeu
+from core.utils import generer_jeu_aleatoire
+
+import reference
+from reference import FORMES, jeux_aleatoires
+
+
+@pytest.mark.parametrize("forme", FORMES)
+def test_niveau_securite(forme):
+    for jeu in jeux_aleatoires(forme):
+        analyseur = AnalyseurJeu(jeu)
+        for k, joueur in enumerate(jeu.joueurs):
+            valeur, strategies = reference.securite(jeu, k)
+            obtenue, strategie = analyseur.niveau_securite(joueur.id)
+            assert obtenue == valeur
+            assert strategie in strategies
+
+
+def test_niveaux_securite_mixtes():
+    pytest.importorskip("scipy")
+    # Pile ou face : 0 garanti en mélangeant à parts égales, -1 en pur
+    pile_face = generer_jeu_aleatoire((2, 2), "somme_nulle", graine=0)
+    pile_face.tenseur[0] = [[1, -1], [-1, 1]]
+    pile_face.tenseur[1] = -pile_face.tenseur[0]
+    resultat = AnalyseurJeu(pile_face).niveaux_securite_mixtes()
+    np.testing.assert_allclose(resultat["valeurs"], [0.0, 0.0], atol=1e-9)
+    for x in resultat["strategies"]:
+        np.testing.assert_allclose(x, [0.5, 0.5], atol=1e-9)
+
+    for jeu in jeux_aleatoires((3, 2, 2)):
+        resultat = AnalyseurJeu(jeu).niveaux_securite_mixtes()
+        for k in range(jeu.n_joueurs):
+            assert resultat["valeurs"][k] >= reference.securite(jeu, k)[0] - 1e-9
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from core.algorithems import AnalyseurJeu
+from core.modeles import Jeu
+from core.stockage import charger_jeu_binaire, lire_entete, sauvegarder_jeu
+from core.utils import generer_jeu_aleatoire
+
+import reference
+
+
+@pytest.mark.parametrize("dtype", [np.int16, np.float64])
+def test_aller_retour(tmp_path, dtype):
+    aleatoire = generer_jeu_aleatoire((3, 2, 4), graine=0)
+    jeu = Jeu.depuis_tenseur(aleatoire.joueurs, aleatoire.tenseur.astype(dtype))
+    chemin = str(tmp_path / "jeu.tjeu")
+    sauvegarder_jeu(jeu, chemin)
+    assert lire_entete(chemin)["offset"] % 64 == 0
+
+    charge = charger_jeu_binaire(chemin)
+    assert isinstance(charge.tenseur, np.memmap)
+    assert charge.tenseur.dtype == dtype
+    np.testing.assert_array_equal(charge.tenseur, jeu.tenseur)
+    assert [(j.id, j.strategies) for j in charge.joueurs] == [(j.id, j.strategies) for j in jeu.joueurs]
+    assert AnalyseurJeu(charge).equilibre_nash() == reference.nash(charge)
+
+
+def test_fichier_invalide(tmp_path):
+    chemin = tmp_path / "faux.tjeu"
+    chemin.write_bytes(b"PASUNJEU" * 4)
+    with pytest.raises(ValueError):
+        lire_entete(str(chemin))
+
+
+def test_modification_en_place(tmp_path):
+    chemin = str(tmp_path / "jeu.tjeu")
+    sauvegarder_jeu(generer_jeu_aleatoire((3, 3), graine=2, haut=3), chemin)
+    jeu = charger_jeu_binaire(chemin, mode="r+")
+    analyseur = AnalyseurJeu(jeu)
+    analyseur.meilleure_reponse(1, (0,))
+    jeu.tenseur[0][2, 0] = 50
+    jeu.tenseur.flush()
+    jeu.signaler_modification()
+    assert analyseur.meilleure_reponse(1, (0,)) == [2]
+    assert charger_jeu_binaire(chemin).tenseur[0][2, 0] == 50
@@ -0,0 +1,43 @@
+from itertools import product
+
+import numpy as np
+import pytest
+
+from core.algorithems import AnalyseurJeu
+from core.modeles import Jeu, Joueur
+from core.symetrie import AnalyseurAnonyme, compresser
+from core.utils import generer_jeu_aleatoire
+
+
+def jeu_comptes(n, s, poids):
+    """Gain du joueur k : poids[k] * (valeur de sa stratégie - nombre d'autres joueurs sur la même)"""
+    joueurs = [Joueur(k + 1, [f"R{a}" for a in range(s)]) for k in range(n)]
+    tenseur = np.empty((n,) + (s,) * n)
+    for p in product(range(s), repeat=n):
+        for k in range(n):
+            tenseur[(k,) + p] = poids[k] * (2 * p[k] - (p.count(p[k]) - 1))
+    return Jeu.depuis_tenseur(joueurs, tenseur)
+
+
+def test_detection():
+    assert jeu_comptes(3, 2, [1, 1, 1]).detecter_symetrie() == "symetrique"
+    assert jeu_comptes(3, 2, [1, 2, 3]).detecter_symetrie() == "anonyme"
+    assert generer_jeu_aleatoire((2, 2, 2), graine=0).detecter_symetrie() is None
+    with pytest.raises(ValueError):
+        compresser(generer_jeu_aleatoire((2, 2, 2), graine=0))
+
+
+@pytest.mark.parametrize("n, s, poids", [(3, 2, [1, 1, 1]), (4, 3, [1, 1, 1, 1]), (3, 3, [1, 2, 3])])
+def test_compression(n, s, poids):
+    jeu = jeu_comptes(n, s, poids)
+    compresse = compresser(jeu)
+    np.testing.assert_array_equal(compresse.vers_jeu().tenseur, jeu.tenseur)
+
+    nash = AnalyseurJeu(jeu).equilibre_nash()
+    classes = AnalyseurAnonyme(compresse).equilibres_nash()
+    # Une classe par vecteur de comptes d'équilibre, avec un profil d'équilibre qui la réalise
+    attendues = {tuple(np.bincount(p, minlength=s).tolist()) for p in nash}
+    assert {comptes for comptes, _ in classes} == attendues
+    assert all(profil in nash for _, profil in classes)
+    for k, joueur in enumerate(jeu.joueurs):
+        assert AnalyseurAnonyme(compresse).niveau_securite(joueur.id)[0] == AnalyseurJeu(jeu).niveau_securite(joueur.id)[0]